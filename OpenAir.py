@@ -14,27 +14,41 @@ import inspect
 import tkinter as tk
 import importlib   
 
+# --- Startup timeline (before anything heavy is imported) ---
+from workers.setup import startup_tracer
+if startup_tracer.profiling_requested(sys.argv):
+    startup_tracer.start_profiling()
+
 # --- Custom Module Imports (Config MUST be read first) ---
-from workers.setup.config_reader import Config # Import the Config class
-app_constants = Config.get_instance() # Get the singleton instance and ensure config is read
+with startup_tracer.span("Config"):
+    from workers.setup.config_reader import Config # Import the Config class
+    app_constants = Config.get_instance() # Get the singleton instance and ensure config is read
 
 # --- Core Application Imports ---
-from managers.dependancy import dependancy_checker
-dependancy_checker.initialize_flags(app_constants) # Call early to set flags
+with startup_tracer.span("dependancy_checker import"):
+    from managers.dependancy import dependancy_checker
+    dependancy_checker.initialize_flags(app_constants) # Call early to set flags
+
+# --- Headless service mode: skip Tk, the splash and every GUI import ---
+if __name__ == "__main__":
+    from workers.setup import headless_service
+    if headless_service.headless_requested(sys.argv):
+        sys.exit(headless_service.run_headless())
 
 # Other essential modules
-from workers.splash_screen.splash_screen import SplashScreen
-from workers.Worker_Launcher import WorkerLauncher
-import display.gui_display
-from workers.logger.logger import  debug_logger
-
-import workers.setup.path_initializer as path_initializer
-import workers.logger.logger_config as logger_config
-import workers.setup.console_encoder as console_encoder
-import workers.setup.debug_cleaner as debug_cleaner
-from workers.setup.application_initializer import initialize_app
-from workers.logger.log_utils import _get_log_args
-from managers.manager_launcher import launch_managers
+with startup_tracer.span("module imports"):
+    from workers.splash_screen.splash_screen import SplashScreen
+    from workers.Worker_Launcher import WorkerLauncher
+    import display.gui_display
+    from workers.logger.logger import  debug_logger
+
+    import workers.setup.path_initializer as path_initializer
+    import workers.logger.logger_config as logger_config
+    import workers.setup.console_encoder as console_encoder
+    import workers.setup.debug_cleaner as debug_cleaner
+    from workers.setup.application_initializer import initialize_app
+    from workers.logger.log_utils import _get_log_args
+    from managers.manager_launcher import launch_managers
 
 current_version = "20251226.000000.1"
 
@@ -46,6 +60,7 @@ def _reveal_main_window(root, splash):
     root.deiconify() # Ensure main window is visible
     debug_logger(message="DEBUG: Calling splash.hide().", **_get_log_args())
     splash.hide()    # Dismiss the splash screen
+    startup_tracer.finish_startup()
     debug_logger(message="DEBUG: _reveal_main_window completed.", **_get_log_args())
 
 def _reveal_main_window(root, splash):
@@ -56,19 +71,26 @@ def _reveal_main_window(root, splash):
     root.deiconify() # Ensure main window is visible
     debug_logger(message="DEBUG: Calling splash.hide().", **_get_log_args())
     splash.hide()    # Dismiss the splash screen
+    startup_tracer.finish_startup()
     debug_logger(message="DEBUG: _reveal_main_window completed.", **_get_log_args())
 
 def _initialize_application(root, splash):
     debug_logger(message="DEBUG: Entering _initialize_application (background thread).", **_get_log_args())
+    with startup_tracer.profile_thread():
+        _initialize_application_steps(root, splash)
+
+def _initialize_application_steps(root, splash):
     try:
-        # MQTT Connection Manager
-        from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
-        mqtt_connection_manager = MqttConnectionManager()
-        # State Cache Manager
-        from workers.State_Cache.state_cache_manager import StateCacheManager
-        state_cache_manager = StateCacheManager(mqtt_connection_manager) # Pass mqtt_connection_manager     
+        with startup_tracer.span("MQTT connection & state cache"):
+            # MQTT Connection Manager
+            from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
+            mqtt_connection_manager = MqttConnectionManager()
+            # State Cache Manager
+            from workers.State_Cache.state_cache_manager import StateCacheManager
+            state_cache_manager = StateCacheManager(mqtt_connection_manager) # Pass mqtt_connection_manager     
         # Launch managers
-        managers = launch_managers(app=None, splash=splash, root=root, state_cache_manager=state_cache_manager, mqtt_connection_manager=mqtt_connection_manager) # Pass mqtt_connection_manager
+        with startup_tracer.span("launch_managers"):
+            managers = launch_managers(app=None, splash=splash, root=root, state_cache_manager=state_cache_manager, mqtt_connection_manager=mqtt_connection_manager) # Pass mqtt_connection_manager
         if managers is None:
             debug_logger(message="❌ Manager launch failed. Exiting application.", **_get_log_args())
             # Since we are in a thread, cannot sys.exit directly, must schedule main thread shutdown
@@ -83,6 +105,11 @@ def _initialize_application(root, splash):
                                   state_cache_manager=state_cache_manager)
         def on_closing():
             """Gracefully shuts down the application."""
+            # Stop the VISA fleet first (as the headless service does), while MQTT is still up.
+            try:
+                managers["visa_fleet_manager"].stop()
+            except Exception as e:
+                debug_logger(message=f"❌ Error stopping the VISA fleet: {e}", **_get_log_args())
             if app:
                 app.shutdown()
             root.destroy()
@@ -111,17 +138,19 @@ def action_open_display(root, splash, mqtt_connection_manager, subscriber_router
         debug_logger(message=f"⚙️ Preparing to instantiate Application with: mqtt_connection_manager={mqtt_connection_manager}, subscriber_router={subscriber_router}, state_mirror_engine={state_cache_manager.state_mirror_engine}", **_get_log_args())
         # This is the primary long-running GUI task.
         # We pass the root window to the Application so it can call update() internally.
-        app = Application(parent=root, root=root,
-                          mqtt_connection_manager=mqtt_connection_manager,
-                          subscriber_router=subscriber_router,
-                          state_mirror_engine=state_cache_manager.state_mirror_engine)
-        app.pack(fill=tk.BOTH, expand=True)
-        root.update()        
-        worker_launcher = WorkerLauncher(
-            splash_screen=splash,
-            console_print_func=app.print_to_console,
-        )
-        worker_launcher.launch_all_workers()
+        with startup_tracer.span("Application"):
+            app = Application(parent=root, root=root,
+                              mqtt_connection_manager=mqtt_connection_manager,
+                              subscriber_router=subscriber_router,
+                              state_mirror_engine=state_cache_manager.state_mirror_engine)
+            app.pack(fill=tk.BOTH, expand=True)
+            root.update()        
+        with startup_tracer.span("WorkerLauncher"):
+            worker_launcher = WorkerLauncher(
+                splash_screen=splash,
+                console_print_func=app.print_to_console,
+            )
+            worker_launcher.launch_all_workers()
         root.update()
         debug_logger(message="DEBUG: Calling _reveal_main_window.", **_get_log_args())
         _reveal_main_window(root, splash)
@@ -149,30 +178,37 @@ def main():
     import pathlib
     import workers.watchdog.watchdog as watchdog # Import watchdog
 
-    GLOBAL_PROJECT_ROOT, data_dir = initialize_paths()
-    log_dir = pathlib.Path(data_dir) / "debug"
-    # clear_debug_directory(data_dir)
-    set_log_directory(log_dir)
-    configure_console_encoding()
+    with startup_tracer.span("paths & logging"):
+        GLOBAL_PROJECT_ROOT, data_dir = initialize_paths()
+        log_dir = pathlib.Path(data_dir) / "debug"
+        # clear_debug_directory(data_dir)
+        set_log_directory(log_dir)
+        configure_console_encoding()
     # START THE WATCHDOG
     watchdog.start_heartbeat(debug_logger, app_constants)    
     # Now that the logger is safe, we can proceed with the rest of the setup.
-    if not initialize_app():
+    with startup_tracer.span("initialize_app"):
+        initialized = initialize_app()
+    if not initialized:
         debug_logger(message="❌ Critical initialization failed. Application will now exit.", **_get_log_args())
         sys.exit(1)
     # Perform dependency check after initial setup
     def conditional_console_print(message):
         if app_constants.global_settings["debug_enabled"]:
             debug_logger(message=message, **_get_log_args())
-    dependancy_checker.run_interactive_pre_check(conditional_console_print, debug_logger, app_constants)
+    with startup_tracer.span("dependancy pre-check"):
+        dependancy_checker.run_interactive_pre_check(conditional_console_print, debug_logger, app_constants)
     # --- GUI setup starts here, after core initialization is complete ---
+    startup_tracer.mark("Tk root")
     root = tk.Tk()
     root.configure(bg="#2b2b2b")
     root.title("OPEN-AIR 2")
     root.geometry("1600x1200")
     root.withdraw() # Hide the main window initially
+    watchdog.attach_tk_probe(root) # Measure main-loop lag and catch stalls from here on
     # Instantiate the splash screen
-    splash = SplashScreen(root, app_constants.CURRENT_VERSION, app_constants.global_settings['debug_enabled'], debug_logger, debug_logger)
+    with startup_tracer.span("splash"):
+        splash = SplashScreen(root, app_constants.CURRENT_VERSION, app_constants.global_settings['debug_enabled'], debug_logger, debug_logger)
     root.splash_window = splash.splash_window # Strong reference
     # Create and start a new thread for application initialization
     app_init_thread = threading.Thread(target=_initialize_application, args=(root, splash))
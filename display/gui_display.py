@@ -30,6 +30,7 @@ import traceback
 from workers.display.window_manager import WindowManager
 from workers.display.module_loader import ModuleLoader
 from workers.display.layout_parser import LayoutParser
+from workers.display.layout_manifest_cache import LayoutManifestCache
 
 # Import logger and styling utilities
 # RESTORED: usage of _get_log_args to match the rest of the application protocol
@@ -42,6 +43,9 @@ from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
 from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
 from workers.logic.state_mirror_engine import StateMirrorEngine
 
+# Gap between two background tab builds, so user input is still serviced in between.
+PREWARM_INTERVAL_MS = 250
+
 class Application(ttk.Frame):
     """
     The main application class that orchestrates the GUI build process.
@@ -55,6 +59,7 @@ class Application(ttk.Frame):
         # ⚡ OPTIMIZATION: Initialize Cache for Directory Layouts
         # This prevents re-scanning the disk every time a tab is accessed.
         self._layout_cache = {}
+        self.layout_manifest = LayoutManifestCache.get_instance()
 
         if app_constants.global_settings['debug_enabled']:
             debug_logger(
@@ -91,6 +96,7 @@ class Application(ttk.Frame):
         self._notebooks = {}
         self._frames_by_path = {}
         self.last_selected_tab_name = None
+        self._prewarm_after_id = None
 
         try:
             if app_constants.global_settings['debug_enabled']:
@@ -99,6 +105,9 @@ class Application(ttk.Frame):
                     **_get_log_args()
                 )
             
+            # One walk of the display tree validates (or invalidates) the persistent layout manifest
+            self.layout_manifest.scan_display_tree(pathlib.Path(__file__).parent)
+
             # Start the GUI build process
             self._build_from_directory(path=pathlib.Path(__file__).parent, parent_widget=self)
             
@@ -163,6 +172,109 @@ class Application(ttk.Frame):
                 **_get_log_args()
             )
 
+        if app_constants.UI_PREWARM_TABS:
+            self._schedule_prewarm()
+
+    def _populate_tab(self, tab_frame, tab_name):
+        """Builds a placeholder tab's contents the first time it is needed. Safe to call repeatedly."""
+        if getattr(tab_frame, "is_populated", True):
+            return
+
+        build_path = getattr(tab_frame, "build_path", None)
+        if not build_path:
+            return
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"⚡ Lazy Loading engaged for tab: {tab_name}",
+                **_get_log_args()
+            )
+
+        # Mark first so a tab change fired from inside the build cannot start it twice.
+        tab_frame.is_populated = True
+
+        # Content goes into a plain tk.Frame host so WindowManager can tear it off with
+        # 'wm manage' and put it back later without rebuilding anything.
+        content_host = tk.Frame(tab_frame, background=self.theme_colors["bg"])
+        content_host.pack(fill=tk.BOTH, expand=True)
+        tab_frame.content_host = content_host
+        if not self._build_from_directory(path=build_path, parent_widget=content_host):
+            # Leave the tab unbuilt so selecting it again retries; the pre-warmer skips it from now on.
+            content_host.destroy()
+            del tab_frame.content_host
+            tab_frame.is_populated = False
+            tab_frame.build_failed = True
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(
+                    message=f"❌ Lazy Loading failed for tab: {tab_name}. Selecting it again retries.",
+                    **_get_log_args()
+                )
+            return
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"✅ Lazy Loading complete for tab: {tab_name}",
+                **_get_log_args()
+            )
+
+    def _get_prewarm_queue(self):
+        """
+        Returns the unbuilt tabs in priority order: shallow notebooks first, then the
+        tabs closest to each notebook's current selection.
+        """
+        candidates = []
+        for notebook_path, notebook in self._notebooks.items():
+            try:
+                if not notebook.winfo_exists():
+                    continue
+                tab_ids = list(notebook.tabs())
+                selected = notebook.select()
+            except tk.TclError:
+                continue
+
+            selected_index = tab_ids.index(selected) if selected in tab_ids else 0
+            for index, tab_id in enumerate(tab_ids):
+                tab_frame = notebook.nametowidget(tab_id)
+                if not getattr(tab_frame, "is_populated", True) and not getattr(tab_frame, "build_failed", False):
+                    priority = (len(notebook_path.parts), abs(index - selected_index), index)
+                    candidates.append((priority, tab_frame, notebook.tab(tab_id, "text")))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [(tab_frame, tab_name) for _, tab_frame, tab_name in candidates]
+
+    def _schedule_prewarm(self):
+        if self._prewarm_after_id is None:
+            self._prewarm_after_id = self.after(PREWARM_INTERVAL_MS, lambda: self.after_idle(self._prewarm_next))
+
+    def _prewarm_next(self):
+        """Builds one pending tab while the GUI is idle, then yields back to the event loop."""
+        self._prewarm_after_id = None
+        try:
+            # Re-ranked every step: tabs built so far may have added new notebooks.
+            queue = self._get_prewarm_queue()
+            if not queue:
+                if app_constants.global_settings['debug_enabled']:
+                    debug_logger(
+                        message="✅ Tab pre-warmer finished: every tab is built.",
+                        **_get_log_args()
+                    )
+                return
+
+            tab_frame, tab_name = queue[0]
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(
+                    message=f"🔥 Pre-warming tab '{tab_name}' ({len(queue) - 1} remaining).",
+                    **_get_log_args()
+                )
+            self._populate_tab(tab_frame, tab_name)
+        except Exception as e:
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(
+                    message=f"❌ Error while pre-warming tabs: {e}",
+                    **_get_log_args()
+                )
+        self._schedule_prewarm()
+
     def _apply_styles(self, theme_name: str):
         """Applies the specified theme to the entire application."""
         if app_constants.global_settings['debug_enabled']:
@@ -237,21 +349,27 @@ class Application(ttk.Frame):
 
     def _get_layout_info(self, path: pathlib.Path):
         """
-        ⚡ OPTIMIZATION HELPER: Checks cache before parsing directory.
+        ⚡ OPTIMIZATION HELPER: Checks the RAM cache, then the persistent manifest, before parsing directory.
         """
         path_str = str(path)
         # 1. Check RAM Cache
         if path_str in self._layout_cache:
             return self._layout_cache[path_str]
 
-        # 2. Miss: Parse and Store
-        layout_info = self.layout_parser.parse_directory(path)
+        # 2. Check the persistent manifest from the previous launch
+        layout_info = self.layout_manifest.get_layout(path)
+        if layout_info is None:
+            # 3. Miss: Parse and Store
+            layout_info = self.layout_parser.parse_directory(path)
+            self.layout_manifest.store_layout(path, layout_info)
+
         self._layout_cache[path_str] = layout_info
         return layout_info
 
     def _build_from_directory(self, path: pathlib.Path, parent_widget):
         """
         Recursively builds the GUI using Cached Layouts.
+        Returns False if the layout (or any sub-layout) could not be built, True otherwise.
         """
         # ⚡ OPTIMIZATION: Guarded Log Call
         if app_constants.global_settings['debug_enabled']:
@@ -271,8 +389,9 @@ class Application(ttk.Frame):
                     message=f"❌🔴 Layout parsing failed for {path}: {layout_data.get('error_message')}",
                     **_get_log_args()
                 )
-            return
+            return False
 
+        built = True
         try:
             if layout_type == 'horizontal_split' or layout_type == 'vertical_split':
                 orientation = layout_data['orientation']
@@ -301,7 +420,7 @@ class Application(ttk.Frame):
                     new_frame = ttk.Frame(paned_window, borderwidth=self.theme_colors["border_width"], relief=self.theme_colors["relief"])
                     paned_window.add(new_frame, weight=weight)
                     
-                    self._build_from_directory(path=sub_dir_path, parent_widget=new_frame)
+                    built = self._build_from_directory(path=sub_dir_path, parent_widget=new_frame) and built
 
                 def configure_sash(event):
                     total_percentage = sum(percentages)
@@ -385,7 +504,7 @@ class Application(ttk.Frame):
                     if not (dir_prefix in ['left', 'right', 'top', 'bottom'] or 
                             dir_prefix.isdigit() or 
                             sub_dir.name.startswith("child_")):
-                        self._build_from_directory(path=sub_dir, parent_widget=parent_widget)
+                        built = self._build_from_directory(path=sub_dir, parent_widget=parent_widget) and built
 
                 py_files = sorted([f for f in path.iterdir() if f.is_file() and f.name.startswith("gui_") and f.suffix == '.py'])
                 for py_file in py_files:
@@ -417,6 +536,8 @@ class Application(ttk.Frame):
                     message=f"❌🔴 Catastrophic structural failure in '_build_from_directory' for {path}: {e}",
                     **_get_log_args()
                 )
+            return False
+        return built
 
 
     def print_to_console(self, message: str):
@@ -452,29 +573,14 @@ class Application(ttk.Frame):
             newly_selected_tab_name = notebook.tab(selected_tab_id, "text")
 
             # --- LAZY LOADING ---
-            if not getattr(selected_tab_frame, "is_populated", False):
-                build_path = getattr(selected_tab_frame, "build_path", None)
-                if build_path:
-                    if app_constants.global_settings['debug_enabled']:
-                        debug_logger(
-                            message=f"⚡ Lazy Loading engaged for tab: {newly_selected_tab_name}",
-                            **_get_log_args()
-                        )
-                    
-                    self._build_from_directory(path=build_path, parent_widget=selected_tab_frame)
-                    
-                    selected_tab_frame.is_populated = True
-                    if app_constants.global_settings['debug_enabled']:
-                        debug_logger(
-                            message=f"✅ Lazy Loading complete for tab: {newly_selected_tab_name}",
-                            **_get_log_args()
-                        )
+            self._populate_tab(selected_tab_frame, newly_selected_tab_name)
 
             # --- Standard Tab Change Logic ---
             self.last_selected_tab_name = newly_selected_tab_name
             
-            if selected_tab_frame.winfo_children():
-                content_widget = selected_tab_frame.winfo_children()[0]
+            content_root = getattr(selected_tab_frame, "content_host", selected_tab_frame)
+            if content_root.winfo_children():
+                content_widget = content_root.winfo_children()[0]
                 if hasattr(content_widget, '_on_tab_selected') and callable(getattr(content_widget, '_on_tab_selected')):
                     if app_constants.global_settings['debug_enabled']:
                         debug_logger(
@@ -15,7 +15,7 @@ project_root = current_file_path.parents[5]
 current_file = str(current_file_path.relative_to(project_root)).replace("\\", "/")
 Current_Date = 20251226
 Current_Time = 120000
-Current_iteration = 44
+Current_iteration = 46
 
 
 
@@ -38,7 +38,7 @@ from workers.importers.worker_marker_file_import_handling import maker_file_chec
 # FIXED: Importing tuning functions from the correct location.
 # from workers.active.worker_active_marker_tune_and_collect import Push_Marker_to_Center_Freq, Push_Marker_to_Start_Stop_Freq
 # NEW: Import the refactored logic function
-from workers.markers.worker_marker_logic import calculate_frequency_range
+from workers.markers.marker_store import MarkerStore
 from workers.styling.style import THEMES, DEFAULT_THEME
 from workers.Showtime.worker_showtime_read import load_marker_data
 from workers.Showtime.worker_showtime_group import process_and_sort_markers
@@ -91,6 +91,7 @@ class ShowtimeTab(ttk.Frame):
         self.selected_zone = None
         self.selected_group = None
         self.selected_device_button = None # Track the currently selected button widget
+        self.device_button_pool = [] # Device buttons are reused across filter changes, never destroyed
         
         self._apply_styles(theme_name=DEFAULT_THEME)
         self._create_widgets()
@@ -254,9 +255,7 @@ class ShowtimeTab(ttk.Frame):
             for i, group_name in enumerate(sorted_groups):
                 is_selected = self.selected_group == group_name
 
-                group_devices = self.grouped_markers[self.selected_zone][group_name]
-                # UPDATED: Use the imported utility function
-                min_freq, max_freq = calculate_frequency_range(group_devices)
+                min_freq, max_freq = MarkerStore.get_instance().frequency_span(zone=self.selected_zone, group=group_name)
                 
                 freq_range_text = ""
                 if min_freq is not None and max_freq is not None:
@@ -294,9 +293,6 @@ class ShowtimeTab(ttk.Frame):
             self.selected_device_button.config(style='Custom.TButton')
         self.selected_device_button = None
 
-        for widget in self.device_frame.winfo_children():
-            widget.destroy()
-        
         filtered_devices = []
         if self.selected_zone and self.selected_group:
             filtered_devices = self.grouped_markers[self.selected_zone][self.selected_group]
@@ -328,23 +324,38 @@ class ShowtimeTab(ttk.Frame):
                            f"{row_data.get('FREQ_MHZ', 'N/A')} MHz\\n"
                            f"[********************]"
                           )
-            
-            button = ttk.Button(
-                self.device_frame,
-                text=button_text,
-                style='Custom.TButton'
-            )
+
+            if i < len(self.device_button_pool):
+                button = self.device_button_pool[i]
+            else:
+                button = ttk.Button(self.device_frame, style='Custom.TButton')
+                button.configure(command=lambda b=button: self._on_marker_button_click(b))
+                button.pool_text = None
+                button.pool_visible = False
+                self.device_button_pool.append(button)
+
             # Store data directly on the button object
             button.marker_data = row_data
-            button.configure(command=lambda b=button: self._on_marker_button_click(b))
-            
-            row = i // 4
-            col = i % 4
-            button.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+            if button.pool_text != button_text:
+                button.configure(text=button_text)
+                button.pool_text = button_text
+
+            if not button.pool_visible:
+                # A pooled button always sits in the same cell, so grid remembers its position
+                row = i // 4
+                col = i % 4
+                button.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+                button.pool_visible = True
+
+        for button in self.device_button_pool[len(filtered_devices):]:
+            if button.pool_visible:
+                button.grid_remove()
+                button.pool_visible = False
+            button.marker_data = None
 
         if app_constants.global_settings['debug_enabled']:
             debug_logger(
-                message=f"✅ Created {len(filtered_devices)} device buttons.",
+                message=f"✅ Showing {len(filtered_devices)} device buttons ({len(self.device_button_pool)} pooled).",
                 **_get_log_args()
             )
 
@@ -260,7 +260,12 @@ class MarkerImporterTab(ttk.Frame):
             self.marker_tree.heading(col, text=col, command=lambda c=col: on_tree_header_click(self, None))
             self.marker_tree.column(col, width=100)
 
-        for row in self.tree_data:
+        self._append_rows_to_treeview(self.tree_data)
+
+    def _append_rows_to_treeview(self, rows):
+        # Appends rows below the current contents; used directly when an import streams in page by page.
+        standardized_headers = self.tree_headers if self.tree_headers else ["ZONE", "GROUP", "DEVICE", "NAME", "FREQ_MHZ", "PEAK"]
+        for row in rows:
             if isinstance(row, list):
                 # Convert list to dictionary using headers
                 row_dict = dict(zip(standardized_headers, row))
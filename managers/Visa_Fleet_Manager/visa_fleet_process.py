@@ -0,0 +1,198 @@
+# managers/Visa_Fleet_Manager/visa_fleet_process.py
+#
+# Runs the VISA fleet (VisaFleetManager / VisaFleetSupervisor) and the YAK
+# translation layer (YakTranslator / YakRxManager) in a dedicated child process,
+# so VISA I/O, IDN probing, subnet scans and response parsing never hold the GIL
+# the Tk main thread and the paho network thread need.
+#
+# The child only talks to the rest of the application over MQTT, exactly as the
+# in-process managers already do (YAK triggers -> Proxy Tx_Inbox -> fleet ->
+# Proxy Rx_Outbox -> YAK outputs). The parent keeps a VisaFleetProcessSupervisor
+# that restarts the child with back-off if it dies, and stops it on shutdown.
+# The child also exits on its own when the parent goes away (its stdin closes).
+#
+# Enabled with [Mode] VISA_FLEET_PROCESS = True in config.ini.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.2200.1
+
+import os
+import sys
+import time
+import signal
+import threading
+import subprocess
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.setup.worker_project_paths import GLOBAL_PROJECT_ROOT, DEBUG_DIR
+
+current_version = "20251230.2200.1"
+current_version_hash = (20251230 * 2200 * 1)
+
+CHILD_MODULE = "managers.Visa_Fleet_Manager.visa_fleet_process"
+SCAN_REQUEST_TOPIC = "OPEN-AIR/System/Fleet/Scan_Request"
+PROCESS_STATUS_TOPIC = "OPEN-AIR/System/Status/FleetProcess"
+# Seconds to wait before each successive restart; the last value repeats.
+RESTART_BACKOFF_S = (1, 2, 5, 10, 30)
+# A child that stayed up this long is considered healthy; the back-off starts over.
+HEALTHY_UPTIME_S = 60
+MONITOR_INTERVAL_S = 0.5
+STOP_TIMEOUT_S = 5
+
+
+class VisaFleetProcessSupervisor:
+    """Parent-side handle on the fleet child process: start, restart-on-crash, stop."""
+
+    def __init__(self):
+        self.process = None
+        self.restarts = 0
+        self._started_at = None
+        self._stopping = threading.Event()
+        self._monitor_thread = None
+
+    def start(self):
+        self._stopping.clear()
+        self._spawn()
+        self._monitor_thread = threading.Thread(target=self._monitor_loop, name="VisaFleetProcessMonitor", daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self):
+        """Asks the child to exit, then terminates it if it does not within STOP_TIMEOUT_S."""
+        self._stopping.set()
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close() # The child treats EOF on stdin as a stop request
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=STOP_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            process.terminate()
+            try:
+                process.wait(timeout=STOP_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._publish_status("stopped")
+        debug_logger(message="💳 VISA fleet process stopped.", **_get_log_args())
+
+    def trigger_scan(self):
+        """Asks the child to rescan the fleet."""
+        from workers.mqtt import mqtt_publisher_service
+        mqtt_publisher_service.publish_payload(SCAN_REQUEST_TOPIC, orjson.dumps({"ts": time.time()}), retain=False)
+
+    def _spawn(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", CHILD_MODULE],
+            cwd=str(GLOBAL_PROJECT_ROOT),
+            stdin=subprocess.PIPE,
+        )
+        self._started_at = time.monotonic()
+        debug_logger(message=f"💳 VISA fleet process started (pid {self.process.pid}).", **_get_log_args())
+        self._publish_status("running")
+
+    def _monitor_loop(self):
+        while not self._stopping.wait(MONITOR_INTERVAL_S):
+            exit_code = self.process.poll()
+            if exit_code is None:
+                continue
+
+            uptime = time.monotonic() - self._started_at
+            if uptime >= HEALTHY_UPTIME_S:
+                self.restarts = 0
+            delay = RESTART_BACKOFF_S[min(self.restarts, len(RESTART_BACKOFF_S) - 1)]
+            debug_logger(
+                message=f"❌ VISA fleet process exited with code {exit_code} after {uptime:.0f} s. Restarting in {delay} s.",
+                **_get_log_args()
+            )
+            self._publish_status("crashed", exit_code=exit_code)
+            if self._stopping.wait(delay):
+                return
+            self.restarts += 1
+            self._spawn()
+
+    def _publish_status(self, state, exit_code=None):
+        try:
+            from workers.mqtt import mqtt_publisher_service
+            payload = {
+                "state": state,
+                "pid": self.process.pid if self.process else None,
+                "restarts": self.restarts,
+                "exit_code": exit_code,
+                "ts": time.time(),
+            }
+            mqtt_publisher_service.publish_payload(PROCESS_STATUS_TOPIC, orjson.dumps(payload), retain=False)
+        except Exception as e:
+            debug_logger(message=f"❌ Could not publish the fleet process status: {e}", **_get_log_args())
+
+
+def run_fleet_worker():
+    """Child process entry point. Blocks until stdin closes or a stop signal arrives."""
+    from workers.logger.logger import set_log_directory
+    from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
+    from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+    from managers.Visa_Fleet_Manager.visa_fleet_manager import VisaFleetManager
+    from managers.yak.yak_translator import YakTranslator
+    from managers.yak.manager_yak_rx import YakRxManager
+
+    set_log_directory(DEBUG_DIR)
+    stop = threading.Event()
+
+    def request_stop(signum=None, frame=None):
+        stop.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    def watch_parent():
+        # The parent holds our stdin open; EOF means it stopped us or went away.
+        try:
+            while sys.stdin.buffer.read(1):
+                pass
+        except (OSError, ValueError):
+            pass
+        stop.set()
+
+    threading.Thread(target=watch_parent, name="ParentWatch", daemon=True).start()
+
+    # Every subscriber is registered before connecting, so on_connect subscribes them all.
+    subscriber_router = MqttSubscriberRouter()
+    mqtt_connection_manager = MqttConnectionManager()
+
+    visa_fleet_manager = VisaFleetManager()
+
+    def scan(topic=None, payload=None):
+        threading.Thread(target=visa_fleet_manager.trigger_scan, name="FleetScan", daemon=True).start()
+
+    subscriber_router.subscribe_to_topic(SCAN_REQUEST_TOPIC, scan)
+    yak_translator = YakTranslator(mqtt_connection_manager=mqtt_connection_manager, subscriber_router=subscriber_router)
+    YakRxManager(mqtt_connection_manager=mqtt_connection_manager, subscriber_router=subscriber_router, yak_translator=yak_translator)
+
+    mqtt_connection_manager.connect_to_broker(on_message_callback=subscriber_router.get_on_message_callback(), subscriber_router=subscriber_router)
+    visa_fleet_manager.start()
+    scan()
+
+    debug_logger(message=f"💳 VISA fleet worker running in pid {os.getpid()}.", **_get_log_args())
+    while not stop.wait(1.0):
+        pass
+
+    visa_fleet_manager.stop()
+    mqtt_connection_manager.disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_fleet_worker())
@@ -8,7 +8,14 @@ import inspect
 import subprocess
 import configparser
 import pathlib # For path handling in config update
+import hashlib
+import importlib.util
+import site
+import threading
+from datetime import datetime
+import json
 from workers.logger.log_utils import _get_log_args
+from workers.setup.worker_project_paths import DEPENDENCY_CHECK_CACHE_PATH
 
 # app_constants = Config.get_instance() # REMOVED: Will be passed as argument
 
@@ -267,16 +274,90 @@ def action_check_dependancies(console_print_func, debug_log_func, should_clean_i
         return False
 
 
+def _environment_fingerprint():
+    """
+    Hash of everything that can change the outcome of the dependency check: the
+    interpreter, its version and prefix, the required package lists, and the
+    mtime of every site-packages directory (pip install/uninstall touches them).
+    """
+    parts = [sys.executable, sys.version, sys.prefix, current_version, repr(sorted(EXTERNAL_PACKAGES.items())), repr(sorted(BUILTIN_PACKAGES.items()))]
+    site_dirs = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+    site_dirs.append(site.getusersitepackages())
+    for site_dir in sorted(set(site_dirs)):
+        try:
+            parts.append(f"{site_dir}|{os.stat(site_dir).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{site_dir}|missing")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _load_cached_check():
+    try:
+        with open(DEPENDENCY_CHECK_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_check(debug_log_func):
+    """Records a passed check against the environment as it is now (after any installs)."""
+    try:
+        os.makedirs(os.path.dirname(DEPENDENCY_CHECK_CACHE_PATH), exist_ok=True)
+        with open(DEPENDENCY_CHECK_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({
+                "fingerprint": _environment_fingerprint(),
+                "python": sys.executable,
+                "checked": datetime.now().isoformat(timespec="seconds"),
+                "passed": True,
+            }, f)
+    except OSError as e:
+        debug_log_func(message=f"⚠️ Could not store the dependency check result: {e}", **_get_log_args())
+
+
+def _all_packages_locatable():
+    """True if every required top-level package can be found without importing it."""
+    for import_name in list(EXTERNAL_PACKAGES.values()) + list(BUILTIN_PACKAGES.values()):
+        try:
+            if importlib.util.find_spec(import_name.split('.')[0]) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+def _verify_in_background(console_print_func, debug_log_func):
+    """Runs the full import sweep off the startup path and caches the result if it passes."""
+    def worker():
+        if action_check_dependancies(console_print_func, debug_log_func, False):
+            _store_cached_check(debug_log_func)
+        else:
+            console_print_func("❌ Background dependency verification failed. Some features may not work; see the list above.")
+
+    threading.Thread(target=worker, name="DependencyCheck", daemon=True).start()
+
+
 def run_interactive_pre_check(console_print_func, debug_log_func, app_constants_instance):
     # Dependency check and clean install mode are now controlled by config.ini
     if app_constants_instance.SKIP_DEP_CHECK:
         console_print_func("✅ Dependency check skipped as per config.ini.")
         return
 
-    console_print_func("🚀 Starting dependency pre-check for OPEN-AIR. 🚀")
-    
     initial_clean_install_mode = app_constants_instance.CLEAN_INSTALL_MODE # Store initial state
 
+    if not initial_clean_install_mode:
+        cached = _load_cached_check()
+        if cached and cached.get("passed") and cached.get("fingerprint") == _environment_fingerprint():
+            console_print_func(f"✅ Dependencies verified for this environment on {cached.get('checked')}. Skipping the check.")
+            return
+
+        if _all_packages_locatable():
+            # Everything is present; importing it all only confirms it, so do that off the startup path.
+            console_print_func("💡 Environment changed since the last dependency check. Verifying in the background.")
+            _verify_in_background(console_print_func, debug_log_func)
+            return
+
+    console_print_func("🚀 Starting dependency pre-check for OPEN-AIR. 🚀")
+
     if initial_clean_install_mode:
         console_print_func("💡 Clean install mode enabled as per config.ini. All external libraries will be reinstalled.")
     else:
@@ -285,6 +366,7 @@ def run_interactive_pre_check(console_print_func, debug_log_func, app_constants_
     if not action_check_dependancies(console_print_func, debug_log_func, initial_clean_install_mode):
         sys.exit(1)
     else: # Installation was successful
+        _store_cached_check(debug_log_func)
         # If we were in clean install mode, update config.ini for subsequent runs
         if initial_clean_install_mode:
             _update_config_after_install(debug_log_func)
\ No newline at end of file
@@ -15,6 +15,11 @@ from managers.Visa_Fleet_Manager.visa_fleet_manager import VisaFleetManager # Im
 from managers.yak.yak_translator import YakTranslator # Import YakTranslator
 from managers.yak.manager_yak_rx import YakRxManager # Import YakRxManager
 from workers.monitoring.fleet_status_monitor import FleetStatusMonitor # Import FleetStatusMonitor
+from workers.traces.trace_math_pipeline import TraceMathPipeline # Import TraceMathPipeline
+from managers.Visa_Fleet_Manager.visa_fleet_process import VisaFleetProcessSupervisor # Import VisaFleetProcessSupervisor
+from workers.setup.config_reader import Config # Import the Config class
+
+app_constants = Config.get_instance() # Get the singleton instance
 
 
 def launch_managers(app, splash, root, state_cache_manager, mqtt_connection_manager):
@@ -41,31 +46,42 @@ def launch_managers(app, splash, root, state_cache_manager, mqtt_connection_mana
         # Subscribe state_cache_manager to all topics
         state_cache_manager.subscribe_to_all_topics()
 
-        # 2. Initialize Visa Fleet Manager
-        visa_fleet_manager = VisaFleetManager()
-        visa_fleet_manager.start() # Start the Visa Fleet Manager
+        if app_constants.VISA_FLEET_PROCESS:
+            # 2-4. Visa Fleet and Yak layer run in a supervised child process; they reach us over MQTT only.
+            debug_logger(message="💳 Launching the Visa Fleet and Yak layer in a worker process...", **_get_log_args())
+            visa_fleet_manager = VisaFleetProcessSupervisor()
+            visa_fleet_manager.start()
+            yak_translator = None
+            yak_rx_manager = None
+        else:
+            # 2. Initialize Visa Fleet Manager
+            visa_fleet_manager = VisaFleetManager()
+            visa_fleet_manager.start() # Start the Visa Fleet Manager
         
-        # Automatically trigger a scan after starting the manager in a separate thread
-        debug_logger(message="💳 Launching initial Visa Fleet scan in a background thread...", **_get_log_args())
-        scan_thread = threading.Thread(target=visa_fleet_manager.trigger_scan, daemon=True)
-        scan_thread.start()
+            # Automatically trigger a scan after starting the manager in a separate thread
+            debug_logger(message="💳 Launching initial Visa Fleet scan in a background thread...", **_get_log_args())
+            scan_thread = threading.Thread(target=visa_fleet_manager.trigger_scan, daemon=True)
+            scan_thread.start()
 
-        # 3. Initialize Yak Translator
-        yak_translator = YakTranslator(
-            mqtt_connection_manager=mqtt_connection_manager,
-            subscriber_router=subscriber_router
-        )
+            # 3. Initialize Yak Translator
+            yak_translator = YakTranslator(
+                mqtt_connection_manager=mqtt_connection_manager,
+                subscriber_router=subscriber_router
+            )
 
-        # 4. Initialize Yak RX Manager
-        yak_rx_manager = YakRxManager(
-            mqtt_connection_manager=mqtt_connection_manager,
-            subscriber_router=subscriber_router,
-            yak_translator=yak_translator
-        )
+            # 4. Initialize Yak RX Manager
+            yak_rx_manager = YakRxManager(
+                mqtt_connection_manager=mqtt_connection_manager,
+                subscriber_router=subscriber_router,
+                yak_translator=yak_translator
+            )
 
         # 5. Initialize Fleet Status Monitor
         fleet_status_monitor = FleetStatusMonitor(state_mirror_engine=state_mirror_engine, subscriber_router=subscriber_router)
 
+        # 6. Initialize Trace Math Pipeline (Average / Max-Hold / Min-Hold / Delta)
+        trace_math_pipeline = TraceMathPipeline(subscriber_router=subscriber_router)
+
         debug_logger(message="✅ All core managers have been successfully launched!", **_get_log_args())
         # splash.set_status("Managers initialized.")
         
@@ -74,10 +90,11 @@ def launch_managers(app, splash, root, state_cache_manager, mqtt_connection_mana
             "mqtt_connection_manager": mqtt_connection_manager,
             "subscriber_router": subscriber_router,
             "state_mirror_engine": state_mirror_engine,
-            "visa_fleet_manager": visa_fleet_manager, # Add VisaFleetManager
+            "visa_fleet_manager": visa_fleet_manager, # VisaFleetManager, or its VisaFleetProcessSupervisor
             "yak_translator": yak_translator,
             "yak_rx_manager": yak_rx_manager,
             "fleet_status_monitor": fleet_status_monitor,
+            "trace_math_pipeline": trace_math_pipeline,
         }
 
         # Return instantiated managers for use by the application if needed
@@ -30,7 +30,15 @@ import orjson
 from workers.setup.config_reader import Config # Import the Config class
 app_constants = Config.get_instance() # Get the singleton instance
 
+from workers.traces import trace_shared_memory
+from workers.mqtt.mqtt_message import parse_json, receives_mqtt_message
+
 LOCAL_DEBUG_ENABLE = False
+# Output keys carrying whole sweeps; these go through the shared-memory trace ring when enabled.
+TRACE_OUTPUT_KEYS = ("trace_data",)
+# Proxy queries sent by other workers, not through the YAK translator (e.g. the marker
+# worker's *OPC? flow control). Their answers are not ours to process.
+FOREIGN_CORRELATION_PREFIXES = ("opc-",)
 
 class YakRxManager:
     """
@@ -41,6 +49,9 @@ class YakRxManager:
         self.subscriber_router = subscriber_router
         self.yak_translator = yak_translator
         self.NAB_BANDWIDTH_TRIGGER_PATH = ['yak', 'Bandwidth', 'nab', 'NAB_bandwidth_settings', 'scpi_details', 'Execute Command', 'trigger']
+        self.trace_publisher = None
+        if app_constants.TRACE_SHARED_MEMORY and trace_shared_memory.SHARED_MEMORY_AVAILABLE:
+            self.trace_publisher = trace_shared_memory.SharedTracePublisher(mqtt_connection_manager, subscriber_router)
         self._setup_mqtt_subscriptions()
 
     def _setup_mqtt_subscriptions(self):
@@ -49,17 +60,20 @@ class YakRxManager:
         self.subscriber_router.subscribe_to_topic(topic, self._on_rx_outbox_message)
         debug_logger(message=f"✅ YakRxManager subscribed to '{topic}' for proxy responses.", **_get_log_args())
 
+    @receives_mqtt_message
     def _on_rx_outbox_message(self, topic, payload):
         # Handles incoming MQTT messages from the Proxy's Rx_Outbox.
         current_function_name = inspect.currentframe().f_code.co_name
         debug_logger(message=f"📥 Rx_Outbox message received on Topic: '{topic}', Payload: '{payload}'", **_get_log_args())
         
         try:
-            payload_data = orjson.loads(payload)
+            payload_data = parse_json(payload)
             response_value = payload_data.get("response")
             command_sent = payload_data.get("command")
             correlation_id = payload_data.get("correlation_id")
 
+            if correlation_id and str(correlation_id).startswith(FOREIGN_CORRELATION_PREFIXES):
+                return
             if correlation_id and response_value:
                 command_context = self.yak_translator.retrieve_command_context(correlation_id)
                 if command_context:
@@ -202,7 +216,10 @@ class YakRxManager:
                 output_topic = f"{base_output_topic}/{key}/value"
                 
                 # Publish the value to the MQTT topic
-                self.mqtt_util.get_client_instance().publish(topic=output_topic, payload=raw_value, qos=0, retain=True)
+                if self.trace_publisher and key in TRACE_OUTPUT_KEYS:
+                    self.trace_publisher.publish(output_topic, raw_value)
+                else:
+                    self.mqtt_util.get_client_instance().publish(topic=output_topic, payload=raw_value, qos=0, retain=True)
                 if app_constants.global_settings['debug_enabled']:
                     debug_logger(
                         message=f"💾 Published to '{output_topic}' with value: '{raw_value}'.",
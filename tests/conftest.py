@@ -0,0 +1,12 @@
+# tests/conftest.py
+#
+# The repository root holds an __init__.py, so pytest would otherwise import these
+# tests as part of a parent package; put the root on sys.path so 'workers', 'managers'
+# and 'display' import the same way they do for OpenAir.py.
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
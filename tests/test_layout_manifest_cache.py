@@ -0,0 +1,42 @@
+from workers.display.layout_manifest_cache import LayoutManifestCache
+
+
+def _cache(tmp_path):
+    return LayoutManifestCache(manifest_path=tmp_path / "manifest.json", project_root=tmp_path)
+
+
+def test_pycache_does_not_change_the_tree_fingerprint(tmp_path):
+    display = tmp_path / "display"
+    (display / "left" / "tab").mkdir(parents=True)
+    (display / "left" / "tab" / "gui_tab.py").write_text("", encoding="utf-8")
+    (display / "right").mkdir()
+
+    cache = _cache(tmp_path)
+    cache.scan_display_tree(display)
+    fingerprint = cache.tree_fingerprint
+    assert cache.has_gui_files(display / "left") is True
+    assert cache.has_gui_files(display / "right") is False
+
+    (display / "left" / "tab" / "__pycache__").mkdir()
+    (display / "left" / "tab" / "__pycache__" / "gui_tab.cpython.pyc").write_bytes(b"")
+    cache.scan_display_tree(display)
+    assert cache.tree_fingerprint == fingerprint
+
+    (display / "extra").mkdir()
+    cache.scan_display_tree(display)
+    assert cache.tree_fingerprint != fingerprint
+
+
+def test_load_json_returns_a_private_copy(tmp_path):
+    json_path = tmp_path / "gui_test.json"
+    json_path.write_text('{"Button": {"type": "_Button", "options": [1]}}', encoding="utf-8")
+
+    cache = _cache(tmp_path)
+    md5, first = cache.load_json(json_path)
+    first["Button"]["options"].append(2)
+    first["Injected"] = {}
+
+    same_md5, second = cache.load_json(json_path)
+    assert same_md5 == md5
+    assert second == {"Button": {"type": "_Button", "options": [1]}}
+    assert cache.json_files["gui_test.json"]["config"] == second
@@ -0,0 +1,56 @@
+# tests/test_marker_imd_engine.py
+
+import itertools
+
+import numpy as np
+
+from workers.markers.worker_marker_imd_engine import (
+    analyze_coordination, score_candidate_frequencies, load_tv_channel_ranges, TV_CHANNELS_DIR,
+)
+
+
+def _brute_force(freqs, spacing, g3, g5, g3tx):
+    n = len(freqs)
+    report = {name: np.zeros(n, dtype=np.int64) for name in ("spacing_conflicts", "imd3_2tx", "imd5_2tx", "imd3_3tx")}
+    for v in range(n):
+        others = [i for i in range(n) if i != v]
+        report["spacing_conflicts"][v] = sum(abs(freqs[i] - freqs[v]) <= spacing for i in others)
+        for i, j in itertools.permutations(others, 2):
+            report["imd3_2tx"][v] += abs(2 * freqs[i] - freqs[j] - freqs[v]) <= g3
+            report["imd5_2tx"][v] += abs(3 * freqs[i] - 2 * freqs[j] - freqs[v]) <= g5
+        for i, j in itertools.combinations(others, 2):
+            for k in others:
+                if k not in (i, j):
+                    report["imd3_3tx"][v] += abs(freqs[i] + freqs[j] - freqs[k] - freqs[v]) <= g3tx
+    return report
+
+
+def test_matches_brute_force_on_random_sets():
+    rng = np.random.default_rng(7)
+    guards = dict(carrier_spacing_mhz=0.35, imd3_guard_mhz=0.1, imd5_guard_mhz=0.05, imd3_3tx_guard_mhz=0.05)
+    for _ in range(5):
+        # A coarse grid makes coincident products (and so non-zero counts) likely.
+        freqs = rng.choice(np.arange(470.0, 480.0, 0.125), size=9, replace=False)
+        report = analyze_coordination(freqs, **guards)
+        expected = _brute_force(freqs, 0.35, 0.1, 0.05, 0.05)
+        for name, counts in expected.items():
+            np.testing.assert_array_equal(report[name], counts, err_msg=name)
+
+
+def test_third_order_product_on_a_carrier():
+    # 2 * 470.5 - 470.0 = 471.0 and 2 * 470.5 - 471.0 = 470.0; NaN is ignored.
+    report = analyze_coordination([470.0, 470.5, 471.0, np.nan])
+    assert report["imd3_2tx"].tolist() == [1, 0, 1, 0]
+    assert report["conflicted"].tolist() == [True, False, True, False]
+
+
+def test_candidate_scoring_flags_products_and_spacing():
+    result = score_candidate_frequencies([470.0, 470.5], [(470.0, 471.0)], step_mhz=0.5)
+    scores = dict(zip(result["freq_mhz"].tolist(), result["clean"].tolist()))
+    assert scores == {470.0: False, 470.5: False, 471.0: False}
+    assert result["imd3_2tx"].tolist() == [0, 0, 1]
+
+
+def test_atsc_channel_ranges_use_lower_edges():
+    ranges = {label: (start, stop) for label, start, stop in load_tv_channel_ranges(TV_CHANNELS_DIR / "meta_tv_northAmerica.json")}
+    assert ranges["atsc_usa:38"] == (614.0, 620.0)
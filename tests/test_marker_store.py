@@ -0,0 +1,67 @@
+import numpy as np
+
+from workers.markers.marker_store import MarkerStore, CANONICAL_HEADERS, repository_device_key
+
+
+ROWS = [
+    {"ZONE": "Stage", "GROUP": "IEM", "DEVICE": "PSM", "NAME": "Vox B", "FREQ_MHZ": "520.5", "PEAK": ""},
+    {"ZONE": "Stage", "GROUP": "Mics", "DEVICE": "SLX", "NAME": "Vox A", "FREQ_MHZ": "510.25", "PEAK": ""},
+    {"ZONE": "FOH", "GROUP": "Mics", "DEVICE": "SLX", "NAME": "Host", "FREQ_MHZ": "bad", "PEAK": ""},
+    {"ZONE": "FOH", "GROUP": "Mics", "DEVICE": "ULX", "NAME": "Guest", "FREQ_MHZ": "530", "PEAK": ""},
+]
+
+
+def _store(rows=ROWS):
+    store = MarkerStore()
+    store.load_rows(CANONICAL_HEADERS, rows)
+    return store
+
+
+def test_frequencies_are_float_with_nan_for_bad_values():
+    store = _store()
+    np.testing.assert_array_equal(np.isnan(store.freq_mhz), [False, False, True, False])
+    assert store.freq_mhz[0] == 520.5
+
+
+def test_range_and_span_queries_skip_invalid_frequencies():
+    store = _store()
+    assert list(store.indices_in_range(510, 525)) == [1, 0]
+    assert store.frequency_span() == (510.25, 530.0)
+    assert store.frequency_span(zone="FOH") == (530.0, 530.0)
+    assert store.frequency_span(zone="Nowhere") == (None, None)
+
+
+def test_select_and_grouped_follow_name_order():
+    store = _store()
+    assert sorted(store.zones()) == ["FOH", "Stage"]
+    assert [row["NAME"] for row in store.rows_for(store.select(zone="FOH"))] == ["Guest", "Host"]
+    assert list(store.select(group="Mics", device="SLX")) == [2, 1]
+    assert len(store.select(zone="Nowhere")) == 0
+    grouped = store.grouped()
+    assert [row["NAME"] for row in grouped["Stage"]["Mics"]] == ["Vox A"]
+
+
+def test_device_frequencies_use_repository_keys():
+    store = _store()
+    assert repository_device_key(0) == "Device-001"
+    assert store.device_frequencies() == {"Device-001": 520.5, "Device-002": 510.25, "Device-004": 530.0}
+
+
+def test_load_csv_reloads_only_when_the_file_changes(tmp_path):
+    path = tmp_path / "MARKERS.csv"
+    path.write_text("ZONE,GROUP,DEVICE,NAME,FREQ_MHZ,PEAK\nA,G,D,One,500,\n", encoding="utf-8")
+    store = MarkerStore()
+    assert store.load_csv(path)
+    assert not store.load_csv(path)
+    assert len(store) == 1
+
+    path.write_text("ZONE,GROUP,DEVICE,NAME,FREQ_MHZ,PEAK\nA,G,D,One,500,\nA,G,D,Two,501,\n", encoding="utf-8")
+    assert store.load_csv(path)
+    assert store.device_frequencies() == {"Device-001": 500.0, "Device-002": 501.0}
+
+
+def test_missing_csv_gives_an_empty_table(tmp_path):
+    store = MarkerStore()
+    store.load_csv(tmp_path / "missing.csv")
+    assert len(store) == 0
+    assert store.frequency_span() == (None, None)
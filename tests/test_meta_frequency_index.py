@@ -0,0 +1,44 @@
+# tests/test_meta_frequency_index.py
+
+import orjson
+
+from workers.markers.meta_frequency_index import FrequencyMetaIndex, channel_bounds, META_DATASETS_DIR
+
+
+def _index(tmp_path, root=META_DATASETS_DIR):
+    return FrequencyMetaIndex(root=root, cache_path=tmp_path / "meta_frequency_index.npz")
+
+
+def _tv_channel(index, freq_mhz, label):
+    return next(hit for hit in index.covering(freq_mhz, kind="Television") if hit["label"] == label)
+
+
+def test_atsc_channels_are_listed_by_lower_edge(tmp_path):
+    channel = _tv_channel(_index(tmp_path), 614.125, "ATSC (USA) ch 38")
+    assert (channel["start_mhz"], channel["stop_mhz"]) == (614.0, 620.0)
+
+
+def test_uk_dvb_t_channels_are_listed_by_center(tmp_path):
+    channel = _tv_channel(_index(tmp_path), 471.0, "DVB-T (UK) ch 21")
+    assert (channel["start_mhz"], channel["stop_mhz"]) == (470.0, 478.0)
+
+
+def test_explicit_bounds_and_cache_round_trip(tmp_path):
+    root = tmp_path / "meta"
+    (root / "Bands").mkdir(parents=True)
+    (root / "Bands" / "meta_test.json").write_bytes(orjson.dumps({
+        "Wide": {"Value": "Wide", "Start_MHz": "400", "Stop_MHz": "700"},
+        "Narrow": {"Value": "Narrow", "Start_MHz": "500", "Stop_MHz": "510"},
+    }))
+    built = _index(tmp_path, root)
+    assert [hit["label"] for hit in built.covering(505.0)] == ["Narrow", "Wide"]
+    assert built.covering(399.0) == []
+    assert [hit["label"] for hit in built.overlapping(390.0, 450.0)] == ["Wide"]
+
+    cached = _index(tmp_path, root)
+    assert list(cached.narrowest_labels([505.0, 600.0, 800.0])) == ["Narrow", "Wide", ""]
+
+
+def test_channel_bounds_center_without_system():
+    bounds = channel_bounds([{"channel": "1", "frequency_mhz": 100}, {"channel": "2", "frequency_mhz": 106}])
+    assert [(start, stop) for _, start, stop in bounds] == [(97.0, 103.0), (103.0, 109.0)]
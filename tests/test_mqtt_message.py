@@ -0,0 +1,71 @@
+import orjson
+import pytest
+
+from workers.mqtt.mqtt_message import _UNSET, MqttMessage, parse_json, receives_mqtt_message
+from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+
+
+def test_text_and_json_are_decoded_lazily_and_once():
+    message = MqttMessage("a/b", b'{"val": 1}')
+    assert message._text is _UNSET and message._json is _UNSET
+    first = message.json
+    assert first == {"val": 1}
+    assert message.json is first
+    assert parse_json(message) is first
+    assert message.text == '{"val": 1}'
+    assert message.text is message.text
+
+
+def test_invalid_json_raises_every_time():
+    message = MqttMessage("a/b", b"{oops")
+    assert message.looks_like_json
+    for _ in range(2):
+        with pytest.raises(orjson.JSONDecodeError):
+            message.json
+
+
+def test_payload_forms_and_immutability():
+    assert MqttMessage("t", "text").payload == b"text"
+    assert MqttMessage("t", None).payload == b""
+    assert not MqttMessage("t", b"").looks_like_json
+    assert MqttMessage("t", b"  [1]").looks_like_json
+    with pytest.raises(AttributeError):
+        MqttMessage("t", b"x").topic = "other"
+
+
+class FakePahoMessage:
+    def __init__(self, topic, payload):
+        self.topic = topic
+        self.payload = payload
+
+
+def test_router_decodes_text_only_for_plain_callbacks():
+    router = MqttSubscriberRouter()
+    received = []
+
+    @receives_mqtt_message
+    def wants_message(topic, payload):
+        received.append(("message", payload))
+
+    router.subscribe_to_topic("bin/+", wants_message)
+    router._on_message(None, None, FakePahoMessage("bin/x", b"\xff\xfe"))
+    assert received and isinstance(received[0][1], MqttMessage)
+    assert received[0][1].payload == b"\xff\xfe"
+
+    def wants_text(topic, payload):
+        received.append(("text", payload))
+
+    router.subscribe_to_topic("bin/#", wants_text)
+    router._on_message(None, None, FakePahoMessage("bin/y", b"\xff"))  # undecodable: skipped for text only
+    assert [kind for kind, _ in received] == ["message", "message"]
+
+    router._on_message(None, None, FakePahoMessage("bin/y", "héllo".encode("utf-8")))
+    assert received[-1] == ("text", "héllo")
+
+
+def test_router_never_decodes_for_message_receivers():
+    router = MqttSubscriberRouter()
+    received = []
+    router.subscribe_to_topic("a/b", receives_mqtt_message(lambda topic, payload: received.append(payload)))
+    router._on_message(None, None, FakePahoMessage("a/b", b"payload"))
+    assert received[0]._text is _UNSET
@@ -0,0 +1,56 @@
+import orjson
+
+from workers.mqtt.mqtt_traffic_recorder import RecordingWriter, read_recording
+from workers.mqtt.mqtt_traffic_replay import build_router_harness, replay
+from workers.traces.trace_math_pipeline import CONTROL_BASE_TOPIC
+
+WIDGET_TOPIC = "OPEN-AIR/Yak/Frequency/center_freq/value"
+AVERAGE_MODE_TOPIC = f"{CONTROL_BASE_TOPIC}/Average_Mode"
+
+
+def _record(path, messages):
+    writer = RecordingWriter(path)
+    try:
+        for topic, payload, retain in messages:
+            writer.write(topic, payload, qos=1, retain=retain)
+    finally:
+        writer.close()
+
+
+def test_recording_round_trips_in_order(tmp_path):
+    path = tmp_path / "rec.oamqtt"
+    messages = [
+        (WIDGET_TOPIC, orjson.dumps({"val": "100"}), True),
+        ("OPEN-AIR/other", b"\xff\x00binary", False),
+        (WIDGET_TOPIC, orjson.dumps({"val": "101"}), False),
+    ]
+    _record(path, messages)
+
+    replayed = list(read_recording(path))
+    assert [(topic, payload, retain) for _, topic, payload, _, retain in replayed] == messages
+    assert all(qos == 1 for _, _, _, qos, _ in replayed)
+    offsets = [offset for offset, *_ in replayed]
+    assert offsets == sorted(offsets)
+
+
+def test_router_replay_reaches_the_registered_widgets(tmp_path):
+    path = tmp_path / "rec.oamqtt"
+    _record(path, [
+        (WIDGET_TOPIC, orjson.dumps({"val": "100", "GUID": "recorded"}), True),
+        (WIDGET_TOPIC, orjson.dumps({"val": "101", "GUID": "recorded"}), False),
+        (AVERAGE_MODE_TOPIC, orjson.dumps({"val": "exponential", "GUID": "recorded"}), False),
+    ])
+
+    harness = build_router_harness({topic for _, topic, _, _, _ in read_recording(path)})
+    try:
+        report = replay(path, speed=None, on_message=harness)
+    finally:
+        harness.close()
+
+    assert report["target"] == "router"
+    assert report["messages"] == 3
+    assert report["handler_ms"]["count"] == 3
+    assert harness.widgets[WIDGET_TOPIC].get() == "101"
+    assert harness.widgets[AVERAGE_MODE_TOPIC].get() == "exponential"
+    assert harness.trace_pipeline.average_mode == "exponential"
+    assert harness.cache[WIDGET_TOPIC]["val"] == "101"
@@ -0,0 +1,48 @@
+import pytest
+
+from workers.active.worker_active_sweep_planner import MAX_MARKERS_PER_PLACEMENT, plan_sweep_windows
+
+
+def test_empty_and_invalid_markers_plan_nothing():
+    assert plan_sweep_windows({}) == []
+    assert plan_sweep_windows({"a": 0, "b": -5, "c": "bad", "d": None}) == []
+
+
+def test_markers_are_clustered_by_span_with_buffer():
+    markers = {"c": 560.0, "a": 500.0, "b": 549.8, "d": 700.0}
+    windows = plan_sweep_windows(markers, max_span_mhz=50.0, buffer_mhz=0.1)
+
+    assert [w.device_ids for w in windows] == [["a", "b"], ["c"], ["d"]]
+    assert windows[0].span == pytest.approx((499.9, 549.9))
+    assert windows[1].span == pytest.approx((559.9, 560.1))
+    for window in windows:
+        assert window.stop_mhz - window.start_mhz <= 50.0 + 1e-9
+
+
+def test_every_valid_marker_is_planned_exactly_once_in_batches_of_six():
+    markers = {f"Device-{i:03d}": 470.0 + i * 0.25 for i in range(1, 41)}
+    markers["Device-bad"] = "nan?"
+    windows = plan_sweep_windows(markers, max_span_mhz=3.0, buffer_mhz=0.1)
+
+    planned = [device_id for w in windows for device_id in w.device_ids]
+    assert sorted(planned) == sorted(k for k in markers if k != "Device-bad")
+    for window in windows:
+        assert all(len(batch) <= MAX_MARKERS_PER_PLACEMENT for batch in window.marker_batches)
+        assert [d for batch in window.marker_batches for d in batch] == window.device_ids
+        freqs = [markers[d] for d in window.device_ids]
+        assert window.start_mhz <= min(freqs) and max(freqs) <= window.stop_mhz
+
+
+def test_reverse_walks_the_band_from_the_top():
+    markers = {"low": 470.0, "mid": 471.0, "high": 900.0}
+    forward = plan_sweep_windows(markers, max_span_mhz=10.0)
+    backward = plan_sweep_windows(markers, max_span_mhz=10.0, reverse=True)
+
+    assert [w.device_ids for w in forward] == [["low", "mid"], ["high"]]
+    assert [w.device_ids for w in backward] == [["high"], ["mid", "low"]]
+    assert [w.span for w in backward] == [w.span for w in reversed(forward)]
+
+
+def test_window_start_never_goes_below_zero():
+    windows = plan_sweep_windows({"a": 0.05}, buffer_mhz=0.1)
+    assert windows[0].start_mhz == 0.0
@@ -0,0 +1,78 @@
+# tests/test_trace_math_pipeline.py
+
+import numpy as np
+import orjson
+
+from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+from workers.mqtt.mqtt_traffic_replay import ReplayMessage
+from workers.traces.trace_math_pipeline import (
+    TraceBuffers, TraceMathPipeline, CONTROL_BASE_TOPIC,
+    AVERAGE_MODE_LINEAR, AVERAGE_MODE_EXPONENTIAL,
+)
+
+RAW_TOPIC = "OPEN-AIR/yak/Trace/N9340B/Get_Trace_1/scpi_details/Outputs/trace_data/value"
+
+
+def _fold(buffers, *sweeps):
+    for sweep in sweeps:
+        buffers.accumulate(np.array(sweep, dtype=np.float64))
+
+
+def test_linear_average_is_running_mean_until_count():
+    buffers = TraceBuffers(AVERAGE_MODE_LINEAR, average_count=4)
+    _fold(buffers, [0.0, 10.0], [2.0, 20.0], [4.0, 30.0])
+    np.testing.assert_allclose(buffers.average, [2.0, 20.0])
+    np.testing.assert_allclose(buffers.max_hold, [4.0, 30.0])
+    np.testing.assert_allclose(buffers.min_hold, [0.0, 10.0])
+
+
+def test_linear_average_settles_into_exponential_after_count():
+    buffers = TraceBuffers(AVERAGE_MODE_LINEAR, average_count=2)
+    _fold(buffers, [0.0], [4.0], [8.0])
+    # mean(0, 4) = 2, then 2 + (8 - 2) / 2
+    np.testing.assert_allclose(buffers.average, [5.0])
+
+
+def test_exponential_average_uses_fixed_weight_from_second_sweep():
+    buffers = TraceBuffers(AVERAGE_MODE_EXPONENTIAL, average_count=4)
+    _fold(buffers, [0.0], [8.0])
+    np.testing.assert_allclose(buffers.average, [2.0])
+
+
+def test_reference_and_delta():
+    buffers = TraceBuffers(AVERAGE_MODE_LINEAR, average_count=1)
+    _fold(buffers, [1.0, 2.0])
+    assert buffers.store_reference()
+    assert buffers.accumulate(np.array([3.0, 1.0]))
+    np.testing.assert_allclose(buffers.delta, [2.0, -1.0])
+    buffers.clear_reference()
+    assert not buffers.accumulate(np.array([3.0, 1.0]))
+
+
+def test_length_change_reallocates_and_drops_reference():
+    buffers = TraceBuffers()
+    _fold(buffers, [1.0, 2.0])
+    buffers.store_reference()
+    _fold(buffers, [1.0, 2.0, 3.0])
+    assert buffers.length == 3
+    assert buffers.reference is None
+    assert buffers.sweep_count == 1
+
+
+def test_averaging_tab_widgets_do_not_displace_pipeline_controls():
+    router = MqttSubscriberRouter()
+    pipeline = TraceMathPipeline(subscriber_router=router)
+    widget_updates = []
+    # The averaging tab's dropdown and value box subscribe the exact setting topics after the pipeline.
+    for setting in ("Average_Mode", "Average_Count"):
+        router.subscribe_to_topic(f"{CONTROL_BASE_TOPIC}/{setting}", lambda topic, payload: widget_updates.append(topic))
+
+    router._on_message(None, None, ReplayMessage(RAW_TOPIC, b"-80.0,-70.0"))
+    router._on_message(None, None, ReplayMessage(f"{CONTROL_BASE_TOPIC}/Average_Mode", orjson.dumps({"val": "exponential"})))
+    router._on_message(None, None, ReplayMessage(f"{CONTROL_BASE_TOPIC}/Average_Count", orjson.dumps({"val": "4"})))
+
+    (buffers,) = pipeline.buffers.values()
+    assert buffers.average_mode == AVERAGE_MODE_EXPONENTIAL
+    assert buffers.average_count == 4
+    assert pipeline.average_mode == AVERAGE_MODE_EXPONENTIAL
+    assert len(widget_updates) == 2
@@ -0,0 +1,64 @@
+import numpy as np
+import orjson
+
+from workers.traces import trace_shared_memory
+from workers.traces.trace_shared_memory import SharedTracePublisher, decode_trace_payload
+
+
+class FakeClient:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        self.published.append((topic, payload, retain))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.client = FakeClient()
+
+    def get_client_instance(self):
+        return self.client
+
+
+class FakeRouter:
+    def subscribe_to_topic(self, topic, callback):
+        pass
+
+
+def test_decode_accepts_csv_lists_and_widget_objects():
+    np.testing.assert_array_equal(decode_trace_payload("-80.5, -79"), [-80.5, -79.0])
+    np.testing.assert_array_equal(decode_trace_payload(b"[1, 2]"), [1.0, 2.0])
+    np.testing.assert_array_equal(decode_trace_payload('{"val": "3,4"}'), [3.0, 4.0])
+
+
+def test_decode_returns_none_for_malformed_payloads():
+    assert decode_trace_payload("{not json") is None
+    assert decode_trace_payload("[1, 2") is None
+    assert decode_trace_payload("") is None
+    assert decode_trace_payload('{"val": "False"}') is None
+
+
+def test_ring_publish_clears_the_retained_inline_trace_once():
+    connection = FakeConnection()
+    publisher = SharedTracePublisher(connection, FakeRouter())
+    topic = "OPEN-AIR/yak/Trace/trace_data/value"
+    try:
+        publisher.publish(topic, "-80,-81,-82")
+        publisher.publish(topic, "-70,-71,-72")
+        published = connection.client.published
+        assert published[0] == (topic, b"", True)
+        assert [retain for _, _, retain in published[1:]] == [False, False]
+
+        notification = orjson.loads(published[-1][1])
+        np.testing.assert_array_equal(decode_trace_payload(notification), [-70.0, -71.0, -72.0])
+
+        # An inline retained trace (e.g. for a remote reader) gets cleared again on the next ring publish.
+        publisher.publish(topic, "not a sweep")
+        publisher.publish(topic, "-60,-61")
+        assert published[-3] == (topic, "not a sweep", True)
+        assert published[-2] == (topic, b"", True)
+    finally:
+        publisher.close()
+        with trace_shared_memory._readers_lock:
+            trace_shared_memory._readers.clear()
@@ -15,16 +15,16 @@
 # The hash calculation drops the leading zero from the hour (e.g., 08 -> 8)
 # As the current hour is 20, no change is needed.
 
-Current_Date = 20251129  ##Update on the day the change was made
+Current_Date = 20251230  ##Update on the day the change was made
 Current_Time = 120000  ## update at the time it was edited and compiled
-Current_iteration = 1 ## a running version number - incriments by one each time 
+Current_iteration = 2 ## a running version number - incriments by one each time 
 
 current_version = f"{Current_Date}.{Current_Time}.{Current_iteration}"
 current_version_hash = (Current_Date * Current_Time * Current_iteration)
 
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from workers.Showtime.worker_showtime_draw_bargraph import create_bar_graph_image
 
 def create_button_with_bar_graph(parent, value, text):
@@ -39,11 +39,20 @@ def create_button_with_bar_graph(parent, value, text):
     Returns:
         ttk.Button: The created button.
     """
-    image_path = create_bar_graph_image(value, text)
-    img = Image.open(image_path)
-    photo = ImageTk.PhotoImage(img)
+    button = ttk.Button(parent)
+    update_button_bar_graph(button, value, text)
+    return button
 
-    button = ttk.Button(parent, image=photo)
-    button.image = photo  # Keep a reference to the image to prevent garbage collection
+def update_button_bar_graph(button, value, text):
+    """
+    Re-renders the bar graph of an existing button in place. Does nothing if the
+    value (quantized to whole units) and text are unchanged.
+    """
+    state = (int(round(value)), text)
+    if getattr(button, "bar_graph_state", None) == state:
+        return
 
-    return button
\ No newline at end of file
+    photo = ImageTk.PhotoImage(create_bar_graph_image(value, text))
+    button.configure(image=photo)
+    button.image = photo  # Keep a reference to the image to prevent garbage collection
+    button.bar_graph_state = state
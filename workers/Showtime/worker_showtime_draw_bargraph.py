@@ -15,23 +15,50 @@
 # The hash calculation drops the leading zero from the hour (e.g., 08 -> 8)
 # As the current hour is 20, no change is needed.
 
-Current_Date = 20251129  ##Update on the day the change was made
+Current_Date = 20251230  ##Update on the day the change was made
 Current_Time = 120000  ## update at the time it was edited and compiled
-Current_iteration = 1 ## a running version number - incriments by one each time 
+Current_iteration = 2 ## a running version number - incriments by one each time 
 
 current_version = f"{Current_Date}.{Current_Time}.{Current_iteration}"
 current_version_hash = (Current_Date * Current_Time * Current_iteration)
 
-import os
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
-import workers.setup.worker_project_paths as project_paths
+
+BAR_GRAPH_MIN = -100
+BAR_GRAPH_MAX = 0
+
+
+@lru_cache(maxsize=8)
+def _get_font(size=10):
+    # Loading a TrueType font hits the disk; do it once per size.
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except IOError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=8)
+def _get_bar_sprites(width, height, bg_color, bar_color):
+    """One pre-drawn background+bar image per integer value in BAR_GRAPH_MIN..BAR_GRAPH_MAX."""
+    bar_height = 10
+    bar_y_position = height - bar_height - 5
+    sprites = {}
+    for value in range(BAR_GRAPH_MIN, BAR_GRAPH_MAX + 1):
+        img = Image.new('RGB', (width, height), color=bg_color)
+        draw = ImageDraw.Draw(img)
+        bar_width = (value + 100) * width / 100
+        draw.rectangle([(0, bar_y_position), (bar_width, bar_y_position + bar_height)], fill=bar_color)
+        sprites[value] = img
+    return sprites
+
 
 def create_bar_graph_image(value, text, width=200, height=60, bg_color=(200, 200, 200), bar_color=(0, 0, 255), text_color=(0, 0, 0)):
     """
-    Creates a horizontal bar graph image with text.
+    Creates a horizontal bar graph image with text, entirely in memory.
 
     Args:
-        value (int): The value to represent, from -100 to 0.
+        value (int): The value to represent, from -100 to 0. Rounded to the nearest integer.
         text (str): The text to display on the image.
         width (int): The width of the image.
         height (int): The height of the image.
@@ -40,35 +67,14 @@ def create_bar_graph_image(value, text, width=200, height=60, bg_color=(200, 200
         text_color (tuple): The color of the text.
 
     Returns:
-        str: The path to the saved image.
+        PIL.Image.Image: The rendered image.
     """
-    if not -100 <= value <= 0:
+    if not BAR_GRAPH_MIN <= value <= BAR_GRAPH_MAX:
         raise ValueError("Value must be between -100 and 0.")
 
-    # Create a new image with a light gray background
-    img = Image.new('RGB', (width, height), color=bg_color)
-    draw = ImageDraw.Draw(img)
-
-    # Calculate the width of the bar
-    bar_height = 10
-    bar_y_position = height - bar_height - 5
-    bar_width = (value + 100) * width / 100
-
-    # Draw the bar
-    draw.rectangle([(0, bar_y_position), (bar_width, bar_y_position + bar_height)], fill=bar_color)
-
-    # Draw the text
-    try:
-        font = ImageFont.truetype("arial.ttf", 10)
-    except IOError:
-        font = ImageFont.load_default()
-    
-    draw.text((5, 5), text, font=font, fill=text_color)
-
-
-    # Save the image to the DATA folder
-    image_name = f"bar_graph_{value}.png"
-    image_path = os.path.join(project_paths.DATA_DIR, image_name)
-    img.save(image_path)
+    # Start from the pre-drawn bar for this value and only draw the text
+    img = _get_bar_sprites(width, height, tuple(bg_color), tuple(bar_color))[int(round(value))].copy()
+    if text:
+        ImageDraw.Draw(img).text((5, 5), text, font=_get_font(10), fill=text_color)
 
-    return image_path
\ No newline at end of file
+    return img
@@ -15,9 +15,9 @@
 #
 
 import inspect
-from collections import defaultdict
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.markers.marker_store import MarkerStore
 from workers.setup.config_reader import Config # Import the Config class                                                                          
 
 app_constants = Config.get_instance() # Get the singleton instance      
@@ -34,16 +34,9 @@ def process_and_sort_markers(showtime_tab_instance):
 
         )
 
-    showtime_tab_instance.grouped_markers = defaultdict(lambda: defaultdict(list))
-    
-    for row in showtime_tab_instance.marker_data:
-        zone = row.get('ZONE', 'N/A')
-        group = row.get('GROUP', 'N/A')
-        showtime_tab_instance.grouped_markers[zone][group].append(row)
-    
-    for zone, groups in showtime_tab_instance.grouped_markers.items():
-        for group, devices in groups.items():
-            devices.sort(key=lambda x: x.get('NAME', ''))
+    # Zone/group codes and the NAME order are precomputed by the marker store
+    marker_store = MarkerStore.get_instance()
+    showtime_tab_instance.grouped_markers = marker_store.grouped()
     
     if app_constants.global_settings['debug_enabled']:
         debug_logger(
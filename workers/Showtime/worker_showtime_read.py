@@ -17,7 +17,7 @@
 import inspect
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
-from workers.importers.worker_marker_file_import_handling import maker_file_check_for_markers_file
+from workers.markers.marker_store import MarkerStore
 from workers.setup.config_reader import Config # Import the Config class
 app_constants = Config.get_instance() # Get the singleton instance
 
@@ -33,22 +33,25 @@ def load_marker_data(showtime_tab_instance):
 
         )
     
-    raw_headers, raw_data = maker_file_check_for_markers_file()
+    # The shared store only re-reads MARKERS.csv when the file has changed
+    marker_store = MarkerStore.get_instance()
+    marker_store.load_csv()
+    showtime_tab_instance.marker_store = marker_store
     
-    if not raw_data:
+    if not len(marker_store):
         showtime_tab_instance.marker_data = []
         showtime_tab_instance.column_headers = []
         debug_logger(message="🟡 No marker data found in MARKERS.csv. No buttons will be created.", **_get_log_args())
         return
 
-    showtime_tab_instance.marker_data = [dict(zip(raw_headers, row)) for row in raw_data if len(row) == len(raw_headers)]
-    showtime_tab_instance.column_headers = raw_headers
+    showtime_tab_instance.marker_data = marker_store.rows
+    showtime_tab_instance.column_headers = marker_store.headers
 
     if app_constants.global_settings['debug_enabled']:
         debug_logger(
-            message=f"✅ Loaded {len(showtime_tab_instance.marker_data)} rows. Converted to dictionaries for sorting and display.",
+            message=f"✅ Loaded {len(showtime_tab_instance.marker_data)} rows from the shared marker store.",
             **_get_log_args()
             
 
 
-        )
\ No newline at end of file
+        )
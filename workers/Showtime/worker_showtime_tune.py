@@ -18,7 +18,7 @@ import inspect
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
 ## from workers.active.worker_active_marker_tune_and_collect import Push_Marker_to_Center_Freq, Push_Marker_to_Start_Stop_Freq
-from workers.markers.worker_marker_logic import calculate_frequency_range
+from workers.markers.marker_store import MarkerStore
 from workers.setup.config_reader import Config # Import the Config class                                                                          
 
 app_constants = Config.get_instance() # Get the singleton instance      
@@ -63,9 +63,7 @@ def on_tune_request_from_selection(showtime_tab_instance):
 
 
             )
-        group_devices = showtime_tab_instance.grouped_markers[showtime_tab_instance.selected_zone][showtime_tab_instance.selected_group]
-        # UPDATED: Use the imported utility function
-        min_freq, max_freq = calculate_frequency_range(group_devices)
+        min_freq, max_freq = MarkerStore.get_instance().frequency_span(zone=showtime_tab_instance.selected_zone, group=showtime_tab_instance.selected_group)
         
         if min_freq is not None and max_freq is not None:
             mock_marker_data = {'FREQ_MHZ': (min_freq + max_freq) / 2}
@@ -83,11 +81,7 @@ def on_tune_request_from_selection(showtime_tab_instance):
 
 
             )
-        all_zone_devices = []
-        for group_name in showtime_tab_instance.grouped_markers[showtime_tab_instance.selected_zone]:
-            all_zone_devices.extend(showtime_tab_instance.grouped_markers[showtime_tab_instance.selected_zone][group_name])
-        # UPDATED: Use the imported utility function
-        min_freq, max_freq = calculate_frequency_range(all_zone_devices)
+        min_freq, max_freq = MarkerStore.get_instance().frequency_span(zone=showtime_tab_instance.selected_zone)
         
         if min_freq is not None and max_freq is not None:
             mock_marker_data = {'FREQ_MHZ': (min_freq + max_freq) / 2}
@@ -104,8 +98,7 @@ def on_tune_request_from_selection(showtime_tab_instance):
 
 
             )
-        # UPDATED: Use the imported utility function
-        min_freq, max_freq = calculate_frequency_range(showtime_tab_instance.marker_data)
+        min_freq, max_freq = MarkerStore.get_instance().frequency_span()
         
         if min_freq is not None and max_freq is not None:
             mock_marker_data = {'FREQ_MHZ': (min_freq + max_freq) / 2}
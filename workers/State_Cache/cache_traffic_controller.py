@@ -13,6 +13,7 @@ from typing import Dict, Any, Tuple, Optional
 from . import state_comparator
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_message import MqttMessage
 
 current_version = "20251230.230300.1"
 current_version_hash = (20251230 * 230300 * 1)
@@ -27,10 +28,12 @@ def process_traffic(topic: str, payload: str, current_cache: Dict) -> Tuple[bool
     """
     debug_logger(message=f"tt! A new event is rippling through the timeline! Topic: {topic}", **_get_log_args())
     try:
-        if isinstance(payload, bytes):
-            payload = payload.decode('utf-8')
-        
-        new_payload = orjson.loads(payload)
+        if isinstance(payload, MqttMessage):
+            new_payload = payload.json # Decoded once, shared with the router's callbacks
+        else:
+            if isinstance(payload, bytes):
+                payload = payload.decode('utf-8')
+            new_payload = orjson.loads(payload)
         debug_logger(message="🧑‍⚖️ Payload decoded. Now, to the Judge!", **_get_log_args())
 
         if state_comparator.should_update(topic, new_payload, current_cache):
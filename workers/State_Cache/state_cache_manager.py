@@ -14,6 +14,7 @@ from . import cache_traffic_controller
 from . import gui_state_restorer
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_message import MqttMessage
 
 current_version = "20251230.230400.1"
 current_version_hash = (20251230 * 230400 * 1)
@@ -58,11 +59,11 @@ class StateCacheManager:
         """
         Calls Traffic Controller -> Calls IO Save (if changed) -> Calls router.
         """
-        topic = msg.topic
-        payload = msg.payload
+        message = MqttMessage.from_paho(msg) # The one parsed view every later stage shares
+        topic = message.topic
         debug_logger(message=f"🌀 Topic: {topic}", **_get_log_args())
 
-        should_process, new_payload = cache_traffic_controller.process_traffic(topic, payload, self.cache)
+        should_process, new_payload = cache_traffic_controller.process_traffic(topic, message, self.cache)
 
         if should_process:
             debug_logger(message="🏋️ This is heavy! The timeline has been altered. Recording the new event.", **_get_log_args())
@@ -73,6 +74,6 @@ class StateCacheManager:
 
         if self.subscriber_router:
             debug_logger(message="⏩ Forwarding the temporal flux to the main timeline...", **_get_log_args())
-            self.subscriber_router._on_message(client, userdata, msg)
+            self.subscriber_router._on_message(client, userdata, message)
         else:
             debug_logger(message="🤷 Nowhere to route the temporal flux! The subscriber router is missing!", **_get_log_args())
\ No newline at end of file
@@ -1,8 +1,8 @@
 # workers/worker_active_marker_tune_and_collect.py
 
-Current_Date = 20251129  ##Update on the day the change was made
-Current_Time = 120000  ## update at the time it was edited and compiled
-Current_iteration = 1 ## a running version number - incriments by one each time 
+Current_Date = 20251230  ##Update on the day the change was made
+Current_Time = 160000  ## update at the time it was edited and compiled
+Current_iteration = 2 ## a running version number - incriments by one each time 
 
 current_version = f"{Current_Date}.{Current_Time}.{Current_iteration}"
 current_version_hash = (Current_Date * Current_Time * Current_iteration)
@@ -28,13 +28,20 @@ import os
 import inspect
 import orjson
 import pathlib
+import re
 import threading
 import time
+import uuid
+from collections import deque
 
 # --- Module Imports ---
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
 from workers.mqtt.worker_mqtt_controller_util import MqttControllerUtility
+from workers.active.worker_active_sweep_planner import plan_sweep_windows, DEFAULT_MAX_SWEEP_SPAN_MHZ
+from workers.markers.marker_store import MarkerStore
+from workers.setup.config_reader import Config # Import the Config class
+app_constants = Config.get_instance() # Get the singleton instance
 
 
 # --- Global Scope Variables ---
@@ -51,6 +58,13 @@ LOCAL_DEBUG_ENABLE = False
 
 # --- NEW CONSTANT: Frequency Buffer (in MHz) ---
 BUFFER_START_STOP_MHZ = 0.1
+# Widest span swept in one window; markers further apart are split into several windows.
+MAX_SWEEP_SPAN_MHZ = DEFAULT_MAX_SWEEP_SPAN_MHZ
+
+# --- Flow control: advance on completion, these are only upper bounds ---
+OPC_TIMEOUT_S = 2.0
+NAB_TIMEOUT_S = 2.0
+SWEEP_STATS_HISTORY = 50
 
 # --- MQTT Topic Constants (UPDATED FOR /IDENTITY NESTING) ---
 # Control Topics
@@ -62,9 +76,6 @@ TOPIC_TOTAL_DEVICES = f"{TOPIC_MARKERS_ROOT}/total_devices"
 TOPIC_MIN_FREQ = f"{TOPIC_MARKERS_ROOT}/min_frequency_mhz"
 TOPIC_MAX_FREQ = f"{TOPIC_MARKERS_ROOT}/max_frequency_mhz"
 
-# FIX: Update topic to search for frequency inside the /IDENTITY node
-TOPIC_DEVICE_FREQ_WILDCARD = f"{TOPIC_MARKERS_ROOT}/+/IDENTITY/FREQ_MHZ"
-
 
 # YAK Frequency Topics
 TOPIC_FREQ_START_INPUT = "OPEN-AIR/yak/Frequency/rig/Rig_freq_start_stop/Input/start_freq/value"
@@ -77,7 +88,14 @@ TOPIC_MARKER_PLACE_TRIGGER = "OPEN-AIR/yak/Markers/beg/Beg_Place_All_markers/scp
 
 # YAK Marker Value Retrieval (NAB) Topics
 TOPIC_MARKER_NAB_TRIGGER = "OPEN-AIR/yak/Markers/nab/NAB_all_marker_settings/scpi_details/Execute Command/trigger"
-TOPIC_MARKER_NAB_OUTPUT_WILDCARD = "OPEN-AIR/yak/Markers/nab/NAB_all_marker_settings/Outputs/Marker_*/value"
+TOPIC_MARKER_NAB_OUTPUT_WILDCARD = "OPEN-AIR/yak/Markers/nab/NAB_all_marker_settings/Outputs/+/value"
+
+# Proxy topics used for *OPC? completion queries
+TOPIC_PROXY_TX_INBOX = "OPEN-AIR/Proxy/Tx_Inbox"
+TOPIC_PROXY_RX_OUTBOX = "OPEN-AIR/Proxy/Rx_Outbox"
+
+# Per-pass timing, for comparing planner passes
+TOPIC_SWEEP_CYCLE_STATS = f"{TOPIC_MARKERS_ROOT}/sweep_cycle"
 
 
 class MarkerGoGetterWorker:
@@ -101,6 +119,9 @@ class MarkerGoGetterWorker:
         self.total_devices = 0
         self.min_frequency_mhz = 0.0
         self.max_frequency_mhz = 0.0
+        # Marker frequencies come from the shared marker store (MARKERS.csv), keyed by the
+        # same Device-NNN ids the repository publishes; refreshed at the start of each pass.
+        self.marker_store = MarkerStore.get_instance()
         self.marker_frequencies = {}
         
         # New variables to track frequency state for conditional updates
@@ -110,6 +131,15 @@ class MarkerGoGetterWorker:
 
         # For flow control signaling
         self.peaks_received_event = threading.Event() 
+        self.expected_peak_markers = set()
+        self.expected_peak_markers_lock = threading.Lock() # Filled by the processing loop, emptied by MQTT callbacks
+        self.pending_opc = {} # correlation_id -> threading.Event
+        self.pending_opc_lock = threading.Lock()
+
+        # The span the analyzer is currently tuned to, so unchanged windows are not re-sent
+        self.current_span = None
+        self.pass_count = 0
+        self.sweep_cycle_history = deque(maxlen=SWEEP_STATS_HISTORY)
 
         self._setup_subscriptions()
 
@@ -119,23 +149,61 @@ class MarkerGoGetterWorker:
         self.mqtt_util.add_subscriber(TOPIC_TOTAL_DEVICES, self._on_marker_data_update)
         self.mqtt_util.add_subscriber(TOPIC_MIN_FREQ, self._on_marker_data_update)
         self.mqtt_util.add_subscriber(TOPIC_MAX_FREQ, self._on_marker_data_update)
-        # FIX: Subscribes to the new wildcard topic for marker frequency
-        self.mqtt_util.add_subscriber(TOPIC_DEVICE_FREQ_WILDCARD, self._on_marker_data_update)
         
         # Subscribe to the NAB outputs directly to set the flow control event.
         # FIXED: This method was missing but is now the target of the NAB outputs.
         self.mqtt_util.add_subscriber(TOPIC_MARKER_NAB_OUTPUT_WILDCARD, self._on_peak_update_for_event_set)
+        self.mqtt_util.add_subscriber(TOPIC_PROXY_RX_OUTBOX, self._on_proxy_response)
         
         debug_logger(message="✅ Go-Getter is now listening for commands and marker data.")
 
 
     def _on_peak_update_for_event_set(self, topic, payload):
         """
-        A placeholder method to satisfy the subscription. In a non-mock setup,
-        this would signal a threading event to continue the main processing loop.
+        Ticks off each Marker_N output of the NAB query; once every marker of the
+        current batch has reported, the processing loop moves on.
         """
-        self.peaks_received_event.set()
-        
+        match = re.search(r"/Outputs/Marker_(\d+)/value$", topic)
+        if not match:
+            return
+        with self.expected_peak_markers_lock:
+            if not self.expected_peak_markers:
+                return # No query outstanding
+            self.expected_peak_markers.discard(int(match.group(1)))
+            if not self.expected_peak_markers:
+                self.peaks_received_event.set()
+
+    def _on_proxy_response(self, topic, payload):
+        # Releases the waiter of a matching *OPC? query.
+        try:
+            correlation_id = orjson.loads(payload).get("correlation_id")
+        except (orjson.JSONDecodeError, AttributeError):
+            return
+        with self.pending_opc_lock:
+            event = self.pending_opc.pop(correlation_id, None)
+        if event is not None:
+            event.set()
+
+    def _wait_for_opc(self, what):
+        """
+        Sends *OPC? through the proxy and blocks until the instrument answers, i.e.
+        until every previously sent command has completed. Returns the wait in seconds.
+        """
+        correlation_id = f"opc-{uuid.uuid4()}"
+        event = threading.Event()
+        with self.pending_opc_lock:
+            self.pending_opc[correlation_id] = event
+
+        started = time.perf_counter()
+        request = {"command": "*OPC?", "query": True, "correlation_id": correlation_id}
+        self.mqtt_util.publish_message(topic=TOPIC_PROXY_TX_INBOX, subtopic="", value=orjson.dumps(request).decode('utf-8'), retain=False)
+
+        if not event.wait(OPC_TIMEOUT_S):
+            with self.pending_opc_lock:
+                self.pending_opc.pop(correlation_id, None)
+            debug_logger(message=f"🟡 No *OPC? answer after {what} within {OPC_TIMEOUT_S} s. Continuing.")
+        return time.perf_counter() - started
+
     def _on_marker_data_update(self, topic, payload):
         # Callback to update internal state from the markers repository.
         try:
@@ -151,13 +219,6 @@ class MarkerGoGetterWorker:
                 self.min_frequency_mhz = float(value)
             elif topic == TOPIC_MAX_FREQ:
                 self.max_frequency_mhz = float(value)
-            # FIX: Check if the topic structure matches a device frequency update inside /IDENTITY
-            elif topic.endswith("/IDENTITY/FREQ_MHZ"):
-                topic_parts = topic.split('/')
-                # The Device-XXX ID is the third part from the end: .../Device-XXX/IDENTITY/FREQ_MHZ
-                if len(topic_parts) >= 4 and topic_parts[-3].startswith("Device-"):
-                    device_id = topic_parts[-3]
-                    self.marker_frequencies[device_id] = float(value)
         except (orjson.JSONDecodeError, ValueError, TypeError) as e:
             debug_logger(message=f"🟡 Warning: Could not process marker data update from topic '{topic}': {e}")
 
@@ -213,15 +274,12 @@ class MarkerGoGetterWorker:
 
                 )
         
-        time.sleep(0.2) # Short delay to let the place markers inputs set
-
         # --- 2. Trigger Place Markers command to set them on device ---
         self.mqtt_util.publish_message(TOPIC_MARKER_PLACE_TRIGGER, "", True, retain=False)
         self.mqtt_util.publish_message(TOPIC_MARKER_PLACE_TRIGGER, "", False, retain=False)
         
-        # --- 3. CRITICAL FIX: Add recovery sleep to allow the crash to clear ---
-        debug_logger(message="🟠 Recovering after Marker Placement to clear potential downstream crash...")
-        time.sleep(0.3) # Allow 4 seconds for the internal exception/crash to resolve
+        # --- 3. Wait until the instrument has actually placed them ---
+        self._wait_for_opc("marker placement")
         
     def _query_markers_for_batch(self, batch_ids):
         """
@@ -230,94 +288,107 @@ class MarkerGoGetterWorker:
         current_function_name = inspect.currentframe().f_code.co_name
         
         # --- 1. Trigger NAB to collect current peaks ---
+        with self.expected_peak_markers_lock:
+            self.expected_peak_markers = set(range(1, len(batch_ids) + 1))
+            self.peaks_received_event.clear()
         debug_logger(message="🔵 Sending NAB query to retrieve current peak markers...")
         self.mqtt_util.publish_message(TOPIC_MARKER_NAB_TRIGGER, "", True, retain=False)
         self.mqtt_util.publish_message(TOPIC_MARKER_NAB_TRIGGER, "", False, retain=False)
         
-        # --- 2. Flow Control: Wait for NAB query and publishing to complete ---
-        debug_logger(message="🟠 Waiting for NAB query and publishing to complete...")
-        time.sleep(0.2) # A minimal, safe wait to ensure messages hit the system.
-
-        debug_logger(message=f"✅ Peak retrieval process initiated for batch: {', '.join(batch_ids)}.")
+        # --- 2. Flow Control: Wait for the NAB outputs of this batch to come back ---
+        if not self.peaks_received_event.wait(NAB_TIMEOUT_S):
+            with self.expected_peak_markers_lock:
+                missing = sorted(self.expected_peak_markers)
+                self.expected_peak_markers = set()
+            debug_logger(message=f"🟡 NAB query timed out waiting for markers {missing}.")
+            return False
+
+        debug_logger(message=f"✅ Peaks retrieved for batch: {', '.join(batch_ids)}.")
+        return True
         
-    def _set_instrument_frequency_span(self):
+    def _tune_to_window(self, window):
         """
-        Sets the instrument to the full frequency span of all markers, 
-        but only if the min/max frequency has changed or if it's the first run.
+        Sets the instrument start/stop to the window's span, unless it is already
+        tuned there, and waits for the retune to complete. Returns True if it retuned.
         """
         current_function_name = inspect.currentframe().f_code.co_name
 
-        if (self.min_frequency_mhz == self.last_min_freq and
-            self.max_frequency_mhz == self.last_max_freq and
-            not self.first_run):
-            
+        if window.span == self.current_span:
             if app_constants.global_settings['debug_enabled']:
                 debug_logger(
-                    message="🟢️️️🟡 Min/Max frequencies unchanged. Skipping span update.",
+                    message="🟢️️️🟡 Window span unchanged. Skipping span update.",
                     file=current_file, version=current_version, function=current_function_name
-                    
-
-
                 )
-            return
+            return False
 
-        # Update last known state
-        self.last_min_freq = self.min_frequency_mhz
-        self.last_max_freq = self.max_frequency_mhz
-    
-        # --- APPLY THE BUFFER HERE ---
-        # Add buffer to the maximum frequency
-        new_max_freq = self.max_frequency_mhz + BUFFER_START_STOP_MHZ
-        # Subtract buffer from the minimum frequency (ensuring it doesn't go below zero)
-        new_min_freq = max(0, self.min_frequency_mhz - BUFFER_START_STOP_MHZ)
-        
-        debug_logger(message=f"🔵 Setting instrument span from {new_min_freq} MHz to {new_max_freq} MHz (with {BUFFER_START_STOP_MHZ} MHz buffer).")
-        self.mqtt_util.publish_message(TOPIC_FREQ_START_INPUT, "", int(new_min_freq * HZ_TO_MHZ), retain=True)
-        self.mqtt_util.publish_message(TOPIC_FREQ_STOP_INPUT, "", int(new_max_freq * HZ_TO_MHZ), retain=True)
+        debug_logger(message=f"🔵 Setting instrument span from {window.start_mhz} MHz to {window.stop_mhz} MHz for {len(window.device_ids)} markers.")
+        self.mqtt_util.publish_message(TOPIC_FREQ_START_INPUT, "", int(window.start_mhz * HZ_TO_MHZ), retain=True)
+        self.mqtt_util.publish_message(TOPIC_FREQ_STOP_INPUT, "", int(window.stop_mhz * HZ_TO_MHZ), retain=True)
         self.mqtt_util.publish_message(TOPIC_FREQ_TRIGGER, "", True, retain=False)
         self.mqtt_util.publish_message(TOPIC_FREQ_TRIGGER, "", False, retain=False)
-        time.sleep(0.1) # Short delay to let the frequency rig command process
-        
-        self.first_run = False
-        debug_logger(message="✅ Instrument span set successfully.")
-        
+        self._wait_for_opc("span change")
+
+        self.current_span = window.span
+        return True
+
+    def _refresh_marker_frequencies(self):
+        """Reloads MARKERS.csv into the marker store if it changed and returns the marker frequencies."""
+        self.marker_store.load_csv()
+        self.marker_frequencies = self.marker_store.device_frequencies()
+        return self.marker_frequencies
+
+    def _run_sweep_pass(self):
+        """One pass over every marker, window by window. Returns the pass statistics."""
+        started = time.perf_counter()
+        # Alternate direction so each pass starts where the previous one ended.
+        windows = plan_sweep_windows(
+            dict(self.marker_frequencies),
+            max_span_mhz=MAX_SWEEP_SPAN_MHZ,
+            buffer_mhz=BUFFER_START_STOP_MHZ,
+            reverse=bool(self.pass_count % 2)
+        )
 
+        stats = {"pass": self.pass_count + 1, "windows": len(windows), "markers": 0, "batches": 0, "retunes": 0, "timeouts": 0}
+        for window in windows:
+            if self.stop_event.is_set():
+                debug_logger(message="Loop terminated by STOP command during batch processing.")
+                break
 
-    def _processing_loop(self):
-        # The main logic loop that runs in a thread.
-        debug_logger(message="✅ Peak Hunter loop started.")
-        
-        # --- Loop Control: Check the stop event first ---
-        while not self.stop_event.is_set():
-            # NOTE: Removed redundant check on TOPIC_START_STOP as stop_event handles thread control.
-            
-            # --- Step 1: Set the instrument to the full frequency span of all markers (Conditional) ---
-            self._set_instrument_frequency_span()
-            
-            # --- Step 2: Loop through markers in batches of 6 ---
-            device_ids = sorted(self.marker_frequencies.keys())
+            if self._tune_to_window(window):
+                stats["retunes"] += 1
 
-            for i in range(0, len(device_ids), 6):
+            for batch_ids in window.marker_batches:
                 if self.stop_event.is_set():
-                    debug_logger(message="Loop terminated by STOP command during batch processing.")
                     break
-
-                batch_ids = device_ids[i:i+6]
-                
-                # Use the dedicated modular function to handle marker placement
                 self._place_markers_for_batch(batch_ids=batch_ids)
+                if not self._query_markers_for_batch(batch_ids=batch_ids):
+                    stats["timeouts"] += 1
+                stats["batches"] += 1
+                stats["markers"] += len(batch_ids)
 
-                # --- DELAY as requested ---
-                time.sleep(0.5)
-                
-                # Use the dedicated modular function to query the batch
-                self._query_markers_for_batch(batch_ids=batch_ids)
+        stats["cycle_ms"] = round((time.perf_counter() - started) * 1000.0, 1)
+        self.pass_count += 1
+        return stats
 
-                # --- Confirmation log and flow control ---
-                debug_logger(message=f"✅ Batch {i//6 + 1} processed. Continuing to next batch.")
+    def _processing_loop(self):
+        # The main logic loop that runs in a thread.
+        debug_logger(message="✅ Peak Hunter loop started.")
+        self.current_span = None
+        
+        # --- Loop Control: Check the stop event first ---
+        while not self.stop_event.is_set():
+            if not self._refresh_marker_frequencies():
+                self.stop_event.wait(0.5) # Nothing to measure until MARKERS.csv has markers
+                continue
 
+            stats = self._run_sweep_pass()
+            self.sweep_cycle_history.append(stats)
+            self.mqtt_util.publish_message(topic=TOPIC_SWEEP_CYCLE_STATS, subtopic="", value=orjson.dumps(stats).decode('utf-8'), retain=False)
 
-            debug_logger(message="✅ Peak Hunter loop finished a full pass.")
+            debug_logger(
+                message=f"⏱️ Peak Hunter pass {stats['pass']}: {stats['markers']} markers in {stats['windows']} windows "
+                        f"({stats['retunes']} retunes, {stats['batches']} batches, {stats['timeouts']} timeouts) took {stats['cycle_ms']} ms."
+            )
             
 
 
@@ -0,0 +1,95 @@
+# workers/active/worker_active_sweep_planner.py
+#
+# Plans a marker peak-collection pass. Markers are clustered by frequency into
+# span windows the analyzer can cover in one sweep; each window is tuned once and
+# its markers are placed up to six at a time. Windows are visited in frequency
+# order, alternating direction between passes, so the analyzer never jumps back
+# across the band to start the next pass.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1600.1
+
+import numpy as np
+
+current_version = "20251230.1600.1"
+current_version_hash = (20251230 * 1600 * 1)
+
+# The instrument exposes six markers.
+MAX_MARKERS_PER_PLACEMENT = 6
+# Widest span we are willing to sweep for peak readings before resolution suffers.
+DEFAULT_MAX_SWEEP_SPAN_MHZ = 100.0
+# Margin added either side of the outermost markers in a window.
+DEFAULT_WINDOW_BUFFER_MHZ = 0.1
+
+
+class SweepWindow:
+    """One analyzer span and the marker batches read while it is tuned."""
+
+    def __init__(self, start_mhz, stop_mhz, device_ids):
+        self.start_mhz = start_mhz
+        self.stop_mhz = stop_mhz
+        self.device_ids = device_ids
+        self.marker_batches = [
+            device_ids[i:i + MAX_MARKERS_PER_PLACEMENT]
+            for i in range(0, len(device_ids), MAX_MARKERS_PER_PLACEMENT)
+        ]
+
+    @property
+    def span(self):
+        return (self.start_mhz, self.stop_mhz)
+
+    def __repr__(self):
+        return f"SweepWindow({self.start_mhz:.3f}-{self.stop_mhz:.3f} MHz, {len(self.device_ids)} markers)"
+
+
+def plan_sweep_windows(marker_frequencies, max_span_mhz=DEFAULT_MAX_SWEEP_SPAN_MHZ, buffer_mhz=DEFAULT_WINDOW_BUFFER_MHZ, reverse=False):
+    """
+    Clusters {device_id: freq_mhz} into SweepWindows of at most 'max_span_mhz'
+    (buffer included), greedily from the lowest frequency up. Invalid or
+    non-positive frequencies are skipped. With 'reverse' the windows, and the
+    markers inside them, are returned from the top of the band down.
+    """
+    if not marker_frequencies:
+        return []
+
+    device_ids = list(marker_frequencies.keys())
+    freqs = np.array([_as_mhz(marker_frequencies[device_id]) for device_id in device_ids], dtype=np.float64)
+    valid = np.flatnonzero(freqs > 0)
+    order = valid[np.argsort(freqs[valid], kind="stable")]
+    sorted_freqs = freqs[order]
+
+    # Leave room for the buffer on both sides; a lone marker always gets its own window.
+    usable_span = max(max_span_mhz - 2 * buffer_mhz, 0.0)
+
+    windows = []
+    first = 0
+    while first < len(order):
+        # Every marker within usable_span of the window's lowest one joins the window.
+        last = int(np.searchsorted(sorted_freqs, sorted_freqs[first] + usable_span, side="right"))
+        window_ids = [device_ids[i] for i in order[first:last]]
+        start_mhz = max(0.0, float(sorted_freqs[first]) - buffer_mhz)
+        stop_mhz = float(sorted_freqs[last - 1]) + buffer_mhz
+        if reverse:
+            window_ids.reverse()
+        windows.append(SweepWindow(start_mhz, stop_mhz, window_ids))
+        first = last
+
+    if reverse:
+        windows.reverse()
+    return windows
+
+
+def _as_mhz(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
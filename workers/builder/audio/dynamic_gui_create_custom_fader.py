@@ -14,6 +14,7 @@ from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 
 class CustomFaderFrame(tk.Frame):
     def __init__(self, master, variable, config, path, state_mirror_engine, command):
@@ -48,6 +49,8 @@ class CustomFaderFrame(tk.Frame):
         self.state_mirror_engine = state_mirror_engine
         self.command = command # The function to call when value changes (e.g., on_drag_or_click)
         self.temp_entry = None # Initialize temp_entry
+        self.drawn_size = None # Canvas size the static scale was last drawn at
+        self.handle_y = 0.0 # Current y offset of the items tagged "handle"
 
     def _jump_to_reff_point(self, event):
         """
@@ -209,7 +212,9 @@ class CustomFaderCreatorMixin:
             value_label = ttk.Label(frame, text=f"{int(fader_value_var.get())}", font=("Helvetica", 8))
             value_label.pack(side=tk.BOTTOM)
 
-            def on_fader_value_change(*args):
+            render_scheduler = GuiRenderScheduler.get_instance(canvas)
+
+            def redraw_fader():
                 current_fader_val = fader_value_var.get()
                 
                 self._draw_fader(frame, canvas, canvas.winfo_width(), canvas.winfo_height(), 
@@ -224,17 +229,20 @@ class CustomFaderCreatorMixin:
                 else:
                     active_color = "white" # Hardcoded for now, could be frame.handle_col
                 value_label.config(text=f"{int(current_fader_val)}", foreground=active_color)
+
+            def on_fader_value_change(*args):
+                render_scheduler.request_redraw(canvas, redraw_fader)
                 
                 if app_constants.global_settings['debug_enabled']:
                     debug_logger(
-                        message=f"⚡ fluxing... Custom Fader '{frame.label_text}' updated visually to {current_fader_val} from MQTT.",
+                        message=f"⚡ fluxing... Custom Fader '{frame.label_text}' updated visually to {fader_value_var.get()} from MQTT.",
                         **_get_log_args()
                     )
 
             fader_value_var.trace_add("write", on_fader_value_change)
             
             # Initial draw based on default value
-            on_fader_value_change()
+            redraw_fader()
 
             # Interaction
             canvas.bind("<B1-Motion>", frame.command)
@@ -245,7 +253,7 @@ class CustomFaderCreatorMixin:
             canvas.bind("<Alt-Button-1>", frame._open_manual_entry)
 
             # Handle Resize
-            canvas.bind("<Configure>", lambda e: on_fader_value_change()) # Redraw on resize
+            canvas.bind("<Configure>", lambda e: render_scheduler.request_redraw(canvas, redraw_fader)) # Redraw on resize
 
             # Register the StringVar with the StateMirrorEngine for MQTT updates
             if path:
@@ -299,18 +307,21 @@ class CustomFaderCreatorMixin:
         return canvas.create_polygon(points, **kwargs, smooth=True)
 
     def _draw_fader(self, frame_instance, canvas, width, height, value):
+        """Moves the fader cap to 'value', rebuilding the static scale only when the canvas size changed."""
         if app_constants.global_settings['debug_enabled']:
             debug_logger(
                 message=f"🎨 Drawing fader: value={value}, min_val={frame_instance.min_val}, max_val={frame_instance.max_val}, height={height}",
                 **_get_log_args()
             )
-        canvas.delete("all")        
-        # Center Line
         cx = width / 2
-        
-        # Track (Groove)
-        canvas.create_line(cx, 10, cx, height-10, fill=frame_instance.track_col, width=4, capstyle=tk.ROUND)
-        
+
+        if frame_instance.drawn_size != (width, height):
+            canvas.delete("all")
+            self._draw_fader_scale(frame_instance, canvas, width, height)
+            self._draw_fader_cap(frame_instance, canvas, cx)
+            frame_instance.drawn_size = (width, height)
+            frame_instance.handle_y = 0.0
+
         # Calculate handle position based on logarithmic scale
         # Normalize the current value to a 0-1 range (0 for min_val, 1 for max_val)
         norm_value = (value - frame_instance.min_val) / (frame_instance.max_val - frame_instance.min_val) if (frame_instance.max_val - frame_instance.min_val) != 0 else 0
@@ -328,6 +339,17 @@ class CustomFaderCreatorMixin:
 
         # Scale to canvas coordinates
         handle_y = (height - 20) * handle_y_norm + 10
+
+        # Slide the existing cap instead of redrawing it
+        canvas.move("handle", 0, handle_y - frame_instance.handle_y)
+        frame_instance.handle_y = handle_y
+
+    def _draw_fader_scale(self, frame_instance, canvas, width, height):
+        # Center Line
+        cx = width / 2
+        
+        # Track (Groove)
+        canvas.create_line(cx, 10, cx, height-10, fill=frame_instance.track_col, width=4, capstyle=tk.ROUND)
         
         # Draw Tick Marks
         tick_color = "light grey"  # User requested light grey
@@ -376,31 +398,24 @@ class CustomFaderCreatorMixin:
             # Draw tick value label for every other tick
             if i % 2 == 0:
                 canvas.create_text(cx + 15, tick_y_pos, text=str(int(tick_value)), fill=tick_color, anchor="w")
-        
-        # Determine active_color based on norm_value (using the actual norm_value, not display_norm_pos)
-        if abs(norm_value) < 0.01:
-            active_color = frame_instance.neutral_color # Neutral color
-        elif norm_value > 0:
-            active_color = "red"
-        else:
-            active_color = "white"
 
-        # Handle (Fader Cap)
+    def _draw_fader_cap(self, frame_instance, canvas, cx):
+        # Handle (Fader Cap), drawn around y=0 and moved into place by _draw_fader
         cap_width = 40 # Set fixed cap width to 40 pixels
         cap_height = 50
         self._draw_rounded_rectangle(
             canvas,
-            cx - cap_width/2, handle_y - cap_height/2,
-            cx + cap_width/2, handle_y + cap_height/2,
+            cx - cap_width/2, -cap_height/2,
+            cx + cap_width/2, cap_height/2,
             radius=10,
-            fill=frame_instance.handle_col, outline=frame_instance.track_col
+            fill=frame_instance.handle_col, outline=frame_instance.track_col, tags="handle"
         )
         # Center line
         center_line_length = cap_width * 0.9
-        canvas.create_line(cx - center_line_length/2, handle_y, cx + center_line_length/2, handle_y, fill=frame_instance.track_col, width=2)
+        canvas.create_line(cx - center_line_length/2, 0, cx + center_line_length/2, 0, fill=frame_instance.track_col, width=2, tags="handle")
         
         # 60% lines at 25% and 75% of height
         side_line_length = cap_width * 0.6
         y_offset = cap_height * 0.25
-        canvas.create_line(cx - side_line_length/2, handle_y - y_offset, cx + side_line_length/2, handle_y - y_offset, fill=frame_instance.track_col, width=1)
-        canvas.create_line(cx - side_line_length/2, handle_y + y_offset, cx + side_line_length/2, handle_y + y_offset, fill=frame_instance.track_col, width=1)
\ No newline at end of file
+        canvas.create_line(cx - side_line_length/2, -y_offset, cx + side_line_length/2, -y_offset, fill=frame_instance.track_col, width=1, tags="handle")
+        canvas.create_line(cx - side_line_length/2, y_offset, cx + side_line_length/2, y_offset, fill=frame_instance.track_col, width=1, tags="handle")
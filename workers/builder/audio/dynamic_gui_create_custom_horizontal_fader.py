@@ -11,6 +11,7 @@ app_constants = Config.get_instance()
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic
 
@@ -146,14 +147,15 @@ class CustomHorizontalFaderCreatorMixin:
             self._draw_horizontal_fader(frame, canvas, canvas.winfo_width(), canvas.winfo_height(), current_fader_val)
             value_label.config(text=f"{int(current_fader_val)}")
 
-        fader_value_var.trace_add("write", on_fader_value_change)
+        render_scheduler = GuiRenderScheduler.get_instance(canvas)
+        render_scheduler.watch(fader_value_var, canvas, on_fader_value_change)
         on_fader_value_change()
 
         canvas.bind("<B1-Motion>", frame.command)
         canvas.bind("<Button-1>", frame.command)
         canvas.bind("<Control-Button-1>", frame._jump_to_reff_point)
         canvas.bind("<Alt-Button-1>", frame._open_manual_entry)
-        canvas.bind("<Configure>", lambda e: on_fader_value_change())
+        canvas.bind("<Configure>", lambda e: render_scheduler.mark_dirty(canvas))
 
         if path:
             widget_id = path
@@ -12,6 +12,7 @@ app_constants = Config.get_instance()
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
 from workers.styling.style import THEMES, DEFAULT_THEME
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 import os
 
 class CustomKnobFrame(ttk.Frame):
@@ -185,20 +186,27 @@ class KnobCreatorMixin:
             value_label = ttk.Label(frame, text=f"{int(knob_value_var.get())}", font=("Helvetica", 8))
             value_label.pack(side=tk.BOTTOM)
 
-            def update_knob_visuals(*args, neutral_color_val=fg_color, accent_for_arc_val=accent_color, indicator_color_val=indicator_color, secondary_val=secondary_color):
+            # Static artwork is created once; value changes only move the pointer and active arc.
+            knob_items = self._build_knob_artwork(canvas, width, height, secondary_color, indicator_color)
+            render_scheduler = GuiRenderScheduler.get_instance(canvas)
+
+            def redraw_knob(neutral_color_val=fg_color, accent_for_arc_val=accent_color, indicator_color_val=indicator_color, secondary_val=secondary_color):
                 current_knob_val = knob_value_var.get()
                 value_label.config(text=f"{int(current_knob_val)}")
-                self._draw_knob(canvas, width, height, current_knob_val, frame.min_val, frame.max_val, value_label, neutral_color_val, accent_for_arc_val, indicator_color_val, secondary_val)
+                self._draw_knob(canvas, knob_items, width, height, current_knob_val, frame.min_val, frame.max_val, value_label, neutral_color_val, accent_for_arc_val, indicator_color_val, secondary_val)
+
+            def update_knob_visuals(*args):
+                render_scheduler.request_redraw(canvas, redraw_knob)
                 if app_constants.global_settings['debug_enabled']:
                     debug_logger(
-                        message=f"⚡ fluxing... Knob '{label}' updated visually to {current_knob_val} from MQTT.",
+                        message=f"⚡ fluxing... Knob '{label}' updated visually to {knob_value_var.get()} from MQTT.",
                         **_get_log_args()
                     )
 
             knob_value_var.trace_add("write", update_knob_visuals)
             
             # Initial draw based on default value
-            update_knob_visuals()
+            redraw_knob()
 
             # Drag Interaction
             canvas.bind("<Button-1>", on_knob_press)
@@ -238,49 +246,50 @@ class KnobCreatorMixin:
             debug_logger(message=f"❌ The knob '{label}' shattered! Error: {e}")
             return None
 
-    def _draw_knob(self, canvas, width, height, value, min_val, max_val, value_label, neutral_color, accent_for_arc, indicator_color, secondary):
-        canvas.delete("all")
+    def _build_knob_artwork(self, canvas, width, height, secondary, indicator_color):
+        """Creates the knob's canvas items once and returns their ids for _draw_knob to update."""
         cx, cy = width / 2, height / 2
-        radius = min(width, height) / 2 - 5
 
-        # 1. Background Arc (The Track)
+        # 1. Background Arc (The Track) - 300 degrees total travel, never changes
+        track = canvas.create_arc(5, 5, width-5, height-5, start=240, extent=-300, style=tk.ARC, outline=secondary, width=4)
+
+        # 2. Moving items, positioned by _draw_knob
+        active_arc = canvas.create_arc(5, 5, width-5, height-5, start=240, extent=0, style=tk.ARC, outline=indicator_color, width=4)
+        pointer = canvas.create_line(cx, cy, cx, cy, fill=indicator_color, width=2, capstyle=tk.ROUND)
+        center = canvas.create_oval(cx-4, cy-4, cx+4, cy+4, fill=indicator_color, outline=indicator_color)
+
+        return {"track": track, "active_arc": active_arc, "pointer": pointer, "center": center}
+
+    def _draw_knob(self, canvas, items, width, height, value, min_val, max_val, value_label, neutral_color, accent_for_arc, indicator_color, secondary):
+        cx, cy = width / 2, height / 2
+        radius = min(width, height) / 2 - 5
         start_angle_bg = 240
-        extent_bg = -300 # 300 degrees total travel
-        canvas.create_arc(5, 5, width-5, height-5, start=start_angle_bg, extent=extent_bg, style=tk.ARC, outline=secondary, width=4)
 
-        # 2. Calculate Normalized Value (0.0 to 1.0)
+        # 1. Calculate Normalized Value (0.0 to 1.0)
         norm_val_0_1 = (value - min_val) / (max_val - min_val) if max_val > min_val else 0
 
         # Map to -1.0 to 1.0 for Polarity Pan-Pot logic if center is 0
         norm_val = (norm_val_0_1 * 2) - 1 if (min_val < 0 and max_val >= 0) else norm_val_0_1
         
-        # 3. Determine Dynamic Color & Arc Extent
-        start_angle_active = 240 # Same start as background for the active arc
+        # 2. Determine Dynamic Color & Arc Extent
         extent_total_knob = -300 # Total travel for active arc
 
-        # Determine active_color based on norm_val, similar to Panner
         # For the knob, the active color (arc and label) should always be the indicator_color unless at dead center 
         if abs(norm_val) < 0.01 and (min_val <= 0 and max_val >= 0): # Check if center is 0
             active_color = neutral_color # For the dead center tick mark, use neutral
             val_extent = 0 # No active arc for dead center
-            # The label should also be neutral when dead center and this is a center-0 knob
-            value_label.config(foreground=active_color) 
         else:
             active_color = indicator_color # Always use indicator_color for active knob state (arc and label)
             val_extent = extent_total_knob * norm_val_0_1 # Use 0-1 norm_val for full range
-            value_label.config(foreground=active_color) # Apply indicator color to the label
+        value_label.config(foreground=active_color)
 
-        canvas.create_arc(5, 5, width-5, height-5, start=start_angle_active, extent=val_extent, style=tk.ARC, outline=active_color, width=4)
+        canvas.itemconfig(items["active_arc"], extent=val_extent, outline=active_color)
 
-        # 4. The Pointer Line
+        # 3. The Pointer Line
         angle_rad = math.radians(start_angle_bg + val_extent)
         px = cx + radius * math.cos(angle_rad)
         py = cy - radius * math.sin(angle_rad) # Canvas Y is inverted
-        canvas.create_line(cx, cy, px, py, fill=indicator_color, width=2, capstyle=tk.ROUND)
+        canvas.coords(items["pointer"], cx, cy, px, py)
         
         # Center circle
-        canvas.create_oval(cx-4, cy-4, cx+4, cy+4, fill=active_color, outline=active_color)
-        
-        # Update the label's color
-        # This line is now redundant as it's handled in the if/else block above
-        # value_label.config(foreground=active_color)
\ No newline at end of file
+        canvas.itemconfig(items["center"], fill=active_color, outline=active_color)
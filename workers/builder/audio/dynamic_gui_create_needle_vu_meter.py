@@ -14,6 +14,7 @@ from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic # <--- ADD THIS LINE
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 
 class NeedleVUMeterCreatorMixin:
     def _create_needle_vu_meter(self, parent_frame, label, config, path, base_mqtt_topic_from_path, state_mirror_engine, subscriber_router):
@@ -51,16 +52,23 @@ class NeedleVUMeterCreatorMixin:
             canvas = tk.Canvas(frame, width=size, height=size/2 + 20, bg=bg_color, highlightthickness=0)
             canvas.pack()
 
+            # Scale, arcs and pivot are drawn once; only the needle moves afterwards.
+            self._draw_needle_vu_scale(
+                canvas, size, min_val, max_val, red_zone_start,
+                accent_color, secondary_color, fg_color, danger_color
+            )
+            render_scheduler = GuiRenderScheduler.get_instance(canvas)
+
+            def redraw_needle():
+                self._draw_needle_vu_meter(canvas, size, vu_value_var.get(), min_val, max_val)
+
             def update_visuals(*args):
-                self._draw_needle_vu_meter(
-                    canvas, size, vu_value_var.get(), min_val, max_val, red_zone_start,
-                    accent_color, secondary_color, fg_color, danger_color
-                )
+                render_scheduler.request_redraw(canvas, redraw_needle)
 
             vu_value_var.trace_add("write", update_visuals)
             
             # Initial Draw
-            update_visuals()
+            redraw_needle()
 
             if path:
                 widget_id = path
@@ -95,7 +103,7 @@ class NeedleVUMeterCreatorMixin:
                 )
             return None
 
-    def _draw_needle_vu_meter(self, canvas, size, value, min_val, max_val, red_zone_start, accent, secondary, fg, danger):
+    def _draw_needle_vu_scale(self, canvas, size, min_val, max_val, red_zone_start, accent, secondary, fg, danger):
         canvas.delete("all")
         width = size
         height = size / 2 + 20
@@ -157,7 +165,26 @@ class NeedleVUMeterCreatorMixin:
             style=tk.ARC, outline=danger, width=arc_thickness
         )
 
-        # --- Draw Needle ---
+        # --- Draw Needle (parked at the pivot; positioned by _draw_needle_vu_meter) ---
+        canvas.create_line(center_x, center_y, center_x, center_y, width=3, fill=accent, capstyle=tk.ROUND, tags="needle")
+        
+        # --- Draw Pivot ---
+        canvas.create_oval(center_x - 5, center_y - 5, center_x + 5, center_y + 5, fill=fg, outline=secondary)
+
+    def _draw_needle_vu_meter(self, canvas, size, value, min_val, max_val):
+        width = size
+        height = size / 2 + 20
+
+        center_x = width / 2
+        center_y = height - 10 
+
+        main_arc_radius = (width - 20) / 2
+        text_offset_from_arc = 15
+
+        start_angle_deg = 135
+        end_angle_deg = 45
+        extent_deg = start_angle_deg - end_angle_deg
+
         if value < min_val: value = min_val
         if value > max_val: value = max_val
         
@@ -172,7 +199,4 @@ class NeedleVUMeterCreatorMixin:
         x = center_x + needle_total_len * math.cos(needle_angle_rad)
         y = center_y - needle_total_len * math.sin(needle_angle_rad)
         
-        canvas.create_line(center_x, center_y, x, y, width=3, fill=accent, capstyle=tk.ROUND)
-        
-        # --- Draw Pivot ---
-        canvas.create_oval(center_x - 5, center_y - 5, center_x + 5, center_y + 5, fill=fg, outline=secondary)
\ No newline at end of file
+        canvas.coords("needle", center_x, center_y, x, y)
@@ -12,6 +12,7 @@ app_constants = Config.get_instance()
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
 from workers.styling.style import THEMES, DEFAULT_THEME
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 import os
 
 class CustomPannerFrame(ttk.Frame):
@@ -193,7 +194,7 @@ class PannerCreatorMixin:
                         **_get_log_args()
                     )
 
-            panner_value_var.trace_add("write", update_panner_visuals)
+            GuiRenderScheduler.get_instance(canvas).watch(panner_value_var, canvas, update_panner_visuals)
             
             # Initial draw based on default value
             update_panner_visuals()
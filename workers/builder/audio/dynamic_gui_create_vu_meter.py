@@ -8,6 +8,7 @@ from workers.setup.config_reader import Config # Import the Config class
 app_constants = Config.get_instance() # Get the singleton instance      
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic
 
@@ -63,7 +64,7 @@ class VUMeterCreatorMixin:
                 if app_constants.global_settings['debug_enabled']:
                     debug_logger(message=f"🎶 VU meter '{label}' updated to {current_value}", **_get_log_args())
 
-            vu_value_var.trace_add("write", update_visuals)
+            GuiRenderScheduler.get_instance(canvas).watch(vu_value_var, canvas, update_visuals)
             update_visuals() # Initial draw
 
             if path:
@@ -1,158 +1,201 @@
+import time
 import tkinter as tk
 from tkinter import ttk
 import traceback
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.setup.config_reader import Config
+from workers.setup import startup_tracer
 
 app_constants = Config.get_instance()
 
+# Wall-clock budget for one build slice before yielding back to the Tk event loop.
+BUILD_SLICE_BUDGET_MS = 8.0
 
-class GuiBatchBuilderMixin:
-    """Handles recursive JSON parsing and Grid layout."""
+# Shared by every builder: widget type -> [count, total_ms, max_ms]
+_widget_build_timings = {}
 
-    def _create_widgets_in_batches(self, parent_frame, widget_configs, path_prefix="", override_cols=None, start_index=0, row_offset=0):
-        try:
-            batch_size = 5
-            index = start_index
 
-            col = 0
-            row = row_offset
-            max_cols = int(self.config_data.get("layout_columns", 1) if override_cols is None else override_cols)
+class _RecordingSubscriberRouter:
+    """The shared subscriber router as handed to one widget: notes every filter the widget subscribes to."""
 
-            current_data = self.config_data if override_cols is None else widget_configs[start_index][1]
-            column_sizing = current_data.get("column_sizing", [])
+    def __init__(self, subscriber_router, subscriptions):
+        # Some creators store the router they were given on the builder; never wrap a wrapper.
+        if isinstance(subscriber_router, _RecordingSubscriberRouter):
+            subscriber_router = subscriber_router._subscriber_router
+        self._subscriber_router = subscriber_router
+        self._subscriptions = subscriptions
 
-            for col_idx in range(max_cols):
-                sizing_info = column_sizing[col_idx] if col_idx < len(column_sizing) else {}
-                weight = sizing_info.get("weight", 1)
-                minwidth = sizing_info.get("minwidth", 0)
-                parent_frame.grid_columnconfigure(col_idx, weight=weight, minsize=minwidth)
+    def subscribe_to_topic(self, topic_filter, callback_func):
+        self._subscriptions.append((topic_filter, callback_func))
+        self._subscriber_router.subscribe_to_topic(topic_filter, callback_func)
 
-            while index < len(widget_configs) and index < start_index + batch_size:
-                key, value = widget_configs[index]
-                current_path = f"{path_prefix}/{key}".strip("/")
+    def __getattr__(self, name):
+        return getattr(self._subscriber_router, name)
 
-                if isinstance(value, dict):
-                    widget_type = value.get("type")
-                    layout = value.get("layout", {})
-                    col_span = int(layout.get("col_span", 1))
-                    row_span = int(layout.get("row_span", 1))
-                    sticky = layout.get("sticky", "nsew")
-
-                    target_frame = None
-
-                    if widget_type == "OcaBlock":
-                        block_cols = value.get("layout_columns", None)
-                        target_frame = ttk.LabelFrame(parent_frame, text=key, borderwidth=0, relief="flat")
-                        self._create_dynamic_widgets(parent_frame=target_frame, data=value.get("fields", {}), path_prefix=current_path, override_cols=block_cols)
-
-                    elif widget_type in self.widget_factory:
-                        factory_kwargs = {
-                            "parent_frame": parent_frame,
-                            "label": value.get("label_active", key),
-                            "config": value,
-                            "path": current_path,
-                            "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
-                            "state_mirror_engine": self.state_mirror_engine,
-                            "subscriber_router": self.subscriber_router
-                        }
-
-                        try:
-                            target_frame = self.widget_factory[widget_type](**factory_kwargs)
-                        except Exception as e:
-                            debug_logger(message=f"❌ Error creating widget '{key}' of type '{widget_type}': {e}", **_get_log_args())
-                            target_frame = None
-                    else:
-                        debug_logger(message=f"❓ Unknown or missing widget 'type' for widget '{key}'. Skipping.", **_get_log_args())
-
-                    if target_frame:
-                        tk_var = self.tk_vars.get(current_path)
-                        target_frame.grid(row=row, column=col, columnspan=col_span, rowspan=row_span, padx=5, pady=5, sticky=sticky)
-                        parent_frame.grid_rowconfigure(row, weight=1)
-                        col += col_span
-                        if col >= max_cols:
-                            col = 0
-                            row += row_span
-
-                index += 1
-
-            if index < len(widget_configs):
-                self.after(5, lambda: self._create_widgets_in_batches(parent_frame, widget_configs, path_prefix, override_cols, index, row))
-            else:
-                self._on_frame_configure()
-                self.pack(fill=tk.BOTH, expand=True)
 
-                app_constants.PERFORMANCE_MODE = False
+def get_widget_build_timings():
+    """Returns per-widget-type build cost across all builders, slowest average first."""
+    timings = {
+        widget_type: {
+            "count": count,
+            "total_ms": total_ms,
+            "avg_ms": total_ms / count if count else 0.0,
+            "max_ms": max_ms,
+        }
+        for widget_type, (count, total_ms, max_ms) in _widget_build_timings.items()
+    }
+    return dict(sorted(timings.items(), key=lambda item: item[1]["avg_ms"], reverse=True))
 
-                if app_constants.global_settings['debug_enabled']:
-                    debug_logger(message="✅ Batch processing complete! All widgets built.", **_get_log_args())
 
+class GuiBatchBuilderMixin:
+    """Handles recursive JSON parsing and Grid layout in time-budgeted slices."""
+
+    def _create_widgets_in_batches(self, parent_frame, widget_configs, path_prefix="", override_cols=None, start_index=0, row_offset=0):
+        # A new build supersedes any slices still queued from a previous one.
+        self._build_generation = getattr(self, "_build_generation", 0) + 1
+        self._build_started = time.perf_counter()
+
+        try:
+            cursor = self._new_grid_cursor(parent_frame, self.config_data, path_prefix, override_cols)
+            cursor["items"] = widget_configs
+            cursor["index"] = start_index
+            cursor["row"] = row_offset
+            self._build_stack = [cursor]
         except Exception as e:
-            tb = traceback.format_exc()
-            debug_logger(message=f"❌🔥 CRITICAL BATCH PROCESSOR FAILURE! {e}\n{tb}", **_get_log_args())
+            debug_logger(message=f"❌ Error preparing batch build: {e}", **_get_log_args())
             self.pack(fill=tk.BOTH, expand=True)
-        
-    def _create_dynamic_widgets(self, parent_frame, data, path_prefix="", override_cols=None):
-        try:
-            if not isinstance(data, dict):
-                return
+            return
+
+        self._process_build_slice(self._build_generation)
+
+    def _new_grid_cursor(self, parent_frame, data, path_prefix, override_cols):
+        """Configures the grid columns of 'parent_frame' and returns the cursor used to fill it."""
+        max_cols = int(data.get("layout_columns", 1) if override_cols is None else override_cols)
+        column_sizing = data.get("column_sizing", [])
+
+        for col_idx in range(max_cols):
+            sizing_info = column_sizing[col_idx] if col_idx < len(column_sizing) else {}
+            weight = sizing_info.get("weight", 1)
+            minwidth = sizing_info.get("minwidth", 0)
+            parent_frame.grid_columnconfigure(col_idx, weight=weight, minsize=minwidth)
+
+        return {
+            "parent_frame": parent_frame,
+            "items": list(data.items()),
+            "index": 0,
+            "path_prefix": path_prefix,
+            "max_cols": max_cols,
+            "col": 0,
+            "row": 0,
+        }
+
+    def _process_build_slice(self, generation):
+        if generation != getattr(self, "_build_generation", None):
+            return # Superseded by a newer rebuild
 
-            col = 0
-            row = 0
-            max_cols = int(data.get("layout_columns", 1) if override_cols is None else override_cols)
-            column_sizing = data.get("column_sizing", [])
+        try:
+            deadline = time.perf_counter() + BUILD_SLICE_BUDGET_MS / 1000.0
 
-            for col_idx in range(max_cols):
-                sizing_info = column_sizing[col_idx] if col_idx < len(column_sizing) else {}
-                weight = sizing_info.get("weight", 1)
-                minwidth = sizing_info.get("minwidth", 0)
-                parent_frame.grid_columnconfigure(col_idx, weight=weight, minsize=minwidth)
+            while self._build_stack:
+                cursor = self._build_stack[-1]
+                if cursor["index"] >= len(cursor["items"]):
+                    self._build_stack.pop()
+                    continue
 
-            for key, value in data.items():
-                current_path = f"{path_prefix}/{key}".strip("/")
+                key, value = cursor["items"][cursor["index"]]
+                cursor["index"] += 1
 
                 if isinstance(value, dict):
-                    widget_type = value.get("type")
-                    layout = value.get("layout", {})
-                    col_span = int(layout.get("col_span", 1))
-                    row_span = int(layout.get("row_span", 1))
-                    sticky = layout.get("sticky", "nsew")
-
-                    target_frame = None
-
-                    if widget_type == "OcaBlock":
-                        block_cols = value.get("layout_columns", None)
-                        target_frame = ttk.LabelFrame(parent_frame, text=key, borderwidth=0, relief="flat")
-                        self._create_dynamic_widgets(parent_frame=target_frame, data=value.get("fields", {}), path_prefix=current_path, override_cols=block_cols)
-
-                    elif widget_type in self.widget_factory:
-                        factory_kwargs = {
-                            "parent_frame": parent_frame,
-                            "label": value.get("label_active", key),
-                            "config": value,
-                            "path": current_path,
-                            "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
-                            "state_mirror_engine": self.state_mirror_engine,
-                            "subscriber_router": self.subscriber_router
-                        }
-
-                        try:
-                            target_frame = self.widget_factory[widget_type](**factory_kwargs)
-                        except Exception as e:
-                            debug_logger(message=f"❌ Error creating synchronous widget '{key}' of type '{widget_type}': {e}", **_get_log_args())
-                            target_frame = None
-                    else:
-                        debug_logger(message=f"❓ Unknown or missing widget 'type' for widget '{key}' in synchronous builder. Skipping.", **_get_log_args())
-
-                    if target_frame:
-                        tk_var = self.tk_vars.get(current_path)
-                        target_frame.grid(row=row, column=col, columnspan=col_span, rowspan=row_span, padx=5, pady=5, sticky=sticky)
-                        parent_frame.grid_rowconfigure(row, weight=1)
-                        col += col_span
-                        if col >= max_cols:
-                            col = 0
-                            row += row_span
+                    self._build_one_widget(cursor, key, value)
+
+                if time.perf_counter() >= deadline:
+                    break
+
+            if self._build_stack:
+                self.after(1, lambda: self._process_build_slice(generation))
+            else:
+                self._finish_batch_build()
 
         except Exception as e:
-            debug_logger(message=f"❌ Error in synchronous _create_dynamic_widgets: {e}", **_get_log_args())
+            tb = traceback.format_exc()
+            debug_logger(message=f"❌🔥 CRITICAL BATCH PROCESSOR FAILURE! {e}\n{tb}", **_get_log_args())
+            self.pack(fill=tk.BOTH, expand=True)
+
+    def _build_one_widget(self, cursor, key, value):
+        """Builds one entry. An OcaBlock pushes its fields onto the build stack instead of recursing."""
+        parent_frame = cursor["parent_frame"]
+        current_path = f"{cursor['path_prefix']}/{key}".strip("/")
+        widget_type = value.get("type")
+        layout = value.get("layout", {})
+        started = time.perf_counter()
+
+        target_frame = None
+        child_cursor = None
+
+        if widget_type == "OcaBlock":
+            block_cols = value.get("layout_columns", None)
+            target_frame = ttk.LabelFrame(parent_frame, text=key, borderwidth=0, relief="flat")
+            child_cursor = self._new_grid_cursor(target_frame, value.get("fields", {}), current_path, block_cols)
+
+        elif widget_type in self.widget_factory:
+            subscriber_router = self.subscriber_router
+            if subscriber_router is not None:
+                subscriber_router = _RecordingSubscriberRouter(subscriber_router, self._widget_subscriptions.setdefault(current_path, []))
+            factory_kwargs = {
+                "parent_frame": parent_frame,
+                "label": value.get("label_active", key),
+                "config": value,
+                "path": current_path,
+                "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
+                "state_mirror_engine": self.state_mirror_engine,
+                "subscriber_router": subscriber_router
+            }
+
+            try:
+                target_frame = self.widget_factory[widget_type](**factory_kwargs)
+            except Exception as e:
+                debug_logger(message=f"❌ Error creating widget '{key}' of type '{widget_type}': {e}", **_get_log_args())
+                target_frame = None
+        else:
+            debug_logger(message=f"❓ Unknown or missing widget 'type' for widget '{key}'. Skipping.", **_get_log_args())
+
+        if target_frame:
+            self._built_widgets[current_path] = target_frame
+            self._place_in_grid(cursor, target_frame, layout)
+
+        if child_cursor:
+            self._build_stack.append(child_cursor)
+        elif widget_type:
+            self._record_widget_build_time(widget_type, (time.perf_counter() - started) * 1000.0)
+
+    def _place_in_grid(self, cursor, target_frame, layout):
+        """Grids 'target_frame' at the cursor position and advances the cursor."""
+        col_span = int(layout.get("col_span", 1))
+        row_span = int(layout.get("row_span", 1))
+        sticky = layout.get("sticky", "nsew")
+        target_frame.grid(row=cursor["row"], column=cursor["col"], columnspan=col_span, rowspan=row_span, padx=5, pady=5, sticky=sticky)
+        cursor["parent_frame"].grid_rowconfigure(cursor["row"], weight=1)
+        cursor["col"] += col_span
+        if cursor["col"] >= cursor["max_cols"]:
+            cursor["col"] = 0
+            cursor["row"] += row_span
+
+    def _record_widget_build_time(self, widget_type, elapsed_ms):
+        entry = _widget_build_timings.setdefault(widget_type, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+
+    def _finish_batch_build(self):
+        self._on_frame_configure()
+        self.pack(fill=tk.BOTH, expand=True)
+
+        app_constants.PERFORMANCE_MODE = False
+        startup_tracer.add_span(f"DynamicGuiBuilder build {getattr(self, 'tab_name', None)}", self._build_started, time.perf_counter(), category="gui_build")
+
+        if app_constants.global_settings['debug_enabled']:
+            elapsed_ms = (time.perf_counter() - self._build_started) * 1000.0
+            debug_logger(message=f"✅ Batch processing complete! All widgets built in {elapsed_ms:.1f} ms.", **_get_log_args())
+            slowest = list(get_widget_build_timings().items())[:3]
+            debug_logger(message=f"⏱️ Slowest widget types so far: {slowest}", **_get_log_args())
@@ -1,7 +1,6 @@
-import hashlib
-import orjson
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.display.layout_manifest_cache import LayoutManifestCache
 
 class GuiFileLoaderMixin:
     """Handles File I/O and Hash Verification."""
@@ -14,15 +13,13 @@ class GuiFileLoaderMixin:
 
         try:
             if self.json_filepath.exists():
-                with open(self.json_filepath, 'r') as f:
-                    raw_content = f.read()
-
-                current_hash = hashlib.md5(raw_content.encode('utf-8')).hexdigest()
+                # Served from the layout manifest unless the file's mtime/size changed
+                current_hash, config_data = LayoutManifestCache.get_instance().load_json(self.json_filepath)
                 if self.last_build_hash == current_hash:
                     return # Content unchanged
 
                 self.last_build_hash = current_hash
-                self.config_data = orjson.loads(raw_content)
+                self.config_data = config_data
                 self._rebuild_gui()
                 self.gui_built = True
             else:
@@ -4,6 +4,7 @@ from workers.mqtt.mqtt_topic_utils import get_topic, generate_topic_path_from_fi
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.setup.path_initializer import GLOBAL_PROJECT_ROOT
+from workers.display.layout_manifest_cache import LayoutManifestCache
 
 class GuiMqttManagerMixin:
     """Handles MQTT Context and Command Transmission."""
@@ -14,7 +15,11 @@ class GuiMqttManagerMixin:
         elif GLOBAL_PROJECT_ROOT is None:
             self.base_mqtt_topic_from_path = "FALLBACK_TOPIC"
         else:
-            self.base_mqtt_topic_from_path = generate_topic_path_from_filepath(json_filepath, GLOBAL_PROJECT_ROOT)
+            layout_manifest = LayoutManifestCache.get_instance()
+            self.base_mqtt_topic_from_path = layout_manifest.get_topic(json_filepath)
+            if self.base_mqtt_topic_from_path is None:
+                self.base_mqtt_topic_from_path = generate_topic_path_from_filepath(json_filepath, GLOBAL_PROJECT_ROOT)
+                layout_manifest.store_topic(json_filepath, self.base_mqtt_topic_from_path)
 
         if self.state_mirror_engine and not hasattr(self.state_mirror_engine, 'base_topic'):
             self.state_mirror_engine.base_topic = app_constants.get_mqtt_base_topic()
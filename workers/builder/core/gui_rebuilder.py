@@ -1,6 +1,32 @@
+import time
 import tkinter as tk
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.setup.config_reader import Config
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
+
+app_constants = Config.get_instance()
+
+
+def _container_settings(data):
+    """The non-widget keys of a container (layout_columns, column_sizing, ...)."""
+    return {key: value for key, value in data.items() if not isinstance(value, dict)}
+
+
+def _descendants(widget):
+    """'widget' and every widget beneath it."""
+    widgets = [widget]
+    for child in widget.winfo_children():
+        widgets.extend(_descendants(child))
+    return widgets
+
+
+def _own_config(value):
+    """A widget's config without its children, so an OcaBlock only differs when the block itself changed."""
+    if value.get("type") == "OcaBlock":
+        return {key: item for key, item in value.items() if key != "fields"}
+    return value
+
 
 class GuiRebuilderMixin:
     """Handles the destruction and re-initialization of the GUI Frame."""
@@ -10,14 +36,28 @@ class GuiRebuilderMixin:
         self._load_and_build_from_file()
 
     def _rebuild_gui(self):
+        # Prefer patching the existing widgets; fall back to a full rebuild when that is not possible.
+        if self._built_config_data is not None and self._built_widgets and not getattr(self, "_build_stack", None):
+            try:
+                if self._apply_config_diff(self._built_config_data, self.config_data):
+                    self._built_config_data = self.config_data
+                    return
+            except Exception as e:
+                debug_logger(message=f"❌ Error in incremental rebuild, rebuilding everything: {e}", **_get_log_args())
+
         try:
             self.pack_forget()
 
             # Destroy all children in the scroll frame
             for child in self.scroll_frame.winfo_children():
+                self._release_render_callbacks(child)
                 child.destroy()
-            
+            for path in list(self._widget_subscriptions):
+                self._release_widget_subscriptions(path)
+
             self.topic_widgets.clear()
+            self._built_widgets.clear()
+            self._built_config_data = self.config_data
             self.update_idletasks()
 
             widget_configs = list(self.config_data.items())
@@ -27,3 +67,101 @@ class GuiRebuilderMixin:
         except Exception as e:
             debug_logger(message=f"❌ Error in _rebuild_gui: {e}", **_get_log_args())
             self.pack(fill=tk.BOTH, expand=True)
+
+    def _apply_config_diff(self, old_data, new_data):
+        """
+        Destroys and recreates only the widgets whose config changed between the
+        previous build and 'new_data'. Unchanged widgets keep their tk variables,
+        mirror-engine registration and MQTT subscriptions.
+        Returns False if the page-level layout changed and a full rebuild is needed.
+        """
+        if _container_settings(old_data) != _container_settings(new_data):
+            return False
+
+        self._diff_counts = {"kept": 0, "removed": 0, "created": 0}
+        self._build_generation = getattr(self, "_build_generation", 0) + 1
+        self._build_started = time.perf_counter()
+        # Blocks created by the diff push their fields here, then go through the normal batch builder.
+        self._build_stack = []
+
+        self._sync_container(self.scroll_frame, old_data, new_data, "", None)
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"♻️ Incremental rebuild: kept {self._diff_counts['kept']}, removed {self._diff_counts['removed']}, created {self._diff_counts['created']}.",
+                **_get_log_args()
+            )
+
+        if self._build_stack:
+            self._process_build_slice(self._build_generation)
+        else:
+            self._on_frame_configure()
+        return True
+
+    def _sync_container(self, parent_frame, old_data, new_data, path_prefix, override_cols):
+        old_entries = {key: value for key, value in old_data.items() if isinstance(value, dict)}
+        new_entries = [(key, value) for key, value in new_data.items() if isinstance(value, dict)]
+
+        # Any added, removed, reordered or replaced child means this container is re-gridded.
+        regrid = list(old_entries.keys()) != [key for key, _ in new_entries]
+        regrid = regrid or _container_settings(old_data) != _container_settings(new_data)
+
+        for key, old_value in old_entries.items():
+            current_path = f"{path_prefix}/{key}".strip("/")
+            new_value = new_data.get(key)
+
+            if not isinstance(new_value, dict) or _own_config(old_value) != _own_config(new_value):
+                self._destroy_built_widget(current_path)
+                regrid = True
+            elif old_value.get("type") == "OcaBlock":
+                block_frame = self._built_widgets.get(current_path)
+                if block_frame is not None:
+                    self._sync_container(block_frame, old_value.get("fields", {}), new_value.get("fields", {}), current_path, new_value.get("layout_columns", None))
+            elif current_path in self._built_widgets:
+                self._diff_counts["kept"] += 1
+
+        if not regrid:
+            return
+
+        cursor = self._new_grid_cursor(parent_frame, new_data, path_prefix, override_cols)
+        for key, value in new_entries:
+            current_path = f"{path_prefix}/{key}".strip("/")
+            existing_frame = self._built_widgets.get(current_path)
+            if existing_frame is not None:
+                self._place_in_grid(cursor, existing_frame, value.get("layout", {}))
+            else:
+                self._build_one_widget(cursor, key, value)
+                self._diff_counts["created"] += 1
+
+    def _destroy_built_widget(self, path):
+        """Destroys the widget at 'path' (and everything built beneath it) and forgets its state."""
+        prefix = f"{path}/"
+        removed_paths = [p for p in self._built_widgets if p == path or p.startswith(prefix)]
+
+        frame = self._built_widgets.get(path)
+        if frame is not None:
+            self._release_render_callbacks(frame)
+            frame.destroy()
+
+        for removed_path in removed_paths:
+            self._release_widget_subscriptions(removed_path)
+            self._built_widgets.pop(removed_path, None)
+            self.topic_widgets.pop(removed_path, None)
+            self.tk_vars.pop(removed_path, None)
+            if self.state_mirror_engine:
+                self.state_mirror_engine.unregister_widget(removed_path, self.base_mqtt_topic_from_path)
+            self._diff_counts["removed"] += 1
+
+    def _release_widget_subscriptions(self, path):
+        """Unsubscribes the topic filters the widget at 'path' registered with the subscriber router."""
+        subscriptions = self._widget_subscriptions.pop(path, ())
+        if self.subscriber_router is None:
+            return
+        for topic_filter, callback_func in subscriptions:
+            self.subscriber_router.unsubscribe(topic_filter, callback_func)
+
+    def _release_render_callbacks(self, frame):
+        """Drops the render scheduler registrations of 'frame' and everything inside it."""
+        render_scheduler = GuiRenderScheduler.get_instance(frame)
+        for widget in _descendants(frame):
+            render_scheduler.unregister(widget)
@@ -0,0 +1,129 @@
+# workers/builder/core/gui_render_scheduler.py
+#
+# Coalesces widget repaints into one pass per display frame. Widgets register a
+# redraw callback under a key (usually their canvas or label) and then only flip a
+# dirty flag when their tk variable changes; a single 'after' loop per Tk root
+# flushes every dirty widget once per frame at the configured [UI] RENDER_FPS.
+# A widget key is dropped, together with its variable traces, when the widget is destroyed.
+
+import time
+import tkinter as tk
+from workers.setup.config_reader import Config
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+app_constants = Config.get_instance()
+
+STATS_LOG_INTERVAL_FRAMES = 300
+
+
+class GuiRenderScheduler:
+    """One per Tk root. Runs the redraws of dirty widgets at most once per frame."""
+    _instances = {} # Tk root -> GuiRenderScheduler
+
+    def __init__(self, root, fps=None):
+        self.root = root
+        self.fps = max(1, int(fps or app_constants.UI_RENDER_FPS))
+        self.frame_interval_ms = max(1, int(1000 / self.fps))
+        self._callbacks = {}
+        self._traces = {} # key -> [(variable, trace id)] added by watch()
+        self._dirty = set()
+        self._after_id = None
+        self._frame_due = 0.0
+
+        # Frame statistics
+        self.frames = 0
+        self.redraws = 0
+        self.dropped_frames = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+        self._total_frame_ms = 0.0
+
+    @classmethod
+    def get_instance(cls, widget):
+        root = widget._root()
+        instance = cls._instances.get(root)
+        if instance is None:
+            instance = cls._instances[root] = cls(root)
+        return instance
+
+    def register(self, key, callback):
+        """Registers (or replaces) the redraw callback for 'key'. A widget key is unregistered when it is destroyed."""
+        if key not in self._callbacks and isinstance(key, tk.Misc):
+            # <Destroy> also fires for children; only the widget itself ends the registration.
+            key.bind("<Destroy>", lambda event: self.unregister(key) if str(event.widget) == str(key) else None, add="+")
+        self._callbacks[key] = callback
+
+    def unregister(self, key):
+        self._callbacks.pop(key, None)
+        self._dirty.discard(key)
+        for variable, trace_id in self._traces.pop(key, ()):
+            try:
+                variable.trace_remove("write", trace_id)
+            except tk.TclError:
+                pass
+
+    def mark_dirty(self, key):
+        """Flags 'key' for repaint on the next frame. Repeated calls within a frame are free."""
+        if key not in self._callbacks:
+            return
+        self._dirty.add(key)
+        if self._after_id is None:
+            self._frame_due = time.perf_counter() + self.frame_interval_ms / 1000.0
+            self._after_id = self.root.after(self.frame_interval_ms, self._flush)
+
+    def request_redraw(self, key, callback):
+        """Registers 'callback' for 'key' and marks it dirty in one step."""
+        self.register(key, callback)
+        self.mark_dirty(key)
+
+    def watch(self, variable, key, callback):
+        """Repaints 'key' with 'callback' (no arguments) whenever the tk 'variable' is written."""
+        self.register(key, callback)
+        trace_id = variable.trace_add("write", lambda *args: self.mark_dirty(key))
+        self._traces.setdefault(key, []).append((variable, trace_id))
+
+    def get_stats(self):
+        return {
+            "fps": self.fps,
+            "frames": self.frames,
+            "redraws": self.redraws,
+            "dropped_frames": self.dropped_frames,
+            "last_frame_ms": self.last_frame_ms,
+            "avg_frame_ms": self._total_frame_ms / self.frames if self.frames else 0.0,
+            "max_frame_ms": self.max_frame_ms,
+        }
+
+    def _flush(self):
+        self._after_id = None
+        start = time.perf_counter()
+        dirty = self._dirty
+        self._dirty = set()
+
+        for key in dirty:
+            callback = self._callbacks.get(key)
+            if callback is None:
+                continue
+            try:
+                callback()
+                self.redraws += 1
+            except tk.TclError:
+                # The widget was destroyed; stop tracking it.
+                self.unregister(key)
+            except Exception as e:
+                debug_logger(message=f"❌ Error in scheduled redraw for {key}: {e}", **_get_log_args())
+
+        end = time.perf_counter()
+        frame_ms = (end - start) * 1000.0
+        self.frames += 1
+        self.last_frame_ms = frame_ms
+        self.max_frame_ms = max(self.max_frame_ms, frame_ms)
+        self._total_frame_ms += frame_ms
+
+        # Any whole frame interval between when this frame was due and when it finished was missed.
+        missed = int(((end - self._frame_due) * 1000.0) // self.frame_interval_ms)
+        if missed > 0:
+            self.dropped_frames += missed
+
+        if app_constants.global_settings['debug_enabled'] and self.frames % STATS_LOG_INTERVAL_FRAMES == 0:
+            debug_logger(message=f"🎞️ Render scheduler stats: {self.get_stats()}", **_get_log_args())
@@ -4,10 +4,13 @@ from collections import deque
 import time
 from typing import Dict, Any, List
 import inspect
+import numpy as np
 
 from workers.logger.logger import debug_logger
 from workers.setup.config_reader import Config
 from workers.logger.log_utils import _get_log_args
+from workers.traces.trace_shared_memory import decode_trace_payload
+from workers.mqtt.mqtt_message import receives_mqtt_message
 
 from . import graph_builder
 from . import graph_styler
@@ -117,6 +120,11 @@ class FluxPlotter(tk.Frame):
                     dataset_var.trace_add("write", lambda *args, ds_id=ds_id: self._on_dataset_var_change(ds_id, *args))
                     self.state_mirror_engine.initialize_widget_state(dataset_path)
 
+                # Whole-sweep datasets: follow a trace topic (shared-memory notification or inline payload).
+                trace_topic = ds_config.get("trace_topic")
+                if trace_topic and self.subscriber_router:
+                    self.subscriber_router.subscribe_to_topic(trace_topic, receives_mqtt_message(lambda topic, payload, ds_id=ds_id: self._on_trace_message(ds_id, payload)))
+
     def _load_all_initial_data(self):
         """Loads initial data for all configured datasets by setting the StringVars."""
         for ds_id, ds_config in self.datasets_config.items():
@@ -124,6 +132,26 @@ class FluxPlotter(tk.Frame):
             if csv_data and ds_id in self.dataset_vars:
                 self.dataset_vars[ds_id].set(csv_data)
 
+    def _on_trace_message(self, dataset_id, payload):
+        """Runs on the MQTT thread: takes the sweep out of the ring (or payload) and hands it to Tk."""
+        try:
+            y_values = decode_trace_payload(payload)
+        except ValueError as e:
+            debug_logger(message=f"❌ Could not decode trace for dataset '{dataset_id}': {e}", **_get_log_args())
+            return
+        if y_values is not None:
+            self.after(0, self.load_trace, dataset_id, y_values)
+
+    def load_trace(self, dataset_id: str, y_values):
+        """Replaces a dataset with a whole sweep; x spans the dataset's 'x_start'..'x_stop' (default: point index)."""
+        if dataset_id not in self.lines: return
+        ds_config = self.datasets_config.get(dataset_id, {})
+        x_start = ds_config.get('x_start', 0)
+        x_stop = ds_config.get('x_stop', max(len(y_values) - 1, 0))
+        x_values = np.linspace(x_start, x_stop, len(y_values))
+        graph_updater.load_trace_data(self.lines[dataset_id], x_values, y_values)
+        graph_updater.autoscale_and_redraw(self.ax, self.canvas)
+
     def load_initial_data(self, dataset_id: str, x_values: List[float], y_values: List[float]):
         """Loads a complete set of initial data points."""
         if dataset_id not in self.lines: return
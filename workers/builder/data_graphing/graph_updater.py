@@ -18,6 +18,10 @@ def load_initial_data(line: Any, x_data: deque, y_data: deque, x_values: List[fl
     y_data.extend(y_values)
     line.set_data(list(x_data), list(y_data))
 
+def load_trace_data(line: Any, x_values: Any, y_values: Any):
+    """Replaces a line with a whole sweep at once, bypassing the rolling point buffers."""
+    line.set_data(x_values, y_values)
+
 def clear_plot_data(line: Any, x_data: deque, y_data: deque):
     """Clears data from a specific dataset."""
     x_data.clear()
@@ -117,6 +117,9 @@ class DynamicGuiBuilder(
         self.topic_widgets = {}
         self.last_build_hash = None
         self.gui_built = False
+        self._built_widgets = {} # widget path -> grid-managed frame of the current build
+        self._widget_subscriptions = {} # widget path -> [(topic filter, callback)] it subscribed while being built
+        self._built_config_data = None # config_data the current widgets were built from
 
         if app_constants.global_settings['debug_enabled']:
             debug_logger(message=f"🖥️🟢 Igniting DynamicGuiBuilder for {self.tab_name}", **_get_log_args())
@@ -2,7 +2,8 @@
 
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
+from workers.builder.images.image_cache import DecodedImageCache, ASYNC_DECODE_MIN_FILE_BYTES
 from workers.setup.config_reader import Config # Import the Config class                                                                          
 
 app_constants = Config.get_instance() # Get the singleton instance      
@@ -32,11 +33,16 @@ class AnimationDisplayCreatorMixin:
         gif_path_relative = config.get("gif_path", "")
         gif_path_absolute = os.path.join(GLOBAL_PROJECT_ROOT, gif_path_relative)
         
+        image_cache = DecodedImageCache.get_instance()
         frames = []
+        decode_in_background = False
         try:
-            with Image.open(gif_path_absolute) as im:
-                for frame_img in ImageSequence.Iterator(im):
-                    frames.append(ImageTk.PhotoImage(frame_img.copy()))
+            if os.path.getsize(gif_path_absolute) >= ASYNC_DECODE_MIN_FILE_BYTES and not image_cache.is_decoded(gif_path_absolute):
+                # Large GIF: decode on a worker thread and fill in the frames when ready
+                image_cache.predecode_async(gif_path_absolute)
+                decode_in_background = True
+            else:
+                frames.extend(image_cache.get_photo_images(gif_path_absolute))
         except FileNotFoundError:
             debug_logger(message=f"🔴 GIF not found at {gif_path_absolute}. Creating placeholder.", **_get_log_args())
             try:
@@ -85,6 +91,25 @@ class AnimationDisplayCreatorMixin:
 
         frame_index_var.trace_add("write", _update_frame) # Bind _update_frame to the trace
 
+        def _wait_for_background_decode():
+            try:
+                if not anim_label.winfo_exists():
+                    return
+                if image_cache.is_decoded(gif_path_absolute) or not image_cache.is_pending(gif_path_absolute):
+                    # Decoded (or the worker failed, in which case this raises the real error)
+                    frames.extend(image_cache.get_photo_images(gif_path_absolute))
+                    anim_label.config(text="")
+                    _update_frame()
+                else:
+                    anim_label.after(50, _wait_for_background_decode)
+            except Exception as e:
+                debug_logger(message=f"🔴 ERROR loading animation: {e}", **_get_log_args())
+                anim_label.config(text=f"[Animation Error]\n{e}")
+
+        if decode_in_background:
+            anim_label.config(text="Loading…")
+            _wait_for_background_decode()
+
         if path:
             widget_id = path
             # Register the IntVar with the StateMirrorEngine
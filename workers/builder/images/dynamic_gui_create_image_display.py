@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
+from workers.builder.images.image_cache import DecodedImageCache
 from workers.setup.config_reader import Config # Import the Config class                                                                          
 
 app_constants = Config.get_instance() # Get the singleton instance      
@@ -42,10 +42,8 @@ class ImageDisplayCreatorMixin:
             image_path_absolute = os.path.join(GLOBAL_PROJECT_ROOT, image_path_relative)
 
             try:
-                pil_image = Image.open(image_path_absolute)
-                # You might want to resize the image here if needed, e.g.:
-                # pil_image = pil_image.resize((100, 100), Image.ANTIALIAS)
-                tk_image = ImageTk.PhotoImage(pil_image)
+                # Shared decode: only the first widget to show this file (at this mtime/size) pays for it
+                tk_image = DecodedImageCache.get_instance().get_photo_image(image_path_absolute)
                 image_label.config(image=tk_image, text="")
                 image_label.image = tk_image  # Keep a reference
             except FileNotFoundError:
@@ -0,0 +1,205 @@
+# workers/builder/images/image_cache.py
+#
+# A process-wide LRU cache of decoded images. Entries are keyed by
+# (absolute path, mtime, file size), so an edited asset is picked up on its next
+# use. Each entry holds the decoded PIL frames and, once requested from the GUI
+# thread, the matching Tk PhotoImages, so many widgets showing the same asset share
+# one decode. Total decoded size is capped; least recently used entries go first.
+#
+# Large animations can be pre-decoded on a worker thread (PIL only); PhotoImages
+# are always created on the Tk thread when the widget asks for them.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1400.1
+
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image, ImageTk, ImageSequence
+from workers.setup.config_reader import Config
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+app_constants = Config.get_instance()
+
+current_version = "20251230.1400.1"
+current_version_hash = (20251230 * 1400 * 1)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Files larger than this are decoded off the GUI thread by widgets that support it.
+ASYNC_DECODE_MIN_FILE_BYTES = 512 * 1024
+
+
+def _image_bytes(pil_image):
+    width, height = pil_image.size
+    return width * height * len(pil_image.getbands())
+
+
+class DecodedImageCache:
+    """Shared LRU of decoded PIL frames and Tk PhotoImages."""
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict() # key -> {"frames": [...], "photos": [...] or None, "bytes": int}
+        self._pending = {} # key -> threading.Event for decodes running in the background
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def cache_key(path):
+        """(path, mtime, size) for 'path'. Raises FileNotFoundError like Image.open would."""
+        absolute_path = os.path.abspath(path)
+        stat = os.stat(absolute_path)
+        return (absolute_path, stat.st_mtime_ns, stat.st_size)
+
+    def get_frames(self, path):
+        """Returns the decoded PIL frames of 'path' (one for a still image), decoding on a miss."""
+        key = self.cache_key(path)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry["frames"]
+
+        # Another thread may already be decoding this exact file; wait for it instead of decoding twice.
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            pending.wait()
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry["frames"]
+
+        frames = self._decode(key[0])
+        self._store(key, frames)
+        return frames
+
+    def get_photo_images(self, path):
+        """Returns shared Tk PhotoImages for every frame of 'path'. GUI thread only."""
+        key = self.cache_key(path)
+        frames = self.get_frames(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["photos"] is not None:
+                return entry["photos"]
+
+        photos = [ImageTk.PhotoImage(frame) for frame in frames]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["photos"] is None:
+                entry["photos"] = photos
+                entry["bytes"] *= 2 # The Tk copy roughly doubles the footprint
+                self.current_bytes += entry["bytes"] // 2
+                self._evict()
+        return photos
+
+    def get_photo_image(self, path):
+        """The first (or only) frame of 'path' as a shared PhotoImage. GUI thread only."""
+        return self.get_photo_images(path)[0]
+
+    def is_decoded(self, path):
+        try:
+            key = self.cache_key(path)
+        except OSError:
+            return False
+        with self._lock:
+            return key in self._entries
+
+    def is_pending(self, path):
+        try:
+            key = self.cache_key(path)
+        except OSError:
+            return False
+        with self._lock:
+            return key in self._pending
+
+    def predecode_async(self, path):
+        """
+        Starts decoding 'path' on a worker thread if it is not cached or already in
+        flight. Widgets poll is_decoded() and then call get_photo_images() on the GUI thread.
+        """
+        key = self.cache_key(path)
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return
+            done = threading.Event()
+            self._pending[key] = done
+
+        def worker():
+            try:
+                self._store(key, self._decode(key[0]))
+            except Exception as e:
+                debug_logger(message=f"🔴 ERROR pre-decoding image {key[0]}: {e}", **_get_log_args())
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+                done.set()
+
+        threading.Thread(target=worker, name="ImagePredecode", daemon=True).start()
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _decode(self, absolute_path):
+        with Image.open(absolute_path) as im:
+            if getattr(im, "is_animated", False):
+                return [frame.copy() for frame in ImageSequence.Iterator(im)]
+            im.load()
+            return [im.copy()]
+
+    def _store(self, key, frames):
+        size = sum(_image_bytes(frame) for frame in frames)
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = {"frames": frames, "photos": None, "bytes": size}
+            self.current_bytes += size
+            self._evict()
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"🖼️ Decoded {os.path.basename(key[0])} ({len(frames)} frame(s), {size // 1024} KB). Cache: {self.current_bytes // 1024} KB.",
+                **_get_log_args()
+            )
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone exceeds the cap.
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted["bytes"]
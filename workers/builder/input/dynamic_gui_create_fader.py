@@ -7,6 +7,7 @@ from workers.setup.config_reader import Config # Import the Config class
 app_constants = Config.get_instance() # Get the singleton instance      
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
+from workers.builder.core.gui_render_scheduler import GuiRenderScheduler
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic
 
@@ -61,7 +62,7 @@ class FaderCreatorMixin:
                         message=f"⚡ fluxing... Fader '{label}' updated visually to {current_fader_val} from MQTT.",
                         **_get_log_args()
                     )
-            fader_value_var.trace_add("write", update_fader_visuals)
+            GuiRenderScheduler.get_instance(value_label).watch(fader_value_var, value_label, update_fader_visuals)
             
             # Initial update of the label
             update_fader_visuals()
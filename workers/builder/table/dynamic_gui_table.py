@@ -8,9 +8,20 @@ from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.mqtt.mqtt_topic_utils import get_topic
 from workers.mqtt import mqtt_publisher_service
+from workers.mqtt.mqtt_message import MqttMessage, receives_mqtt_message
+from workers.setup.config_reader import Config
+from workers.builder.table.virtual_table_model import VirtualTableModel
+
+app_constants = Config.get_instance()
+
+# How often the GUI thread checks the model for changes and flushes queued echoes.
+TABLE_REFRESH_MS = 100
+# Maximum row echoes published to MQTT per refresh tick.
+ECHO_BATCH_SIZE = 50
+WHEEL_SCROLL_ROWS = 3
 
 class GuiTableCreatorMixin:
-    """Mixin class for creating an editable table widget."""
+    """Mixin class for creating an editable, virtualized table widget."""
 
     def _create_gui_table(self, parent_frame, label, config, path, base_mqtt_topic_from_path, state_mirror_engine, subscriber_router):
         current_function_name = inspect.currentframe().f_code.co_name
@@ -20,136 +31,215 @@ class GuiTableCreatorMixin:
         container.grid_rowconfigure(0, weight=1)
         data_topic = get_topic(state_mirror_engine.base_topic, base_mqtt_topic_from_path, path)
 
-        table_height = config.get("height", 10)
+        table_height = int(config.get("height", 10))
         tree = ttk.Treeview(container, show='headings', height=table_height, style="Custom.Treeview")
 
-        vsb = ttk.Scrollbar(container, orient="vertical", command=tree.yview)
+        # The vertical scrollbar drives the model window, not the Treeview.
+        vsb = ttk.Scrollbar(container, orient="vertical")
         hsb = ttk.Scrollbar(container, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        tree.configure(xscrollcommand=hsb.set)
 
         tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
 
-        item_map = {}  # Maps treeview item ID to device data dict
-        device_key_map = {} # Maps device key to treeview item ID
+        model = VirtualTableModel()
+        view = {"first": 0, "moved": False}
+        # A fixed pool of Treeview items, one per visible row, reused as the window moves.
+        row_items = [tree.insert('', tk.END, values=()) for _ in range(table_height)]
+        shown = [None] * table_height # (key, values) currently displayed by each pooled item
+        for item_id in row_items:
+            tree.detach(item_id)
+        pending_echoes = {} # item key -> row, published ECHO_BATCH_SIZE at a time
+        last_echo = {} # item key -> payload we last published, to ignore our own echo coming back
+
+        def configure_columns(columns):
+            tree['columns'] = columns
+            for col in columns:
+                tree.heading(col, text=col, command=lambda c=col: sort_by_column(c))
+                tree.column(col, width=120, minwidth=60, stretch=tk.YES, anchor='w')
+            for i in range(table_height):
+                shown[i] = None
+
+        def render():
+            """Copies the visible slice of the model into the pooled Treeview items."""
+            with model.lock:
+                if model.columns_changed:
+                    configure_columns(model.columns)
+                    model.columns_changed = False
+                model.dirty = False
+                view["moved"] = False
+
+                total = len(model)
+                view["first"] = max(0, min(view["first"], total - table_height))
+                window = model.window(view["first"], table_height)
+                columns = list(model.columns)
+                selected_key = model.selected_key
+
+            for i, item_id in enumerate(row_items):
+                if i < len(window):
+                    key, row = window[i]
+                    values = tuple(row.get(col, "") for col in columns)
+                    if shown[i] is None:
+                        tree.move(item_id, '', i)
+                    if shown[i] != (key, values):
+                        tree.item(item_id, values=values, tags=(key,))
+                        shown[i] = (key, values)
+                elif shown[i] is not None:
+                    tree.detach(item_id)
+                    shown[i] = None
+
+            # Keep the highlighted row following its data as the window moves.
+            selected_items = [row_items[i] for i, entry in enumerate(shown) if entry and entry[0] == selected_key]
+            if tuple(selected_items) != tree.selection():
+                tree.selection_set(selected_items)
+
+            if total:
+                vsb.set(view["first"] / total, (view["first"] + len(window)) / total)
+            else:
+                vsb.set(0.0, 1.0)
+
+        def flush_echoes():
+            if not pending_echoes or not data_topic:
+                return
+            for _ in range(min(ECHO_BATCH_SIZE, len(pending_echoes))):
+                item_key = next(iter(pending_echoes))
+                item_value = pending_echoes.pop(item_key)
+                payload = orjson.dumps(item_value)
+                last_echo[item_key] = payload.decode('utf-8')
+                mqtt_publisher_service.publish_payload(get_topic(data_topic, item_key), payload)
+
+        def refresh_loop():
+            try:
+                if not container.winfo_exists():
+                    return
+                if model.dirty or view["moved"]:
+                    render()
+                flush_echoes()
+            except tk.TclError:
+                return # The table was destroyed
+            except Exception as e:
+                debug_logger(message=f"Error refreshing table '{label}': {e}", level="ERROR", **_get_log_args())
+            container.after(TABLE_REFRESH_MS, refresh_loop)
+
+        def scroll_to(first):
+            view["first"] = max(0, min(int(first), len(model) - table_height))
+            view["moved"] = True
+            render()
+
+        def on_scrollbar(*args):
+            if args[0] == "moveto":
+                scroll_to(float(args[1]) * len(model))
+            elif args[0] == "scroll":
+                step = int(args[1]) * (table_height if args[2] == "pages" else 1)
+                scroll_to(view["first"] + step)
+
+        def on_mousewheel(event):
+            if getattr(event, "num", None) == 4 or event.delta > 0:
+                scroll_to(view["first"] - WHEEL_SCROLL_ROWS)
+            else:
+                scroll_to(view["first"] + WHEEL_SCROLL_ROWS)
+            return "break"
+
+        def sort_by_column(column):
+            model.sort_by(column)
+            render()
+
+        def key_for_item(item_id):
+            try:
+                entry = shown[row_items.index(item_id)]
+            except ValueError:
+                return None
+            return entry[0] if entry else None
+
+        vsb.configure(command=on_scrollbar)
+        tree.bind("<MouseWheel>", on_mousewheel)
+        tree.bind("<Button-4>", on_mousewheel)
+        tree.bind("<Button-5>", on_mousewheel)
 
         def update_table_full(payload):
-            debug_logger(message=f"--- Calling update_table_full for '{label}' with payload: {payload}", **_get_log_args())
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(message=f"--- Calling update_table_full for '{label}'.", **_get_log_args())
             try:
                 if isinstance(payload, str):
                     data = orjson.loads(payload)
                 elif isinstance(payload, bytes):
-                    debug_logger(message="--- Payload is bytes, decoding.", **_get_log_args())
                     data = orjson.loads(payload.decode('utf-8'))
                 else:
                     data = payload
-                debug_logger(message=f"--- Data for full update: {data}", **_get_log_args())
 
                 if not isinstance(data, dict):
                     debug_logger(message=f"Invalid data format for table '{label}'. Expected dict.", level="WARNING", **_get_log_args())
                     return
 
-                debug_logger(message="--- Clearing tree.", **_get_log_args())
-                for i in tree.get_children():
-                    tree.delete(i)
-                item_map.clear()
-                device_key_map.clear()
+                model.replace_all(data)
+                view["first"] = 0
 
-                if not data:
-                    tree['columns'] = []
-                    debug_logger(message=f"--- Table '{label}' cleared (no data).", **_get_log_args())
-                    return
+                # Echo the rows to their per-item topics a batch at a time from the refresh loop.
+                pending_echoes.clear()
+                if data_topic:
+                    with model.lock:
+                        pending_echoes.update(model.rows)
 
-                debug_logger(message="--- Getting columns.", **_get_log_args())
-                first_item_key = next(iter(data))
-                first_item = data[first_item_key]
-                columns = list(first_item.keys())
-                
-                debug_logger(message=f"--- Columns: {columns}", **_get_log_args())
-                tree['columns'] = columns
-                for col in columns:
-                    tree.heading(col, text=col)
-                    tree.column(col, width=120, minwidth=60, stretch=tk.YES, anchor='w')
-
-                debug_logger(message="--- Populating rows and publishing static data if data_topic is present.", **_get_log_args())
-                for item_key, item_value in data.items():
-                    values = [item_value.get(col, "") for col in columns]
-                    item_id = tree.insert('', tk.END, values=values, tags=(item_key,))
-                    item_map[item_id] = item_value
-                    device_key_map[item_key] = item_id
-
-                    if data_topic:
-                        field_topic = get_topic(data_topic, item_key)
-                        mqtt_publisher_service.publish_payload(field_topic, orjson.dumps(item_value))
-                
-                debug_logger(message=f"--- Table '{label}' updated with {len(data)} rows.", **_get_log_args())
+                render()
+                if app_constants.global_settings['debug_enabled']:
+                    debug_logger(message=f"--- Table '{label}' updated with {len(model)} rows.", **_get_log_args())
             except Exception as e:
                 debug_logger(message=f"Error doing full table update for '{label}': {e}", level="ERROR", **_get_log_args())
 
+        @receives_mqtt_message
         def update_table_incremental(topic, payload):
-            debug_logger(message=f"--- Calling update_table_incremental for '{label}' on topic '{topic}'", **_get_log_args())
+            # Runs on the MQTT thread: only touch the model; the refresh loop renders.
             try:
                 if topic.endswith("/selected"):
                     return
-                    
+
                 if not topic.startswith(data_topic):
-                    debug_logger(message="--- Topic does not match, ignoring.", **_get_log_args())
                     return
-                
+
                 device_key = topic[len(data_topic)+1:]
-                debug_logger(message=f"--- Device key: {device_key}", **_get_log_args())
 
                 if not payload:
-                    debug_logger(message="--- Empty payload, deleting row.", **_get_log_args())
-                    if device_key in device_key_map:
-                        item_id = device_key_map.pop(device_key)
-                        if item_id in item_map:
-                            del item_map[item_id]
-                        tree.delete(item_id)
-                        debug_logger(message=f"--- Deleted device '{device_key}' from table '{label}'.", **_get_log_args())
+                    if model.remove(device_key):
+                        last_echo.pop(device_key, None)
+                        if app_constants.global_settings['debug_enabled']:
+                            debug_logger(message=f"--- Deleted device '{device_key}' from table '{label}'.", **_get_log_args())
                     return
 
-                if isinstance(payload, bytes):
-                    data = orjson.loads(payload.decode('utf-8'))
-                elif isinstance(payload, str):
-                    data = orjson.loads(payload)
+                if isinstance(payload, MqttMessage):
+                    if last_echo.get(device_key) == payload.text:
+                        return # Our own echo coming back
+                    data = payload.json
+                    if isinstance(data, dict):
+                        data = dict(data) # The model edits rows in place; the decoded JSON is shared with the cache
                 else:
-                    data = payload
-                debug_logger(message=f"--- Incremental data: {data}", **_get_log_args())
-                
-                if not tree['columns']:
-                    debug_logger(message="--- First time update, setting columns.", **_get_log_args())
-                    columns = list(data.keys())
-                    tree['columns'] = columns
-                    for col in columns:
-                        tree.heading(col, text=col)
-                        tree.column(col, width=120, minwidth=60, stretch=tk.YES, anchor='w')
-
-                values = [data.get(col, "") for col in tree['columns']]
-
-                if device_key in device_key_map:
-                    debug_logger(message=f"--- Updating device '{device_key}'.", **_get_log_args())
-                    item_id = device_key_map[device_key]
-                    tree.item(item_id, values=values)
-                    item_map[item_id] = data
-                else:
-                    debug_logger(message=f"--- Adding new device '{device_key}'.", **_get_log_args())
-                    item_id = tree.insert('', tk.END, values=values, tags=(device_key,))
-                    item_map[item_id] = data
-                    device_key_map[device_key] = item_id
+                    if isinstance(payload, bytes):
+                        payload = payload.decode('utf-8')
+                    if isinstance(payload, str):
+                        if last_echo.get(device_key) == payload:
+                            return # Our own echo coming back
+                        data = orjson.loads(payload)
+                    else:
+                        data = payload
+
+                if model.upsert(device_key, data) and app_constants.global_settings['debug_enabled']:
+                    debug_logger(message=f"--- Row '{device_key}' updated in table '{label}'.", **_get_log_args())
             except Exception as e:
                 debug_logger(message=f"Error doing incremental table update for '{label}': {e}", level="ERROR", **_get_log_args())
 
         def on_select(event):
             selection = tree.selection()
-            if selection:
-                selected_item_id = selection[0]
-                selected_data = item_map.get(selected_item_id)
-                if selected_data and path:
-                    selected_topic = get_topic(state_mirror_engine.base_topic, base_mqtt_topic_from_path, path, "selected")
-                    payload = {"val": selected_data}
-                    mqtt_publisher_service.publish_payload(selected_topic, orjson.dumps(payload))
+            if not selection:
+                return
+            selected_key = key_for_item(selection[0])
+            if selected_key is None or selected_key == model.selected_key:
+                return # Nothing new, e.g. the selection being restored after a render
+            model.selected_key = selected_key
+            selected_data = model.rows.get(selected_key)
+            if selected_data and path:
+                selected_topic = get_topic(state_mirror_engine.base_topic, base_mqtt_topic_from_path, path, "selected")
+                payload = {"val": selected_data}
+                mqtt_publisher_service.publish_payload(selected_topic, orjson.dumps(payload))
 
         def on_double_click(event):
             region = tree.identify("region", event.x, event.y)
@@ -161,23 +251,21 @@ class GuiTableCreatorMixin:
                 return
             column_index = int(column_id.replace('#', '')) - 1
             selected_iid = tree.focus()
-            
+
             if not selected_iid:
                 return
-            
+
             if column_index < 0 or column_index >= len(tree['columns']):
                 return
 
             column_name = tree['columns'][column_index]
-            item_data = item_map.get(selected_iid, {})
-            device_key = ""
-            for key, iid in device_key_map.items():
-                if iid == selected_iid:
-                    device_key = key
-                    break
-            
+            device_key = key_for_item(selected_iid)
+            if device_key is None:
+                return
+            item_data = model.rows.get(device_key, {})
+
             x, y, width, height = tree.bbox(selected_iid, column_id)
-            
+
             entry_var = tk.StringVar(value=item_data.get(column_name, ""))
             entry = ttk.Entry(tree, textvariable=entry_var)
             entry.place(x=x, y=y, width=width, height=height)
@@ -185,14 +273,13 @@ class GuiTableCreatorMixin:
 
             def on_entry_commit(event=None):
                 new_value = entry_var.get()
-                tree.set(selected_iid, column=column_id, value=new_value)
-                item_map[selected_iid][column_name] = new_value
-
-                if device_key and path:
-                    if data_topic:
-                        payload_to_publish = item_map[selected_iid]
-                        field_topic = get_topic(data_topic, device_key)
-                        mqtt_publisher_service.publish_payload(field_topic, orjson.dumps(payload_to_publish))
+                payload_to_publish = model.set_cell(device_key, column_name, new_value)
+
+                if payload_to_publish is not None and path and data_topic:
+                    payload = orjson.dumps(payload_to_publish)
+                    last_echo[device_key] = payload.decode('utf-8')
+                    mqtt_publisher_service.publish_payload(get_topic(data_topic, device_key), payload)
+                render()
                 entry.destroy()
 
             entry.bind("<Return>", on_entry_commit)
@@ -204,11 +291,11 @@ class GuiTableCreatorMixin:
         if path:
             widget_id = path
             dummy_var = tk.StringVar()
-            
+
             data_topic = get_topic(state_mirror_engine.base_topic, base_mqtt_topic_from_path, path)
 
             state_mirror_engine.register_widget(widget_id, dummy_var, base_mqtt_topic_from_path, config, update_callback=update_table_full)
-            
+
             subscriber_router.subscribe_to_topic(data_topic + "/#", update_table_incremental)
             debug_logger(message=f"Table '{label}' subscribed to data topic '{data_topic}/#'", **_get_log_args())
 
@@ -219,12 +306,13 @@ class GuiTableCreatorMixin:
                 static_data = config.get("data")
                 if static_data:
                     update_table_full(static_data)
-            
+
             # Register the 'selected' topic
             selected_topic_path = path + "/selected"
             selected_var = tk.StringVar() # This will hold a JSON string
-            selected_config = {"type": "_Value"} 
+            selected_config = {"type": "_Value"}
             state_mirror_engine.register_widget(selected_topic_path, selected_var, base_mqtt_topic_from_path, selected_config)
             state_mirror_engine.initialize_widget_state(selected_topic_path)
 
+        refresh_loop()
         return container
@@ -0,0 +1,127 @@
+# workers/builder/table/virtual_table_model.py
+#
+# The Python-side dataset behind a virtualized OcaTable. Rows live here, keyed by
+# their item key, and the Treeview is only ever handed the slice that is on screen.
+# Mutations may arrive from the MQTT thread, so everything goes through one lock;
+# the GUI thread polls 'dirty' and re-renders the visible window.
+
+import threading
+
+
+def _sort_key(value):
+    """Numbers sort numerically, everything else as case-insensitive text, numbers first."""
+    try:
+        return (0, float(value), "")
+    except (TypeError, ValueError):
+        return (1, 0.0, str(value).lower())
+
+
+class VirtualTableModel:
+    """Keyed row store with lazy sorting and windowed reads."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.rows = {}
+        self.order = []
+        self.columns = []
+        self.sort_column = None
+        self.sort_reverse = False
+        self.selected_key = None
+        self.dirty = False
+        self.columns_changed = False
+        self._index = None
+        self._needs_sort = False
+
+    def __len__(self):
+        return len(self.order)
+
+    def replace_all(self, data):
+        """Replaces the whole dataset. Columns come from the first row, as before."""
+        with self.lock:
+            self.rows = {str(key): dict(row) for key, row in data.items()}
+            self.order = list(self.rows.keys())
+            columns = list(next(iter(self.rows.values())).keys()) if self.rows else []
+            self._set_columns(columns)
+            self._order_changed()
+
+    def upsert(self, key, row):
+        """Inserts or updates one row. Returns False if nothing actually changed."""
+        with self.lock:
+            existing = self.rows.get(key)
+            if existing == row:
+                return False
+
+            if not self.columns:
+                self._set_columns(list(row.keys()))
+
+            self.rows[key] = row
+            if existing is None:
+                self.order.append(key)
+                self._order_changed()
+            elif self.sort_column is not None and existing.get(self.sort_column) != row.get(self.sort_column):
+                self._order_changed()
+            self.dirty = True
+            return True
+
+    def remove(self, key):
+        with self.lock:
+            if key not in self.rows:
+                return False
+            del self.rows[key]
+            self.order.remove(key)
+            if self.selected_key == key:
+                self.selected_key = None
+            self._order_changed()
+            return True
+
+    def set_cell(self, key, column, value):
+        with self.lock:
+            row = self.rows.get(key)
+            if row is None:
+                return None
+            row[column] = value
+            if column == self.sort_column:
+                self._order_changed()
+            self.dirty = True
+            return row
+
+    def sort_by(self, column):
+        """Sorts by 'column'; asking for the current sort column again flips the direction."""
+        with self.lock:
+            if self.sort_column == column:
+                self.sort_reverse = not self.sort_reverse
+            else:
+                self.sort_column = column
+                self.sort_reverse = False
+            self._order_changed()
+
+    def window(self, first, count):
+        """Returns [(key, row)] for 'count' rows starting at display position 'first'."""
+        with self.lock:
+            self._apply_sort()
+            return [(key, self.rows[key]) for key in self.order[first:first + count]]
+
+    def position_of(self, key):
+        with self.lock:
+            self._apply_sort()
+            if self._index is None:
+                self._index = {k: i for i, k in enumerate(self.order)}
+            return self._index.get(key)
+
+    def _set_columns(self, columns):
+        if columns != self.columns:
+            self.columns = columns
+            self.columns_changed = True
+
+    def _order_changed(self):
+        self._index = None
+        self._needs_sort = self.sort_column is not None
+        self.dirty = True
+
+    def _apply_sort(self):
+        if not self._needs_sort:
+            return
+        column = self.sort_column
+        self.order.sort(key=lambda k: _sort_key(self.rows[k].get(column, "")), reverse=self.sort_reverse)
+        self._index = None
+        self._needs_sort = False
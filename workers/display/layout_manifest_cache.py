@@ -0,0 +1,294 @@
+# workers/display/layout_manifest_cache.py
+#
+# A persistent build manifest for the display tree. One file under DATA/ holds the
+# parsed directory layouts, the "does this folder contain GUI files" answers, the
+# resolved MQTT base topics and the parsed builder JSON (with its md5 and a
+# flattened widget list). Startup loads that single file instead of re-walking the
+# tree and re-reading every gui_*.json.
+#
+# Invalidation:
+#   - Directory layouts are valid while the fingerprint of the display tree (every
+#     folder's path + the names it contains) is unchanged. Adding, removing or
+#     renaming any file or folder changes the fingerprint; __pycache__ and other
+#     dunder folders are skipped, so writing bytecode does not.
+#   - JSON entries are valid while the file's mtime and size are unchanged.
+#
+# The manifest only ever holds its own copy of each parsed JSON; callers get a fresh
+# one, so the builders can mutate their config while a debounced save serializes.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1200.2
+
+import os
+import hashlib
+import pathlib
+import threading
+import orjson
+from workers.setup.config_reader import Config
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.setup.worker_project_paths import GLOBAL_PROJECT_ROOT, LAYOUT_MANIFEST_PATH
+
+app_constants = Config.get_instance()
+
+current_version = "20251230.1200.2"
+current_version_hash = (20251230 * 1200 * 2)
+
+# Bump when the shape of the manifest changes; older manifests are then discarded.
+MANIFEST_FORMAT = 1
+SAVE_DELAY_SECONDS = 2.0
+
+# Keys inside a parsed layout whose values are paths (or lists of path dicts/paths).
+_PATH_LIST_KEYS = ("gui_files", "child_containers")
+_PATH_DICT_LIST_KEYS = ("panels", "tabs")
+
+
+def flatten_widget_configs(data, path_prefix=""):
+    """
+    Flattens a builder config into {widget_path: widget_config}, descending into
+    OcaBlock 'fields' the same way GuiBatchBuilderMixin does.
+    """
+    flat = {}
+    if not isinstance(data, dict):
+        return flat
+    for key, value in data.items():
+        if not isinstance(value, dict):
+            continue
+        current_path = f"{path_prefix}/{key}".strip("/")
+        flat[current_path] = value
+        if value.get("type") == "OcaBlock":
+            flat.update(flatten_widget_configs(value.get("fields", {}), current_path))
+    return flat
+
+
+class LayoutManifestCache:
+    """Singleton wrapper around DATA/layout_manifest.json."""
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, manifest_path=LAYOUT_MANIFEST_PATH, project_root=GLOBAL_PROJECT_ROOT):
+        self.manifest_path = pathlib.Path(manifest_path)
+        self.project_root = pathlib.Path(project_root)
+        self._lock = threading.Lock()
+        self._save_timer = None
+
+        self.tree_fingerprint = None
+        self.has_gui = {}
+        self.layouts = {}
+        self.topics = {}
+        self.json_files = {}
+
+        self.load()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # --- Persistence ---
+
+    def load(self):
+        """Reads the manifest from disk. A missing, corrupt or outdated manifest simply starts empty."""
+        try:
+            if not self.manifest_path.exists():
+                return
+            manifest = orjson.loads(self.manifest_path.read_bytes())
+            if manifest.get("format") != MANIFEST_FORMAT:
+                if app_constants.global_settings['debug_enabled']:
+                    debug_logger(message="🗂️ Layout manifest format changed. Starting a fresh one.", **_get_log_args())
+                return
+
+            self.tree_fingerprint = manifest.get("tree_fingerprint")
+            self.has_gui = manifest.get("has_gui", {})
+            self.layouts = manifest.get("layouts", {})
+            self.topics = manifest.get("topics", {})
+            self.json_files = manifest.get("json_files", {})
+
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(
+                    message=f"🗂️ Layout manifest loaded: {len(self.layouts)} layouts, {len(self.json_files)} JSON files.",
+                    **_get_log_args()
+                )
+        except Exception as e:
+            debug_logger(message=f"🟡 Warning: Could not read layout manifest {self.manifest_path}: {e}", **_get_log_args())
+
+    def save(self):
+        """Writes the manifest atomically (temp file + replace)."""
+        with self._lock:
+            self._save_timer = None
+            manifest = {
+                "format": MANIFEST_FORMAT,
+                "tree_fingerprint": self.tree_fingerprint,
+                "has_gui": self.has_gui,
+                "layouts": self.layouts,
+                "topics": self.topics,
+                "json_files": self.json_files,
+            }
+            try:
+                content = orjson.dumps(manifest)
+            except Exception as e:
+                debug_logger(message=f"❌ Error serialising layout manifest: {e}", **_get_log_args())
+                return
+
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.manifest_path.with_suffix(".tmp")
+            temp_path.write_bytes(content)
+            os.replace(temp_path, self.manifest_path)
+            if app_constants.global_settings['debug_enabled']:
+                debug_logger(message=f"💾 Layout manifest saved ({len(content)} bytes).", **_get_log_args())
+        except Exception as e:
+            debug_logger(message=f"❌ Error writing layout manifest {self.manifest_path}: {e}", **_get_log_args())
+
+    def _schedule_save(self):
+        """Coalesces the many small updates made during a build into one write."""
+        with self._lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _key(self, path):
+        path = pathlib.Path(path)
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    # --- Display tree ---
+
+    def scan_display_tree(self, display_root):
+        """
+        Walks the display tree once, recording every folder's entries and whether it
+        (recursively) holds a gui_*.py file. If the fingerprint differs from the one
+        in the manifest, all cached directory layouts are dropped.
+        """
+        display_root = pathlib.Path(display_root)
+        dir_entries = []
+        has_gui = {}
+
+        # Top-down so __pycache__ and other dunder folders are pruned the way
+        # _scan_for_flux_capacitors skips them; bytecode writes must not change the fingerprint.
+        walked = []
+        for dirpath, dirnames, filenames in os.walk(display_root):
+            dirnames[:] = sorted(name for name in dirnames if not name.startswith("__"))
+            names = dirnames + sorted(name for name in filenames if not name.startswith("__"))
+            dir_entries.append(f"{self._key(dirpath)}:{'|'.join(names)}")
+            walked.append((pathlib.Path(dirpath), list(dirnames), filenames))
+
+        # Bottom-up so each folder can inherit its children's answer.
+        for dir_path, dirnames, filenames in reversed(walked):
+            found = any(name.startswith("gui_") and name.endswith(".py") for name in filenames)
+            if not found:
+                found = any(has_gui.get(self._key(dir_path / name), False) for name in dirnames)
+            has_gui[self._key(dir_path)] = found
+
+        dir_entries.sort()
+        fingerprint = hashlib.md5("\n".join(dir_entries).encode("utf-8")).hexdigest()
+
+        with self._lock:
+            self.has_gui = has_gui
+            if fingerprint != self.tree_fingerprint:
+                if app_constants.global_settings['debug_enabled'] and self.tree_fingerprint is not None:
+                    debug_logger(message="🗂️ Display tree changed. Cached directory layouts invalidated.", **_get_log_args())
+                self.tree_fingerprint = fingerprint
+                self.layouts = {}
+        self._schedule_save()
+
+    def has_gui_files(self, path):
+        """Returns the cached 'contains gui_*.py' answer for a folder, or None if unknown."""
+        return self.has_gui.get(self._key(path))
+
+    def get_layout(self, path):
+        stored = self.layouts.get(self._key(path))
+        if stored is None:
+            return None
+        return self._decode_layout(stored)
+
+    def store_layout(self, path, layout_info):
+        if layout_info.get('type') == 'error':
+            return
+        with self._lock:
+            self.layouts[self._key(path)] = self._encode_layout(layout_info)
+        self._schedule_save()
+
+    def _encode_layout(self, layout_info):
+        data = dict(layout_info['data'])
+        for key in _PATH_LIST_KEYS:
+            if key in data:
+                data[key] = [self._key(p) for p in data[key]]
+        for key in _PATH_DICT_LIST_KEYS:
+            if key in data:
+                data[key] = [dict(entry, path=self._key(entry['path'])) for entry in data[key]]
+        return {'type': layout_info['type'], 'data': data}
+
+    def _decode_layout(self, stored):
+        data = dict(stored['data'])
+        for key in _PATH_LIST_KEYS:
+            if key in data:
+                data[key] = [self.project_root / p for p in data[key]]
+        for key in _PATH_DICT_LIST_KEYS:
+            if key in data:
+                data[key] = [dict(entry, path=self.project_root / entry['path']) for entry in data[key]]
+        return {'type': stored['type'], 'data': data}
+
+    # --- Topics ---
+
+    def get_topic(self, json_path):
+        return self.topics.get(self._key(json_path))
+
+    def store_topic(self, json_path, topic):
+        with self._lock:
+            self.topics[self._key(json_path)] = topic
+        self._schedule_save()
+
+    # --- Builder JSON ---
+
+    def load_json(self, json_path):
+        """
+        Returns (md5, config_data) for a builder JSON file, from the manifest when
+        the file's mtime and size match, otherwise by reading and parsing it.
+        config_data is always the caller's own copy.
+        """
+        json_path = pathlib.Path(json_path)
+        key = self._key(json_path)
+        stat = json_path.stat()
+
+        entry = self.json_files.get(key)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            with self._lock:
+                cached_content = orjson.dumps(entry["config"])
+            return entry["md5"], orjson.loads(cached_content)
+
+        raw_content = json_path.read_bytes()
+        current_hash = hashlib.md5(raw_content).hexdigest()
+        config_data = orjson.loads(raw_content)
+
+        with self._lock:
+            self.json_files[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "md5": current_hash,
+                "config": orjson.loads(raw_content),
+                "widgets": list(flatten_widget_configs(config_data).keys()),
+            }
+        self._schedule_save()
+        return current_hash, config_data
+
+    def get_widget_paths(self, json_path):
+        """Returns the pre-flattened widget paths recorded for a JSON file, or None."""
+        entry = self.json_files.get(self._key(json_path))
+        return entry.get("widgets") if entry else None
@@ -16,6 +16,7 @@ from tkinter import ttk
 from workers.logger.log_utils import _get_log_args  
 from workers.logger.logger import  debug_logger
 from workers.setup.config_reader import Config # Import the Config class                                                                          
+from workers.display.layout_manifest_cache import LayoutManifestCache
 
 app_constants = Config.get_instance() # Get the singleton instance      
 
@@ -33,7 +34,11 @@ class LayoutParser:
         """
         Recursively checks if a folder or any of its sub-folders contain a 'gui_*.py' file.
         This is the "Temporal Crawler" to avoid building empty containers.
+        Answers come from the layout manifest's single tree walk when available.
         """
+        cached = LayoutManifestCache.get_instance().has_gui_files(path)
+        if cached is not None:
+            return cached
         try:
             for item in path.iterdir():
                 if item.is_file() and item.name.startswith("gui_") and item.name.endswith(".py"):
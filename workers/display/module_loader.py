@@ -19,6 +19,7 @@ from workers.setup.config_reader import Config # Import the Config class
 app_constants = Config.get_instance() # Get the singleton instance
 from workers.logger.logger import debug_logger # Import the global debug_log
 from workers.logger.log_utils import _get_log_args
+from workers.setup import startup_tracer
 
 # Globals for Versioning
 current_version = "20251229.1755.1"
@@ -163,9 +164,10 @@ class ModuleLoader:
             return None
         
         if module_path and module_name:
-            module = self._load_module(module_path, module_name)
-            if module:
-                instance = self.instantiate_gui_class(module, parent_widget, class_filter=class_filter, module_file_path=module_path)
-                return instance
+            with startup_tracer.span(f"load_and_instantiate_gui {module_name}", category="module"):
+                module = self._load_module(module_path, module_name)
+                if module:
+                    instance = self.instantiate_gui_class(module, parent_widget, class_filter=class_filter, module_file_path=module_path)
+                    return instance
         
         return None
\ No newline at end of file
@@ -1,7 +1,6 @@
 # display/utils/window_manager.py
 
 import tkinter as tk
-from tkinter import ttk
 import inspect
 import os
 import sys
@@ -26,8 +25,9 @@ class WindowManager:
     def tear_off_tab(self, event):
         """
         Handles the tear-off functionality for a notebook tab.
-        When Ctrl + Left Click is detected on a tab, it creates a new Toplevel 
-        window and rebuilds the tab's content inside it.
+        When Ctrl + Left Click is detected on a tab, the tab's existing content host
+        is promoted to its own window with 'wm manage'. Nothing is rebuilt, so no
+        widget is registered or subscribed twice.
         """
         current_function_name = inspect.currentframe().f_code.co_name
         if not (event.state & 4 and event.num == 1): # Check for Control-Left-Click
@@ -47,44 +47,46 @@ class WindowManager:
             if not build_path:
                 debug_logger(message=f"🖥️🟡 Tab '{tab_text}' is not designed to be torn off (no build_path).", **_get_log_args())
                 return
-            
+
+            # Make sure there is content to move (a no-op if the tab was already built)
+            self.application._populate_tab(original_tab_frame, tab_text)
+            content_host = getattr(original_tab_frame, "content_host", None)
+            if content_host is None:
+                debug_logger(message=f"🖥️🟡 Tab '{tab_text}' has no content host to tear off.", **_get_log_args())
+                return
+
             # Store details needed to re-attach the tab later
             original_index = notebook.index(selected_tab_id)
-            
+            width = max(original_tab_frame.winfo_width(), 200)
+            height = max(original_tab_frame.winfo_height(), 200)
+
             # Forget the tab from the notebook. This hides it but does not destroy the frame.
             notebook.forget(selected_tab_id)
 
-            # Create the new, separate window for the torn-off content.
-            # Its parent must be the main root window, which is stored in self.application.root.
-            tear_off_window = tk.Toplevel(self.application.root)
-            tear_off_window.title(f"{tab_text} - Detached")
-            tear_off_window.geometry(original_tab_frame.winfo_geometry()) # Set initial geometry based on original tab size
-
-            # Configure the tear-off window to expand its content
-            tear_off_window.grid_rowconfigure(0, weight=1)
-            tear_off_window.grid_columnconfigure(0, weight=1)
-
-            # Create an intermediate frame to hold the content, filling the new window
-            content_frame = ttk.Frame(tear_off_window)
-            content_frame.grid(row=0, column=0, sticky="nsew")
+            # Promote the existing content to a top-level window.
+            content_host.pack_forget()
+            try:
+                self.application.root.wm_manage(content_host)
+            except tk.TclError as e:
+                # Window manager refused; put everything back where it was.
+                content_host.pack(fill=tk.BOTH, expand=True)
+                notebook.insert(original_index, original_tab_frame, text=tab_text)
+                debug_logger(message=f"❌ Could not detach tab '{tab_text}': {e}", **_get_log_args())
+                return
 
-            # Rebuild the content from scratch inside the new content_frame
-            self.application._build_from_directory(path=build_path, parent_widget=content_frame)
+            content_host.tk.call("wm", "title", content_host._w, f"{tab_text} - Detached")
+            content_host.tk.call("wm", "geometry", content_host._w, f"{width}x{height}")
+            close_command = content_host.register(lambda win=content_host: self._on_tear_off_window_close(win))
+            content_host.tk.call("wm", "protocol", content_host._w, "WM_DELETE_WINDOW", close_command)
 
             # Store the necessary info to re-attach the tab when the window is closed
-            self.torn_off_windows[tear_off_window] = {
+            self.torn_off_windows[content_host] = {
                 "original_notebook": notebook,
                 "original_tab_frame": original_tab_frame,
                 "original_index": original_index,
-                "tab_text": tab_text
+                "tab_text": tab_text,
+                "close_command": close_command
             }
-            
-            # Defer setting the protocol to the next event loop cycle to avoid race conditions.
-            def set_protocol():
-                if tear_off_window.winfo_exists():
-                    tear_off_window.protocol("WM_DELETE_WINDOW", lambda win=tear_off_window: self._on_tear_off_window_close(win))
-
-            tear_off_window.after(1, set_protocol)
 
             if app_constants.global_settings['debug_enabled']:
                 debug_logger(message=f"🖥️✅ Tab '{tab_text}' has been liberated into its own Toplevel window!", **_get_log_args())
@@ -95,41 +97,44 @@ class WindowManager:
 
     def _on_tear_off_window_close(self, top_level_window):
         """
-        Handles closing a torn-off window by re-inserting the original (empty)
-        tab frame back into its notebook, ready for lazy loading again.
+        Handles closing a torn-off window by handing the content host back to its
+        tab frame and re-inserting that tab into its notebook at its old position.
         """
-        if top_level_window in self.torn_off_windows:
-            tab_info = self.torn_off_windows.pop(top_level_window)
-            
-            original_notebook = tab_info["original_notebook"]
-            original_tab_frame = tab_info["original_tab_frame"]
-            original_index = tab_info["original_index"]
-            tab_text = tab_info["tab_text"]
-            
-            # Re-insert the original frame back into the notebook at its old position.
-            # Since the content was built in the new window, this frame is now empty,
-            # but it is ready to be lazy-loaded again if clicked.
-            original_notebook.insert('end', original_tab_frame, text=tab_text)
+        tab_info = self.torn_off_windows.pop(top_level_window, None)
+        if tab_info is None:
+            # Fallback for safety
+            top_level_window.destroy()
+            return
+
+        original_notebook = tab_info["original_notebook"]
+        original_tab_frame = tab_info["original_tab_frame"]
+        original_index = tab_info["original_index"]
+        tab_text = tab_info["tab_text"]
+
+        # Release the Tcl command behind WM_DELETE_WINDOW (and the lambda it holds). Deferred:
+        # this method is running inside that very command.
+        self.application.root.after_idle(top_level_window.deletecommand, tab_info["close_command"])
+
+        try:
+            # Back to an ordinary frame inside the (still hidden) tab frame.
+            self.application.root.wm_forget(top_level_window)
+            top_level_window.pack(fill=tk.BOTH, expand=True)
+
+            insert_at = min(original_index, original_notebook.index("end"))
+            original_notebook.insert(insert_at, original_tab_frame, text=tab_text)
+            original_notebook.select(original_tab_frame)
 
             if app_constants.global_settings['debug_enabled']:
                 debug_logger(message=f"🖥️🟢 Tab '{tab_text}' re-attached to its original notebook.", **_get_log_args())
-
-            top_level_window.destroy()
-        else:
-            # Fallback for safety
-            top_level_window.destroy()
+        except tk.TclError as e:
+            debug_logger(message=f"❌ Error re-attaching tab '{tab_text}': {e}", **_get_log_args())
 
     def re_attach_tab(self, torn_off_window_id):
         """
-        Re-attaches a torn-off tab back to its original notebook or a new one.
-        This is a placeholder and requires significant logic to implement fully.
+        Re-attaches a torn-off tab back to its original notebook.
         """
         current_function_name = inspect.currentframe().f_code.co_name
-        if app_constants.global_settings['debug_enabled']:
-            debug_logger(
-                message="🖥️🟡 Re-attaching tab functionality is currently a theoretical construct. Implementation pending further research!",
-                **_get_log_args()
-            )
+        self._on_tear_off_window_close(torn_off_window_id)
 
 # Example of how to integrate into gui_display.py:
 # In Application.__init__:
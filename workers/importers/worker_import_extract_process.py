@@ -0,0 +1,88 @@
+# workers/importers/worker_import_extract_process.py
+#
+# Runs the slow, independent parts of a report import (SB PDF page extraction, WWB.zip
+# member parsing) in separate interpreter processes.
+#
+# Each job is a plain `python -m workers.importers.worker_import_extract_process`
+# subprocess that imports only the converter module, reads one JSON request on stdin
+# and writes one JSON result on stdout. Nothing re-imports OpenAir.py, and the GUI
+# process never forks from one of its threads (a multiprocessing pool would do both).
+# The parent drives the subprocesses from a small thread pool, so results come back
+# in submission order while later jobs are still running.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20260101.1000.1
+
+import sys
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from workers.setup.worker_project_paths import GLOBAL_PROJECT_ROOT
+
+current_version = "20260101.1000.1"
+current_version_hash = (20260101 * 1000 * 1)
+
+CHILD_MODULE = "workers.importers.worker_import_extract_process"
+# Lines of the child's stderr quoted when it fails.
+STDERR_TAIL_LINES = 5
+
+
+def run_extract_jobs(task, jobs, max_workers):
+    """
+    Runs task(*args) for every args tuple in 'jobs', each in its own subprocess, at most
+    'max_workers' at a time. Yields the results in job order. A failed job raises
+    RuntimeError with the end of the child's stderr.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ImportExtract") as pool:
+        futures = [pool.submit(_run_job, task, args) for args in jobs]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _run_job(task, args):
+    completed = subprocess.run(
+        [sys.executable, "-m", CHILD_MODULE],
+        cwd=str(GLOBAL_PROJECT_ROOT),
+        input=orjson.dumps({"task": task, "args": list(args)}),
+        capture_output=True,
+    )
+    if completed.returncode != 0:
+        tail = completed.stderr.decode("utf-8", errors="replace").strip().splitlines()[-STDERR_TAIL_LINES:]
+        raise RuntimeError(f"Import worker '{task}' failed (exit {completed.returncode}): " + " | ".join(tail))
+    return orjson.loads(completed.stdout)
+
+
+def _child_main():
+    # stdout carries the result; anything the converter logs goes to stderr instead.
+    result_stream = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    from workers.importers import worker_marker_file_import_converter as converter
+    tasks = {
+        "sb_pdf_pages": converter._extract_sb_pdf_pages,
+        "wwb_zip_member": converter._parse_wwb_zip_member,
+    }
+
+    request = orjson.loads(sys.stdin.buffer.read())
+    result = tasks[request["task"]](*request["args"])
+    result_stream.write(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+    result_stream.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_child_main())
@@ -32,12 +32,13 @@ from workers.importers.worker_marker_file_import_handling import (
     maker_file_load_markers_file,
     maker_file_load_ias_html,
     maker_file_load_wwb_shw,
-    maker_file_load_sb_pdf,
 )
 from workers.importers.worker_marker_file_import_converter import (
     Marker_convert_wwb_zip_report_to_csv,
-    Marker_convert_SB_v2_PDF_File_report_to_csv
+    Marker_convert_SB_v2_PDF_File_report_to_csv,
+    iter_SB_PDF_report_rows
 )
+from workers.importers.worker_importer_loader import stream_report_into_importer, ask_for_sb_pdf_path
 from workers.importers.worker_importer_saver import save_markers_file_internally
 
 LOCAL_DEBUG_ENABLE = False
@@ -91,12 +92,9 @@ def append_wwb_zip_action(importer_tab_instance):
         save_markers_file_internally(importer_tab_instance)
 
 def append_sb_pdf_action(importer_tab_instance):
-    headers, new_data = maker_file_load_sb_pdf()
-    if headers and new_data:
-        importer_tab_instance.tree_headers = headers
-        importer_tab_instance.tree_data.extend(new_data)
-        importer_tab_instance._update_treeview()
-        save_markers_file_internally(importer_tab_instance)
+    file_path = ask_for_sb_pdf_path("Append SB PDF")
+    if file_path:
+        stream_report_into_importer(importer_tab_instance, iter_SB_PDF_report_rows(file_path), append=True)
 
 def append_sb_v2_pdf_action(importer_tab_instance):
     current_function = inspect.currentframe().f_code.co_name
@@ -26,6 +26,8 @@ current_version_hash = (Current_Date * Current_Time * Current_iteration)
 #
 
 import inspect
+import queue
+import threading
 from tkinter import filedialog
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
@@ -33,16 +35,99 @@ from workers.importers.worker_marker_file_import_handling import (
     maker_file_load_markers_file,
     maker_file_load_ias_html,
     maker_file_load_wwb_shw,
-    maker_file_load_sb_pdf,
 )
 from workers.importers.worker_marker_file_import_converter import (
     Marker_convert_wwb_zip_report_to_csv,
-    Marker_convert_SB_v2_PDF_File_report_to_csv
+    Marker_convert_SB_v2_PDF_File_report_to_csv,
+    iter_SB_PDF_report_rows,
+    headers as CONVERTER_HEADERS
 )
 from workers.importers.worker_importer_saver import save_markers_file_internally
 
 LOCAL_DEBUG_ENABLE = False
 
+# How often the importer tab drains rows produced by a background import.
+STREAM_POLL_MS = 50
+
+def stream_report_into_importer(importer_tab_instance, row_batches, append=False):
+    """
+    Runs 'row_batches' (an iterator of row lists, e.g. iter_SB_PDF_report_rows) on a
+    worker thread and adds each batch to the importer table as it arrives, so the GUI
+    stays responsive while a large report is converted. The result is saved to
+    MARKERS.csv once the whole report is in.
+    """
+    if getattr(importer_tab_instance, "_import_in_progress", False):
+        debug_logger(message="🟡 An import is already running. Please wait for it to finish.", **_get_log_args())
+        return
+    importer_tab_instance._import_in_progress = True
+
+    batch_queue = queue.Queue()
+    done = object()
+
+    def worker():
+        try:
+            for batch in row_batches:
+                batch_queue.put(batch)
+        except Exception as e:
+            batch_queue.put(e)
+        batch_queue.put(done)
+
+    # The table and MARKERS.csv are only touched once the first batch has arrived, and
+    # are put back as they were if the conversion fails part way.
+    previous_headers = importer_tab_instance.tree_headers
+    previous_data = list(importer_tab_instance.tree_data)
+    state = {"started": False, "failed": False}
+
+    def drain():
+        try:
+            while True:
+                item = batch_queue.get_nowait()
+                if item is done:
+                    importer_tab_instance._import_in_progress = False
+                    if state["failed"]:
+                        if state["started"]:
+                            importer_tab_instance.tree_headers = previous_headers
+                            importer_tab_instance.tree_data = previous_data
+                            importer_tab_instance._update_treeview()
+                        debug_logger(message="❌ Import aborted. The existing markers were left unchanged.", **_get_log_args())
+                        return
+                    if not state["started"]:
+                        debug_logger(message="🟡 The report contained no markers. Nothing was imported.", **_get_log_args())
+                        return
+                    debug_logger(message=f"✅ Import complete: {len(importer_tab_instance.tree_data)} rows.", **_get_log_args())
+                    save_markers_file_internally(importer_tab_instance)
+                    return
+                if isinstance(item, Exception):
+                    state["failed"] = True
+                    debug_logger(message=f"❌ Failed to import report. {item}", **_get_log_args())
+                    continue
+                if state["failed"]:
+                    continue
+                if not state["started"]:
+                    state["started"] = True
+                    importer_tab_instance.tree_headers = CONVERTER_HEADERS
+                    importer_tab_instance.tree_data = list(previous_data) if append else []
+                    importer_tab_instance._update_treeview()
+                importer_tab_instance.tree_data.extend(item)
+                importer_tab_instance._append_rows_to_treeview(item)
+        except queue.Empty:
+            pass
+        importer_tab_instance.after(STREAM_POLL_MS, drain)
+
+    threading.Thread(target=worker, name="ReportImport", daemon=True).start()
+    drain()
+
+def ask_for_sb_pdf_path(action_name):
+    file_path = filedialog.askopenfilename(
+        defaultextension=".pdf",
+        filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+    )
+    if not file_path:
+        debug_logger(message=f"🟢️️️🟡 '{action_name}' action cancelled by user.", **_get_log_args())
+        return None
+    debug_logger(message=f"▶️ Action: {action_name} from {file_path}.", **_get_log_args())
+    return file_path
+
 def load_markers_file_action(importer_tab_instance):
     headers, data = maker_file_load_markers_file()
     if headers and data:
@@ -90,12 +175,9 @@ def load_wwb_zip_action(importer_tab_instance):
         save_markers_file_internally(importer_tab_instance)
 
 def load_sb_pdf_action(importer_tab_instance):
-    headers, data = maker_file_load_sb_pdf()
-    if headers and data:
-        importer_tab_instance.tree_headers = headers
-        importer_tab_instance.tree_data = data
-        importer_tab_instance._update_treeview()
-        save_markers_file_internally(importer_tab_instance)
+    file_path = ask_for_sb_pdf_path("Load SB PDF")
+    if file_path:
+        stream_report_into_importer(importer_tab_instance, iter_SB_PDF_report_rows(file_path))
 
 def load_sb_v2_pdf_action(importer_tab_instance):
     current_function = inspect.currentframe().f_code.co_name
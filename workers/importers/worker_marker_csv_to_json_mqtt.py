@@ -2,7 +2,6 @@
 
 import os
 import inspect
-import csv
 import orjson
 import pathlib
 from collections import defaultdict
@@ -12,6 +11,7 @@ from workers.logger.logger import  debug_logger
 from workers.utils.log_utils import _get_log_args 
 from workers.mqtt.worker_mqtt_controller_util import MqttControllerUtility
 from workers.utils.worker_project_paths import MARKERS_JSON_PATH, MARKERS_CSV_PATH # NEW: Import paths
+from workers.markers.marker_store import MarkerStore, repository_device_key
 
 
 # --- Global Scope Variables ---
@@ -60,60 +60,44 @@ def csv_to_json_and_publish(mqtt_util: MqttControllerUtility):
     # --- Step 1: Read CSV and generate the flat JSON structure ---
     json_state = {}
     try:
-        with open(MARKERS_CSV_PATH, mode='r', newline='', encoding='utf-8') as csvfile:
-            # Read all data into a list to process it multiple times
-            reader = list(csv.DictReader(csvfile))
-            
-            total_devices = len(reader)
-            min_freq = float('inf')
-            max_freq = float('-inf')
-
-            # First pass: calculate min/max frequencies
-            for row in reader:
-                try:
-                    # --- FIX: Check for 'FREQ', 'FREQ (MHZ)', and 'FREQ_MHZ' ---
-                    # Now relies on the canonical 'FREQ_MHZ' key from file_handling worker
-                    freq_str = row.get("FREQ_MHZ")
-                    if freq_str:
-                        freq = float(freq_str)
-                        if freq < min_freq:
-                            min_freq = freq
-                        if freq > max_freq:
-                            max_freq = freq
-                except (ValueError, TypeError):
-                    # Ignore rows with non-numeric frequencies for min/max calculation
-                    continue
-            
-            # Handle case where no valid frequencies were found
-            if min_freq == float('inf'): min_freq = 0
-            if max_freq == float('-inf'): max_freq = 0
-
-            # Calculate the span
-            span_mhz = max_freq - min_freq
-
-            # Add summary data to the root of the JSON state
-            json_state["total_devices"] = total_devices
-            json_state["min_frequency_mhz"] = round(min_freq, 6)
-            json_state["max_frequency_mhz"] = round(max_freq, 6)
-            json_state["span_mhz"] = round(span_mhz, 6)
+        # The shared marker store parses MARKERS.csv (once) and holds the frequency column
+        marker_store = MarkerStore.get_instance()
+        marker_store.load_csv(MARKERS_CSV_PATH)
+        reader = marker_store.rows
+        total_devices = len(reader)
+
+        min_freq, max_freq = marker_store.frequency_span()
+        
+        # Handle case where no valid frequencies were found
+        if min_freq is None: min_freq = 0
+        if max_freq is None: max_freq = 0
+
+        # Calculate the span
+        span_mhz = max_freq - min_freq
+
+        # Add summary data to the root of the JSON state
+        json_state["total_devices"] = total_devices
+        json_state["min_frequency_mhz"] = round(min_freq, 6)
+        json_state["max_frequency_mhz"] = round(max_freq, 6)
+        json_state["span_mhz"] = round(span_mhz, 6)
+        
+        # Build the device dictionaries
+        for i, row in enumerate(reader):
+            device_key = repository_device_key(i)
             
-            # Second pass: build the device dictionaries
-            for i, row in enumerate(reader, 1):
-                device_key = f"Device-{i:03d}"
-                
-                # --- NEW STRUCTURE IMPLEMENTATION ---
-                json_state[device_key] = {
-                    "IDENTITY": {
-                        "Name": row.get("NAME", ""),
-                        "Device": row.get("DEVICE", ""),
-                        "Zone": row.get("ZONE", ""),
-                        "Group": row.get("GROUP", ""),
-                        "FREQ_MHZ": row.get("FREQ_MHZ") or "null",
-                    },
-                    "Peak": row.get("PEAK", "nan"),
-                    # Removing the "active" and "selected" fields as requested
-                }
-                # --- END NEW STRUCTURE IMPLEMENTATION ---
+            # --- NEW STRUCTURE IMPLEMENTATION ---
+            json_state[device_key] = {
+                "IDENTITY": {
+                    "Name": row.get("NAME", ""),
+                    "Device": row.get("DEVICE", ""),
+                    "Zone": row.get("ZONE", ""),
+                    "Group": row.get("GROUP", ""),
+                    "FREQ_MHZ": row.get("FREQ_MHZ") or "null",
+                },
+                "Peak": row.get("PEAK", "nan"),
+                # Removing the "active" and "selected" fields as requested
+            }
+            # --- END NEW STRUCTURE IMPLEMENTATION ---
 
         debug_logger(message="✅ Successfully read CSV and generated nested JSON structure with summary data.")
     except Exception as e:
@@ -28,6 +28,8 @@ current_version_hash = (Current_Date * Current_Time * Current_iteration)
 #
 # Version 20250815.200000.3 (FIXED: The headers for CSV conversions now include a "Peak" column with a placeholder value to prevent data loss.)
 # MODIFIED: Added a new function Marker_convert_wwb_zip_report_to_csv to handle WWB zip files.
+# MODIFIED: SB PDF pages and WWB zip members are extracted in worker subprocesses, and converted
+#           results are cached in DATA/import_cache keyed by the file's content hash.
 
 import csv
 import subprocess
@@ -41,7 +43,11 @@ import inspect
 import numpy as np
 import zipfile
 import io
+import hashlib
+import orjson
+from workers.importers.worker_import_extract_process import run_extract_jobs
 from workers.setup.config_reader import Config # Import the Config class
+from workers.setup.worker_project_paths import IMPORT_CACHE_DIR
 app_constants = Config.get_instance() # Get the singleton instance
 
 current_file = os.path.basename(__file__) # Get current file name for debug_log
@@ -55,6 +61,61 @@ headers = ["ZONE", "GROUP", "DEVICE", "NAME", "FREQ_MHZ", "PEAK"] # NEW: Added P
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args 
 
+# --- Parallel extraction ---
+# Reports smaller than this are converted in-process; worker processes are not worth their start-up cost.
+PARALLEL_MIN_PDF_PAGES = 4
+PARALLEL_MIN_ZIP_BYTES = 1024 * 1024
+MAX_IMPORT_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+def _file_content_hash(file_path):
+    """SHA-256 of the file's bytes; re-importing an identical report hits the cache."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _import_cache_path(converter_name, content_hash):
+    # The converter version is part of the key so parser fixes invalidate old results.
+    return IMPORT_CACHE_DIR / f"{converter_name}_{current_version}_{content_hash}.json"
+
+
+def _load_cached_conversion(converter_name, content_hash):
+    cache_path = _import_cache_path(converter_name, content_hash)
+    if not cache_path.is_file():
+        return None
+    try:
+        rows = orjson.loads(cache_path.read_bytes())
+    except Exception as e:
+        debug_logger(message=f"🟡 Ignoring unreadable import cache {cache_path.name}: {e}", **_get_log_args())
+        return None
+
+    for row in rows:
+        if row.get("PEAK") is None:
+            row["PEAK"] = np.nan # orjson writes NaN as null
+    if app_constants.global_settings['debug_enabled']:
+        debug_logger(message=f"⚡ Import cache hit ({converter_name}): {len(rows)} rows.", **_get_log_args())
+    return rows
+
+
+def _store_cached_conversion(converter_name, content_hash, rows):
+    cache_path = _import_cache_path(converter_name, content_hash)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_bytes(orjson.dumps(rows, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        debug_logger(message=f"🟡 Could not write import cache {cache_path.name}: {e}", **_get_log_args())
+
+
+def _chunk(items, chunk_count):
+    """Splits 'items' into at most 'chunk_count' contiguous, roughly equal slices."""
+    size = max(1, -(-len(items) // chunk_count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
 
 def Marker_convert_IAShtml_report_to_csv(html_content):
     """
@@ -432,6 +493,43 @@ def Marker_convert_WWB_SHW_File_report_to_csv(xml_file_path):
 )
         raise
 
+def _parse_wwb_zip_member(zip_file_path, csv_file_name, zone):
+    """Worker-process entry point: reads one CSV out of a WWB.zip and converts it to marker rows."""
+    with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
+        raw_bytes = zip_ref.read(csv_file_name)
+    return _parse_wwb_csv_member(csv_file_name, raw_bytes, zone)
+
+
+def _parse_wwb_csv_member(csv_file_name, raw_bytes, zone):
+    """Converts one CSV embedded in a WWB.zip to marker rows."""
+    # Parse the CSV filename for device and group
+    csv_filename_stem = os.path.splitext(os.path.basename(csv_file_name))[0]
+    csv_filename_parts = csv_filename_stem.split('_')
+    
+    device = csv_filename_parts[0] if len(csv_filename_parts) > 0 else "N/A"
+    csv_group = csv_filename_parts[1] if len(csv_filename_parts) > 1 else "N/A"
+
+    rows = []
+    for row in csv.reader(io.StringIO(raw_bytes.decode('utf-8'))):
+        if not row:
+            continue
+        try:
+            # Assume the first column is the frequency in MHz
+            freq_mhz = float(row[0])
+        except (ValueError, IndexError):
+            continue # Skip rows that are not valid frequency data
+
+        rows.append({
+            "ZONE": zone,
+            "GROUP": csv_group,
+            "DEVICE": device,
+            "NAME": "",  # The prompt says just the freq, so name can be empty or the freq itself.
+            "FREQ_MHZ": freq_mhz,
+            "PEAK": np.nan 
+        })
+    return rows
+
+
 def Marker_convert_wwb_zip_report_to_csv(file_path):
     """
     Parses a WWB.zip file, extracts relevant information, and returns a standardized
@@ -488,6 +586,12 @@ def Marker_convert_wwb_zip_report_to_csv(file_path):
         
         debug_logger(message=f"🔍 Derived from ZIP filename: ZONE='{zone}', Main Group='{main_group}'")
 
+        # The ZONE comes from the archive name, so it is part of the cache key as well.
+        content_hash = hashlib.sha256(f"{zone}|{_file_content_hash(file_path)}".encode('utf-8')).hexdigest()
+        cached_rows = _load_cached_conversion("wwb_zip", content_hash)
+        if cached_rows is not None:
+            return headers, cached_rows
+
         with zipfile.ZipFile(file_path, 'r') as zip_ref:
             csv_files = [name for name in zip_ref.namelist() if name.endswith('.csv')]
             
@@ -516,52 +620,22 @@ def Marker_convert_wwb_zip_report_to_csv(file_path):
 
                     )
 
-            for csv_file_name in csv_files:
-                # Parse the CSV filename for device and group
-                csv_filename_stem = os.path.splitext(os.path.basename(csv_file_name))[0]
-                csv_filename_parts = csv_filename_stem.split('_')
-                
-                device = csv_filename_parts[0] if len(csv_filename_parts) > 0 else "N/A"
-                csv_group = csv_filename_parts[1] if len(csv_filename_parts) > 1 else "N/A"
-
-                with zip_ref.open(csv_file_name) as csv_in_zip:
-                    csv_reader = csv.reader(io.TextIOWrapper(csv_in_zip, 'utf-8'))
-                    
-                    for row in csv_reader:
-                        if not row:
-                            continue
-                        
-                        try:
-                            # Assume the first column is the frequency in MHz
-                            freq_mhz = float(row[0])
-                            
-                            row_data = {
-                                "ZONE": zone,
-                                "GROUP": csv_group,
-                                "DEVICE": device,
-                                "NAME": "",  # The prompt says just the freq, so name can be empty or the freq itself.
-                                "FREQ_MHZ": freq_mhz,
-                                "PEAK": np.nan 
-                            }
-                            csv_data.append(row_data)
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"✅ Added ZIP CSV row: {row_data}",
-                                            file=current_file,
-                                            version=current_version,
-                                            function=f"{current_function}",
-                                            
-
-)
-                        except (ValueError, IndexError):
-                            # Skip rows that are not valid frequency data
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"⏩ Skipping non-frequency data row: {row}",
-                                            file=current_file,
-                                            version=current_version,
-                                            function=f"{current_function}",
-                                            
-
-)
+            members = [(csv_file_name, zip_ref.read(csv_file_name)) for csv_file_name in csv_files]
+
+        total_bytes = sum(len(raw_bytes) for _, raw_bytes in members)
+        if len(members) > 1 and total_bytes >= PARALLEL_MIN_ZIP_BYTES and MAX_IMPORT_WORKERS > 1:
+            # Each embedded CSV is independent; parse them side by side and keep archive order.
+            jobs = [(file_path, name, zone) for name, _ in members]
+            for rows in run_extract_jobs("wwb_zip_member", jobs, min(MAX_IMPORT_WORKERS, len(members))):
+                for row in rows:
+                    if row.get("PEAK") is None:
+                        row["PEAK"] = np.nan # orjson writes NaN as null
+                csv_data.extend(rows)
+        else:
+            for name, raw_bytes in members:
+                csv_data.extend(_parse_wwb_csv_member(name, raw_bytes, zone))
+
+        _store_cached_conversion("wwb_zip", content_hash, csv_data)
             
         debug_logger(message=f"✅ Extracted and converted {len(csv_files)} CSV files successfully!")
         return headers, csv_data
@@ -603,6 +677,119 @@ def Marker_convert_wwb_zip_report_to_csv(file_path):
         debug_logger(message=f"❌ Failed to convert ZIP file. {e}")
         return [], []
     
+def _extract_sb_pdf_page(page):
+    """Returns (group header lines, tables) for one Sound Base PDF page."""
+    lines = (page.extract_text() or "").splitlines()
+    lines = [line.strip() for line in lines if line.strip()]
+    group_headers = [line for line in lines if re.match(r".+\(\d+ frequencies\)", line)]
+    return group_headers, page.extract_tables()
+
+
+def _extract_sb_pdf_pages(pdf_file_path, page_numbers):
+    """Worker-process entry point: extracts a contiguous run of pages from one PDF."""
+    with pdfplumber.open(pdf_file_path) as pdf:
+        return [(page_num,) + _extract_sb_pdf_page(pdf.pages[page_num]) for page_num in page_numbers]
+
+
+def _iter_sb_pdf_pages(pdf_file_path):
+    """
+    Yields (page_num, group_headers, tables) in page order. Large PDFs are split
+    across worker subprocesses; pages are yielded as soon as they and every earlier page
+    are done, so the caller can stream rows while later pages are still extracting.
+    """
+    with pdfplumber.open(pdf_file_path) as pdf:
+        page_count = len(pdf.pages)
+        if page_count < PARALLEL_MIN_PDF_PAGES or MAX_IMPORT_WORKERS < 2:
+            for page_num, page in enumerate(pdf.pages):
+                yield (page_num,) + _extract_sb_pdf_page(page)
+            return
+
+    if app_constants.global_settings['debug_enabled']:
+        debug_logger(message=f"📄 Extracting {page_count} pages with {MAX_IMPORT_WORKERS} worker processes.", **_get_log_args())
+
+    # More chunks than workers so early pages finish (and stream) first.
+    chunks = _chunk(list(range(page_count)), MAX_IMPORT_WORKERS * 4)
+    for pages in run_extract_jobs("sb_pdf_pages", [(pdf_file_path, chunk) for chunk in chunks], MAX_IMPORT_WORKERS):
+        for page_num, group_headers, tables in pages:
+            yield page_num, group_headers, tables
+
+
+def _sb_pdf_tables_to_rows(group_headers, tables, last_known_group):
+    """Maps one page's tables to marker rows. Returns (rows, last_known_group)."""
+    rows = []
+    group_index = 0
+    for table in tables:
+        if group_index < len(group_headers):
+            last_known_group = group_headers[group_index]
+            group_index += 1
+
+        current_zone = last_known_group # PDF Group -> CSV ZONE
+
+        for row in table:
+            if not row or all(cell is None or cell.strip() == "" for cell in row):
+                continue
+
+            if "Model" in (row[0] or "") and "Frequency" in (row[-1] or ""): # Skip header rows
+                continue
+
+            clean_row = [cell.replace("\n", " ").strip() if cell else "" for cell in row]
+            # Ensure row has at least 6 elements to unpack safely
+            while len(clean_row) < 6:
+                clean_row.append("")
+
+            model_pdf, band_pdf, name_pdf, preset_pdf, spacing_pdf, frequency_pdf_str = clean_row[:6]
+
+            if model_pdf.strip() == current_zone.strip(): # Skip rows that mistakenly repeat the group name
+                continue
+
+            # Construct DEVICE from PDF Model, Band, Preset
+            device_csv = f"{model_pdf}"
+            if band_pdf:
+                device_csv += f" - {band_pdf}"
+            if preset_pdf:
+                device_csv += f" - {preset_pdf}"
+
+            try:
+                # The frequency is already in MHz, so no conversion needed
+                freq_MHz_csv = float(frequency_pdf_str)
+            except ValueError:
+                freq_MHz_csv = "Invalid Frequency"
+
+            rows.append({
+                "ZONE": current_zone,
+                "GROUP": model_pdf, # PDF Model -> CSV GROUP
+                "DEVICE": device_csv,
+                "NAME": name_pdf, # PDF Name -> CSV NAME
+                "FREQ_MHZ": freq_MHz_csv,
+                "PEAK": np.nan # NEW: Added Peak column
+            })
+    return rows, last_known_group
+
+
+def iter_SB_PDF_report_rows(pdf_file_path):
+    """
+    Yields lists of marker rows from a Sound Base PDF, one list per page in page
+    order, as pages finish extracting. A previously converted file (same content
+    hash) is yielded from the import cache as a single list.
+    """
+    content_hash = _file_content_hash(pdf_file_path)
+    cached_rows = _load_cached_conversion("sb_pdf", content_hash)
+    if cached_rows is not None:
+        yield cached_rows
+        return
+
+    csv_data = []
+    last_known_group = "Uncategorized" # Default group if not found
+    for page_num, group_headers, tables in _iter_sb_pdf_pages(pdf_file_path):
+        page_rows, last_known_group = _sb_pdf_tables_to_rows(group_headers, tables, last_known_group)
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(message=f"📄 Page {page_num + 1}: {len(tables)} tables, {len(page_rows)} rows.", **_get_log_args())
+        csv_data.extend(page_rows)
+        yield page_rows
+
+    _store_cached_conversion("sb_pdf", content_hash, csv_data)
+
+
 def Marker_convert_SB_PDF_File_report_to_csv(pdf_file_path):
     """
     Parses a PDF file (Sound Base format) and extracts frequency data, converting it
@@ -614,10 +801,11 @@ def Marker_convert_SB_PDF_File_report_to_csv(pdf_file_path):
     - PDF 'Frequency' -> CSV 'FREQ' (in MHz)
     - CSV 'DEVICE' is constructed from PDF 'Model', 'Band', and 'Preset'.
 
+    Pages are extracted in parallel for large files and the result is cached by
+    content hash; see iter_SB_PDF_report_rows for a streaming variant.
+
     Inputs:
         pdf_file_path (str): The full path to the PDF file.
-        console_print_func (function, optional): A function to use for printing messages
-                                                 to the console. If None, uses standard print.
     Outputs:
         tuple: A tuple containing:
                - headers (list): A list of strings representing the CSV header row.
@@ -636,118 +824,10 @@ def Marker_convert_SB_PDF_File_report_to_csv(pdf_file_path):
 
 )
 
-    
-    csv_data = []
-
     try:
-        with pdfplumber.open(pdf_file_path) as pdf:
-            last_known_group = "Uncategorized" # Default group if not found
-            
-            if app_constants.global_settings['debug_enabled']:
-                debug_logger(message=f"📄 Opened PDF with {len(pdf.pages)} pages.",  file=current_file, version=current_version, function=current_function, 
-
-)
-
-            for page_num, page in enumerate(pdf.pages):
-        
-                if app_constants.global_settings['debug_enabled']:
-                    debug_logger(message=f"▶️ Processing Page {page_num + 1}...",  file=current_file, version=current_version, function=current_function, 
-
-)
-                # Extract text for group headers
-                lines = page.extract_text().splitlines()
-                lines = [line.strip() for line in lines if line.strip()]
-
-                group_headers = [(i, line) for i, line in enumerate(lines)
-                           if re.match(r".+\(\d+ frequencies\)", line)]
-
-                tables = page.extract_tables()
-                if app_constants.global_settings['debug_enabled']:
-                    debug_logger(message=f"🔍 Found {len(tables)} tables on Page {page_num + 1}.",  file=current_file, version=current_version, function=current_function, 
-
-)
-
-                group_index = 0
-                for table_num, table in enumerate(tables):
-                    if group_index < len(group_headers):
-                        last_known_group = group_headers[group_index][1]
-                        group_index += 1
-
-                    current_zone = last_known_group # PDF Group -> CSV ZONE
-        
-                    if app_constants.global_settings['debug_enabled']:
-                        debug_logger(message=f"▶️ Processing Table {table_num + 1} for Zone: {current_zone}",  file=current_file, version=current_version, function=current_function, 
-
-)
-
-                    for row_num, row in enumerate(table):
-                        if not row or all(cell is None or cell.strip() == "" for cell in row):
-                            continue
-
-                        if "Model" in row[0] and "Frequency" in row[-1]: # Skip header rows
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"⏩ Skipping header row: {row}",  file=current_file, version=current_version, function=current_function, 
-
-)
-                            continue
-
-                        clean_row = [cell.replace("\n", " ").strip() if cell else "" for cell in row]
-                        # Ensure row has at least 6 elements to unpack safely
-                        while len(clean_row) < 6:
-                            clean_row.append("")
-
-                        model_pdf, band_pdf, name_pdf, preset_pdf, spacing_pdf, frequency_pdf_str = clean_row
-
-                        if model_pdf.strip() == current_zone.strip(): # Skip rows that mistakenly repeat the group name
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"⏩ Skipping duplicate group name row: {row}",  file=current_file, version=current_version, function=current_function, 
-
-)
-                            continue
-
-                        # Map PDF fields to CSV fields
-                        zone_csv = current_zone
-                        group_csv = model_pdf # PDF Model -> CSV GROUP
-
-                        # Construct DEVICE from PDF Model, Band, Preset
-                        device_csv = f"{model_pdf}"
-                        if band_pdf:
-                            device_csv += f" - {band_pdf}"
-                        if preset_pdf:
-                            device_csv += f" - {preset_pdf}"
-                        
-                        name_csv = name_pdf # PDF Name -> CSV NAME
-
-                        freq_MHz_csv = "N/A"
-        
-                        try:
-                            # The frequency is already in MHz, so no conversion needed
-                            freq_MHz_csv = float(frequency_pdf_str)
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"↔️ PDF Freq conversion: '{frequency_pdf_str}' -> {freq_MHz_csv} MHz",  file=current_file, version=current_version, function=current_function, 
-
-)
-                        except ValueError:
-        
-                            if app_constants.global_settings['debug_enabled']:
-                                debug_logger(message=f"❌ PDF Freq conversion error: '{frequency_pdf_str}'",  file=current_file, version=current_version, function=current_function, 
-
-)
-                            freq_MHz_csv = "Invalid Frequency"
-
-                        csv_data.append({
-               
-                            "ZONE": zone_csv,
-                            "GROUP": group_csv,
-                            "DEVICE": device_csv,
-                            "NAME": name_csv,
-                            "FREQ_MHZ": freq_MHz_csv,
-                            "PEAK": np.nan # NEW: Added Peak column
-                        })
-                        if app_constants.global_settings['debug_enabled']:
-                            debug_logger(message=f"✅ Added PDF row: {csv_data[-1]}",  file=current_file, version=current_version, function=current_function, 
-
-)
+        csv_data = []
+        for page_rows in iter_SB_PDF_report_rows(pdf_file_path):
+            csv_data.extend(page_rows)
         
         if app_constants.global_settings['debug_enabled']:
             debug_logger(message=f"✅ Finished PDF report conversion. Extracted {len(csv_data)} rows.",  file=current_file, version=current_version, function=current_function, 
@@ -913,6 +993,11 @@ def Marker_convert_SB_v2_PDF_File_report_to_csv(pdf_file_path):
     csv_data = []
 
     try:
+        content_hash = _file_content_hash(pdf_file_path)
+        cached_rows = _load_cached_conversion("sb_v2_pdf", content_hash)
+        if cached_rows is not None:
+            return headers, cached_rows
+
         with pdfplumber.open(pdf_file_path) as pdf:
             text = pdf.pages[0].extract_text()
             
@@ -967,6 +1052,7 @@ def Marker_convert_SB_v2_PDF_File_report_to_csv(pdf_file_path):
                 debug_logger(message=f"✅ Finished conversion. Extracted {len(csv_data)} rows.",  file=current_file, version=current_version, function=current_function, 
 
 )
+            _store_cached_conversion("sb_v2_pdf", content_hash, csv_data)
             return headers, csv_data
 
     except FileNotFoundError:
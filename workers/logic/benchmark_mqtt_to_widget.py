@@ -0,0 +1,347 @@
+# workers/logic/benchmark_mqtt_to_widget.py
+#
+# End-to-end latency benchmark for the incoming path
+#   paho thread -> StateCacheManager.handle_incoming_mqtt -> MqttSubscriberRouter
+#   -> StateMirrorEngine.sync_incoming_mqtt_to_gui -> update queue -> tk variable -> widget redraw
+#
+#   python -m workers.logic.benchmark_mqtt_to_widget [--widgets 50] [--rate 500|max] [--messages 5000]
+#                                                    [--payload-bytes 0] [--compare previous.json]
+#
+# Synthetic messages are injected from a background thread standing in for paho's
+# network thread. Each widget is a ttk.Label bound to its variable on an off-screen
+# Tk root; without a display the suite falls back to a HeadlessLoop with virtual
+# variables, and the report says which ran ("root": "tk" or "virtual").
+#
+# Per stage the report gives latency percentiles and the CPU time of the thread
+# that ran it. Results are written as JSON to DATA/benchmarks so runs can be
+# compared across versions (--compare prints the p50/p99 change per stage).
+# The state cache snapshot is redirected to a temporary file for the run.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251231.1000.1
+
+import os
+import sys
+import time
+import pathlib
+import argparse
+import tempfile
+import threading
+import subprocess
+from datetime import datetime
+
+import orjson
+from workers.mqtt.mqtt_traffic_replay import ReplayMessage, latency_stats, parse_speed
+from workers.setup import worker_project_paths
+from workers.setup.worker_project_paths import BENCHMARK_RESULTS_DIR, GLOBAL_PROJECT_ROOT
+
+current_version = "20251231.1000.1"
+current_version_hash = (20251231 * 1000 * 1)
+
+BENCH_BASE_TOPIC = "OPEN-AIR"
+BENCH_TAB = "Benchmark/widgets"
+BENCH_GUID = "benchmark-injector"
+STAGES = ("cache", "route", "mirror", "queue_wait", "redraw")
+# How long to wait for queued updates to reach the widgets after the last injection.
+DRAIN_TIMEOUT_S = 5.0
+
+
+class VirtualVar:
+    """The slice of tk.StringVar the mirror engine and a label use, for runs without a display."""
+
+    def __init__(self, value=""):
+        self._value = value
+        self._traces = []
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+        for callback in self._traces:
+            callback(None, None, "write")
+
+    def trace_add(self, mode, callback):
+        self._traces.append(callback)
+
+
+class _StageClock:
+    """Timestamps and thread CPU times per message id, filled in as the message moves through the stages."""
+
+    def __init__(self, message_count):
+        self.wall = {stage: [None] * message_count for stage in ("inject",) + STAGES}
+        self.cpu = {stage: 0.0 for stage in STAGES}
+        self.current = None # Message id being handled on the injector thread
+        self._cpu_mark = 0.0 # Injector thread CPU time at the end of the previous stage
+        self._main_cpu_mark = None # Main thread CPU time at the last redraw
+        self.reached_widget = 0
+        self.done = threading.Event()
+        self.expected = message_count
+
+
+def run_benchmark(widgets=50, messages=5000, rate=500.0, payload_bytes=0, widget_type=None, force_virtual=False):
+    """Runs one benchmark and returns the report dict. 'rate' is messages/s, or None for as fast as possible."""
+    from workers.State_Cache.state_cache_manager import StateCacheManager
+    from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+    from workers.logic.state_mirror_engine import StateMirrorEngine
+    from workers.mqtt.mqtt_message import receives_mqtt_message
+
+    root, root_kind = _make_root(force_virtual)
+    clock = _StageClock(messages)
+
+    subscriber_router = MqttSubscriberRouter()
+    state_cache_manager = StateCacheManager(mqtt_connection_manager=None)
+    state_cache_manager.subscriber_router = subscriber_router
+    state_mirror_engine = StateMirrorEngine(base_topic=BENCH_BASE_TOPIC, subscriber_router=subscriber_router, root=root, state_cache_manager=state_cache_manager)
+    state_cache_manager.state_mirror_engine = state_mirror_engine
+
+    # Stage boundaries: router entry ends 'cache', mirror entry ends 'route', mirror return ends 'mirror'.
+    router_on_message = subscriber_router._on_message
+
+    def timed_router(client, userdata, msg):
+        _close_stage(clock, "cache")
+        router_on_message(client, userdata, msg)
+
+    @receives_mqtt_message # Same payload form as the engine it wraps
+    def timed_mirror(topic, payload):
+        _close_stage(clock, "route")
+        state_mirror_engine.sync_incoming_mqtt_to_gui(topic, payload)
+        _close_stage(clock, "mirror")
+
+    subscriber_router._on_message = timed_router
+
+    topics = []
+    for index in range(widgets):
+        widget_id = f"bench_{index}"
+        config = {"type": widget_type} if widget_type else {}
+        var = VirtualVar() if root_kind == "virtual" else _tk_string_var(root)
+        state_mirror_engine.register_widget(widget_id, var, BENCH_TAB, config)
+        topic = f"{BENCH_BASE_TOPIC}/{BENCH_TAB}/{widget_id}"
+        subscriber_router.subscribe_to_topic(topic, timed_mirror)
+        topics.append(topic)
+        _attach_widget(root, root_kind, var, clock)
+
+    padding = "x" * payload_bytes
+    snapshot_dir = tempfile.mkdtemp(prefix="openair_bench_")
+    real_snapshot_path = worker_project_paths.DEVICE_STATE_SNAPSHOT_PATH
+    worker_project_paths.DEVICE_STATE_SNAPSHOT_PATH = pathlib.Path(snapshot_dir) / "device_state_snapshot.json"
+
+    def inject():
+        started = time.perf_counter()
+        for message_id in range(messages):
+            if rate is not None:
+                wait = started + message_id / rate - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+            payload = orjson.dumps({"val": message_id, "ts": time.time(), "GUID": BENCH_GUID, "pad": padding})
+            msg = ReplayMessage(topics[message_id % widgets], payload)
+            clock.current = message_id
+            clock.wall["inject"][message_id] = time.perf_counter()
+            clock._cpu_mark = time.thread_time()
+            state_cache_manager.handle_incoming_mqtt(None, None, msg)
+        # Anything still queued gets DRAIN_TIMEOUT_S to reach its widget.
+        clock.done.wait(DRAIN_TIMEOUT_S)
+        root.after(0, root.quit)
+
+    cpu_main_start = time.thread_time()
+    started = time.perf_counter()
+    injector = threading.Thread(target=inject, name="BenchInjector", daemon=True)
+    try:
+        injector.start()
+        root.mainloop()
+        injector.join()
+    finally:
+        worker_project_paths.DEVICE_STATE_SNAPSHOT_PATH = real_snapshot_path
+        for name in os.listdir(snapshot_dir):
+            os.remove(os.path.join(snapshot_dir, name))
+        os.rmdir(snapshot_dir)
+        if root_kind == "tk":
+            root.destroy()
+    elapsed = time.perf_counter() - started
+
+    return _build_report(clock, {
+        "widgets": widgets,
+        "messages": messages,
+        "rate_msg_s": "max" if rate is None else rate,
+        "payload_bytes": payload_bytes,
+        "widget_type": widget_type,
+    }, root_kind, elapsed, time.thread_time() - cpu_main_start)
+
+
+def _close_stage(clock, stage):
+    message_id = clock.current
+    if message_id is None:
+        return
+    now_cpu = time.thread_time()
+    clock.cpu[stage] += now_cpu - clock._cpu_mark
+    clock._cpu_mark = now_cpu
+    clock.wall[stage][message_id] = time.perf_counter()
+
+
+def _make_root(force_virtual):
+    if not force_virtual:
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+            root.title("OPEN-AIR benchmark")
+            root.geometry("+-10000+-10000") # Mapped (so widgets really redraw) but off-screen
+            return root, "tk"
+        except Exception:
+            pass
+    from workers.setup.headless_loop import HeadlessLoop
+    return HeadlessLoop(), "virtual"
+
+
+def _tk_string_var(root):
+    import tkinter as tk
+    return tk.StringVar(master=root)
+
+
+def _attach_widget(root, root_kind, var, clock):
+    """A label showing 'var', plus the trace that timestamps the queue_wait and redraw stages."""
+    if root_kind == "tk":
+        from tkinter import ttk
+        ttk.Label(root, textvariable=var).pack()
+        text_sink = None
+    else:
+        text_sink = [""] # What a label would render
+
+    def on_write(*args):
+        try:
+            message_id = int(float(var.get()))
+        except (TypeError, ValueError):
+            return
+        if not 0 <= message_id < clock.expected:
+            return
+        clock.wall["queue_wait"][message_id] = time.perf_counter()
+        if clock._main_cpu_mark is None:
+            clock._main_cpu_mark = time.thread_time()
+        if text_sink is not None:
+            text_sink[0] = f"{var.get()}"
+
+        def redrawn():
+            # after_idle runs after the redisplay Tk queued for the label when its text changed.
+            clock.wall["redraw"][message_id] = time.perf_counter()
+            # One queue drain sets many variables before their redraws run; a running
+            # mark counts each slice of main-thread CPU once (drain, set and redraw).
+            now_cpu = time.thread_time()
+            clock.cpu["redraw"] += now_cpu - clock._main_cpu_mark
+            clock._main_cpu_mark = now_cpu
+            clock.reached_widget += 1
+            if clock.reached_widget >= clock.expected:
+                clock.done.set()
+
+        root.after_idle(redrawn)
+
+    var.trace_add("write", on_write)
+
+
+def _build_report(clock, config, root_kind, elapsed, main_cpu_seconds):
+    previous = "inject"
+    stages = {}
+    for stage in STAGES:
+        samples = [
+            end - start
+            for start, end in zip(clock.wall[previous], clock.wall[stage])
+            if start is not None and end is not None
+        ]
+        stats = latency_stats(samples)
+        stats["cpu_ms_total"] = round(clock.cpu.get(stage, 0.0) * 1000.0, 3) if stage != "queue_wait" else None
+        stats["cpu_us_per_msg"] = round(clock.cpu[stage] / len(samples) * 1e6, 2) if samples and stage != "queue_wait" else None
+        stages[stage] = stats
+        previous = stage
+
+    end_to_end = [
+        end - start
+        for start, end in zip(clock.wall["inject"], clock.wall["redraw"])
+        if start is not None and end is not None
+    ]
+    delivered = len(end_to_end)
+    return {
+        "benchmark": "mqtt_to_widget",
+        "version": current_version,
+        "git_commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "root": root_kind,
+        "config": config,
+        "elapsed_s": round(elapsed, 3),
+        "delivered": delivered,
+        "dropped": config["messages"] - delivered,
+        "throughput_msg_s": round(delivered / elapsed, 1) if elapsed > 0 else None,
+        "main_thread_cpu_ms": round(main_cpu_seconds * 1000.0, 3),
+        "end_to_end_ms": latency_stats(end_to_end),
+        "stages": stages,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(GLOBAL_PROJECT_ROOT),
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def format_report(report, baseline=None):
+    config = report["config"]
+    lines = [
+        f"📊 {report['benchmark']} @ {report['git_commit'] or report['version']} ({report['root']} root): "
+        f"{config['widgets']} widgets, {config['messages']} msgs at {config['rate_msg_s']} msg/s, {config['payload_bytes']} B padding",
+        f"   delivered {report['delivered']} (dropped {report['dropped']}) in {report['elapsed_s']} s -> {report['throughput_msg_s']} msg/s",
+        f"   {'stage':<12} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'cpu us/msg':>11}" + (f" {'Δp50':>8} {'Δp99':>8}" if baseline else ""),
+    ]
+    rows = list(report["stages"].items()) + [("end_to_end", report["end_to_end_ms"])]
+    for stage, stats in rows:
+        if not stats.get("count"):
+            lines.append(f"   {stage:<12} {'-':>9}")
+            continue
+        cpu = stats.get("cpu_us_per_msg")
+        line = f"   {stage:<12} {stats['p50']:>9} {stats['p99']:>9} {stats['max']:>9} {cpu if cpu is not None else '-':>11}"
+        if baseline:
+            before = baseline["end_to_end_ms"] if stage == "end_to_end" else baseline.get("stages", {}).get(stage, {})
+            if before.get("count"):
+                line += f" {stats['p50'] - before['p50']:>+8.3f} {stats['p99'] - before['p99']:>+8.3f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark MQTT -> widget latency through the state cache and mirror engine.")
+    parser.add_argument("--widgets", type=int, default=50, help="number of widgets / topics")
+    parser.add_argument("--messages", type=int, default=5000, help="messages to inject")
+    parser.add_argument("--rate", default="500", help="messages per second, or 'max'")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="padding added to every payload")
+    parser.add_argument("--widget-type", default=None, help="widget config type, e.g. _sliderValue (default: plain value)")
+    parser.add_argument("--virtual", action="store_true", help="use the virtual root even when a display is available")
+    parser.add_argument("--output", default=None, help=f"result JSON path (default: {BENCHMARK_RESULTS_DIR}/mqtt_to_widget_<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="earlier result JSON to compare against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.widgets, args.messages, parse_speed(args.rate), args.payload_bytes, args.widget_type, args.virtual)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "rb") as f:
+            baseline = orjson.loads(f.read())
+    print(format_report(report, baseline))
+
+    output = args.output or os.path.join(BENCHMARK_RESULTS_DIR, f"mqtt_to_widget_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    print(f"   results: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
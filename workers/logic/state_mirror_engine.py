@@ -17,6 +17,7 @@ from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.setup.config_reader import Config # Import the Config class                                                                          
 from workers.mqtt import mqtt_publisher_service
+from workers.mqtt.mqtt_message import MqttMessage, receives_mqtt_message
 
 app_constants = Config.get_instance() # Get the singleton instance      
 
@@ -74,6 +75,11 @@ class StateMirrorEngine:
             "update_callback": update_callback
         }
 
+    def unregister_widget(self, widget_id, tab_name):
+        """Stops tracking a widget that has been destroyed."""
+        full_topic = mqtt_topic_utils.get_topic(self.base_topic, tab_name, widget_id)
+        self.registered_widgets.pop(full_topic, None)
+
     def initialize_widget_state(self, widget_id):
         """
         Initializes a widget's state. If the state exists in the cache,
@@ -263,6 +269,7 @@ class StateMirrorEngine:
         mqtt_publisher_service.publish_payload(topic, payload)
         debug_logger(message=f"📤 Published command to topic {topic}", **_get_log_args())
 
+    @receives_mqtt_message
     def sync_incoming_mqtt_to_gui(self, topic, payload):
         """
         Handles incoming messages from the Broker. This runs in the MQTT thread.
@@ -272,6 +279,10 @@ class StateMirrorEngine:
             data = None
             if isinstance(payload, dict):
                 data = payload
+            elif isinstance(payload, MqttMessage):
+                if not payload.looks_like_json:
+                    return
+                data = payload.json # Already decoded by the state cache
             else:
                 if isinstance(payload, bytes):
                     payload_str = payload.decode("utf-8")
@@ -283,6 +294,9 @@ class StateMirrorEngine:
                     return
                 
                 data = orjson.loads(stripped_payload)
+
+            if isinstance(data, dict) and "shm" in data:
+                return # A shared-memory trace notification (TRACE_SHARED_MEMORY); it carries no widget value.
             
             if app_constants.global_settings['debug_enabled']:
                 debug_logger(
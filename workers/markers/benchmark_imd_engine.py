@@ -0,0 +1,62 @@
+# workers/markers/benchmark_imd_engine.py
+#
+# Times the IMD / coordination engine on random UHF carrier sets.
+#
+#   python -m workers.markers.benchmark_imd_engine [channel counts ...]
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1700.1
+
+import sys
+import time
+import numpy as np
+
+from workers.markers.worker_marker_imd_engine import analyze_coordination, score_candidate_frequencies
+
+current_version = "20251230.1700.1"
+current_version_hash = (20251230 * 1700 * 1)
+
+DEFAULT_CHANNEL_COUNTS = (50, 200, 500)
+BENCHMARK_BAND_MHZ = (470.0, 608.0)
+# One 8 MHz TV channel's worth of candidates to score.
+BENCHMARK_CANDIDATE_RANGE_MHZ = (550.0, 558.0)
+
+
+def run_benchmark(channel_counts=DEFAULT_CHANNEL_COUNTS, seed=0):
+    """Returns [(channels, analyze_seconds, score_seconds, conflicted, clean_candidates)]."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for count in channel_counts:
+        freqs = np.round(rng.uniform(*BENCHMARK_BAND_MHZ, count), 3)
+
+        start = time.perf_counter()
+        report = analyze_coordination(freqs)
+        analyze_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = score_candidate_frequencies(freqs, [BENCHMARK_CANDIDATE_RANGE_MHZ])
+        score_seconds = time.perf_counter() - start
+
+        results.append((count, analyze_seconds, score_seconds, int(report["conflicted"].sum()), int(scores["clean"].sum())))
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    channel_counts = [int(arg) for arg in argv] or list(DEFAULT_CHANNEL_COUNTS)
+    print(f"{'channels':>9} {'analyze s':>10} {'score s':>9} {'conflicted':>11} {'clean cand.':>12}")
+    for count, analyze_seconds, score_seconds, conflicted, clean in run_benchmark(channel_counts):
+        print(f"{count:>9} {analyze_seconds:>10.3f} {score_seconds:>9.3f} {conflicted:>11} {clean:>12}")
+
+
+if __name__ == "__main__":
+    main()
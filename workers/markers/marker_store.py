@@ -0,0 +1,227 @@
+# workers/markers/marker_store.py
+#
+# A shared, columnar view of MARKERS.csv. The file is read once (and again only
+# when its mtime/size changes); frequencies live in a float64 array with a sorted
+# index, and ZONE / GROUP / DEVICE are stored as integer category codes, so range,
+# zone and group queries and span calculations are vectorized instead of looping
+# over lists of dicts.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1500.1
+
+import os
+import csv
+import threading
+from collections import defaultdict
+import numpy as np
+from workers.setup.config_reader import Config
+from workers.setup.worker_project_paths import MARKERS_CSV_PATH
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+app_constants = Config.get_instance()
+
+current_version = "20251230.1500.1"
+current_version_hash = (20251230 * 1500 * 1)
+
+# The canonical MARKERS.csv headers, as written by the importers.
+CANONICAL_HEADERS = ["ZONE", "GROUP", "DEVICE", "NAME", "FREQ_MHZ", "PEAK"]
+
+
+def repository_device_key(index):
+    """The OPEN-AIR/repository/markers key of row 'index' (0-based): Device-001, Device-002, ..."""
+    return f"Device-{index + 1:03d}"
+
+
+def to_frequency_array(values):
+    """Converts FREQ_MHZ strings/numbers to float64; anything unparseable becomes NaN."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    out = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        try:
+            out[i] = float(value)
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+def _encode(values):
+    """Returns (codes, names): integer category codes and the name for each code."""
+    names, codes = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    return codes.astype(np.int32), list(names)
+
+
+class _MarkerSnapshot:
+    """One immutable load of the marker table; swapped wholesale on reload."""
+
+    def __init__(self, headers, rows):
+        self.headers = headers
+        self.rows = rows
+        self.freq_mhz = to_frequency_array([row.get("FREQ_MHZ") for row in rows])
+        self.zone_codes, self.zone_names = _encode([row.get("ZONE", "N/A") for row in rows])
+        self.group_codes, self.group_names = _encode([row.get("GROUP", "N/A") for row in rows])
+        self.device_codes, self.device_names = _encode([row.get("DEVICE", "N/A") for row in rows])
+
+        # Sorted-frequency index over the rows that have a valid frequency.
+        valid = np.flatnonzero(~np.isnan(self.freq_mhz))
+        order = valid[np.argsort(self.freq_mhz[valid], kind="stable")]
+        self.freq_order = order
+        self.sorted_freq_mhz = self.freq_mhz[order]
+
+        # Rows sorted by NAME, the order Showtime lists devices in.
+        names = np.asarray([row.get("NAME", "") for row in rows], dtype=object).astype(str)
+        self.name_order = np.argsort(names, kind="stable")
+
+
+class MarkerStore:
+    """Process-wide columnar marker table with a sorted-frequency index."""
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = _MarkerSnapshot(list(CANONICAL_HEADERS), [])
+        self._source_key = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # --- Loading ---
+
+    def load_csv(self, path=MARKERS_CSV_PATH, force=False):
+        """(Re)loads 'path' if it changed since the last load. Returns True if the table was rebuilt."""
+        try:
+            stat = os.stat(path)
+            source_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            source_key = (str(path), None, None)
+
+        with self._lock:
+            if not force and source_key == self._source_key:
+                return False
+
+        headers, rows = list(CANONICAL_HEADERS), []
+        if source_key[1] is not None:
+            try:
+                with open(path, "r", newline="", encoding="utf-8") as csvfile:
+                    reader = csv.DictReader(csvfile)
+                    headers = reader.fieldnames if reader.fieldnames else list(CANONICAL_HEADERS)
+                    rows = list(reader)
+            except Exception as e:
+                debug_logger(message=f"❌ Error loading {path} into the marker store: {e}", **_get_log_args())
+
+        self.load_rows(headers, rows)
+        with self._lock:
+            self._source_key = source_key
+        return True
+
+    def load_rows(self, headers, rows):
+        """Replaces the table with 'rows' (a list of dicts keyed by 'headers')."""
+        snapshot = _MarkerSnapshot(list(headers), list(rows))
+        with self._lock:
+            self._snapshot = snapshot
+            self._source_key = None
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"📍 Marker store loaded {len(snapshot.rows)} markers across {len(snapshot.zone_names)} zone(s).",
+                **_get_log_args()
+            )
+
+    # --- Columns ---
+
+    @property
+    def headers(self):
+        return self._snapshot.headers
+
+    @property
+    def rows(self):
+        return self._snapshot.rows
+
+    @property
+    def freq_mhz(self):
+        return self._snapshot.freq_mhz
+
+    def __len__(self):
+        return len(self._snapshot.rows)
+
+    # --- Queries (all return arrays of row indices) ---
+
+    def indices_in_range(self, start_mhz, stop_mhz):
+        """Rows with start_mhz <= FREQ_MHZ <= stop_mhz, in ascending frequency order."""
+        snapshot = self._snapshot
+        lo = np.searchsorted(snapshot.sorted_freq_mhz, start_mhz, side="left")
+        hi = np.searchsorted(snapshot.sorted_freq_mhz, stop_mhz, side="right")
+        return snapshot.freq_order[lo:hi]
+
+    def select(self, zone=None, group=None, device=None):
+        """Rows matching every given category, in NAME order."""
+        snapshot = self._snapshot
+        mask = np.ones(len(snapshot.rows), dtype=bool)
+        for value, codes, names in (
+            (zone, snapshot.zone_codes, snapshot.zone_names),
+            (group, snapshot.group_codes, snapshot.group_names),
+            (device, snapshot.device_codes, snapshot.device_names),
+        ):
+            if value is None:
+                continue
+            try:
+                mask &= codes == names.index(str(value))
+            except ValueError:
+                return np.empty(0, dtype=np.intp)
+        return snapshot.name_order[mask[snapshot.name_order]]
+
+    def rows_for(self, indices):
+        rows = self._snapshot.rows
+        return [rows[i] for i in indices]
+
+    def frequency_span(self, indices=None, zone=None, group=None):
+        """(min, max) FREQ_MHZ over 'indices' (or the zone/group selection); (None, None) if none are valid."""
+        snapshot = self._snapshot
+        if indices is None:
+            if zone is None and group is None:
+                freqs = snapshot.sorted_freq_mhz
+                if not len(freqs):
+                    return None, None
+                return float(freqs[0]), float(freqs[-1])
+            indices = self.select(zone=zone, group=group)
+
+        freqs = snapshot.freq_mhz[np.asarray(indices, dtype=np.intp)]
+        freqs = freqs[~np.isnan(freqs)]
+        if not len(freqs):
+            return None, None
+        return float(freqs.min()), float(freqs.max())
+
+    def device_frequencies(self):
+        """{repository device key: FREQ_MHZ} for every row with a valid frequency, in file order."""
+        freqs = self._snapshot.freq_mhz
+        return {repository_device_key(i): float(freqs[i]) for i in np.flatnonzero(~np.isnan(freqs))}
+
+    def zones(self):
+        return list(self._snapshot.zone_names)
+
+    def grouped(self):
+        """{zone: {group: [rows in NAME order]}}, the structure Showtime builds its buttons from."""
+        snapshot = self._snapshot
+        grouped = defaultdict(lambda: defaultdict(list))
+        for i in snapshot.name_order:
+            grouped[snapshot.zone_names[snapshot.zone_codes[i]]][snapshot.group_names[snapshot.group_codes[i]]].append(snapshot.rows[i])
+        return grouped
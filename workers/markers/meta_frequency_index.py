@@ -0,0 +1,329 @@
+# workers/markers/meta_frequency_index.py
+#
+# A sorted interval index over the frequency meta datasets (datasets/meta: band
+# plans, government allocations, TV channel tables, RF component ranges).
+#
+# Every JSON file is walked once; each object carrying a start/stop pair (or a
+# single channel frequency) becomes an interval with numeric bounds. The sorted,
+# de-duplicated interval edges split the spectrum into "slots" (each edge point and
+# each open gap between edges), and the intervals covering each slot are stored in
+# a flat CSR table. A point query is one searchsorted into the edges, and a whole
+# array of frequencies is annotated with a single vectorized searchsorted.
+#
+# The parsed index is saved to DATA/ and reused until a source file changes.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1800.2
+
+import os
+import threading
+import orjson
+import numpy as np
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.setup.config_reader import Config # Import the Config class
+from workers.setup.worker_project_paths import GLOBAL_PROJECT_ROOT, META_INDEX_CACHE_PATH
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+# --- Global Scope Variables ---
+current_version = "20251230.1800.2"
+current_version_hash = (20251230 * 1800 * 2)
+current_file = f"{os.path.basename(__file__)}"
+
+META_DATASETS_DIR = GLOBAL_PROJECT_ROOT / "datasets" / "meta"
+
+# Start/stop key pairs used across the meta files.
+BOUND_KEYS = (
+    ("Start_MHz", "Stop_MHz"),
+    ("start_frequency_mhz", "stop_frequency_mhz"),
+    ("start_freq", "end_freq"),
+)
+# Keys naming an object, in order of preference.
+LABEL_KEYS = ("Value", "name", "Type")
+# Channels listed by a single frequency, in lists where no width can be inferred.
+DEFAULT_CENTERED_WIDTH_MHZ = 8.0
+# Channel tables that list each channel by its lower edge (ATSC ch 2 = 54 MHz) rather
+# than its center (DVB-T UK ch 21 = 474 MHz).
+LOWER_EDGE_CHANNEL_SYSTEMS = {"atsc_usa"}
+
+
+def _as_mhz(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _node_label(node, fallback):
+    for key in LABEL_KEYS:
+        if isinstance(node.get(key), str) and node[key]:
+            return node[key]
+    if "channel" in node:
+        return f"{fallback} ch {node['channel']}" if fallback else f"ch {node['channel']}"
+    if "range" in node:
+        return f"{fallback} {node['range']}".strip()
+    return fallback
+
+
+def channel_bounds(channels, system=None, default_width_mhz=DEFAULT_CENTERED_WIDTH_MHZ):
+    """
+    [(channel, start_mhz, stop_mhz)] for the channels in 'channels' listed by a single
+    'frequency_mhz' (channels with their own start/stop keys are skipped). The width is
+    the median spacing of the listed frequencies. The frequency is the lower edge for
+    LOWER_EDGE_CHANNEL_SYSTEMS, and for any table whose lowest channel sits on the
+    system's own start frequency; otherwise it is the channel center.
+    """
+    listed = [item for item in channels if isinstance(item, dict) and _as_mhz(item.get("frequency_mhz")) is not None
+              and not any(a in item for a, _ in BOUND_KEYS)]
+    if not listed:
+        return []
+    frequencies = np.array([_as_mhz(item["frequency_mhz"]) for item in listed])
+    spacing = np.diff(np.sort(frequencies))
+    width = float(np.median(spacing)) if len(spacing) else default_width_mhz
+
+    system = system if isinstance(system, dict) else {}
+    system_start = _as_mhz(system.get("start_frequency_mhz"))
+    lower_edge = system.get("id") in LOWER_EDGE_CHANNEL_SYSTEMS or (
+        system_start is not None and float(frequencies.min()) == system_start)
+    offset = 0.0 if lower_edge else width / 2
+    return [(item, float(frequency) - offset, float(frequency) - offset + width) for item, frequency in zip(listed, frequencies)]
+
+
+def _walk_intervals(node, context, out, system=None):
+    """Appends (start, stop, label) for every interval found under 'node'. 'system' is the dict holding a list."""
+    if isinstance(node, list):
+        listed = channel_bounds(node, system)
+        for item, start, stop in listed:
+            out.append((start, stop, _node_label(item, context)))
+        listed_ids = {id(item) for item, _, _ in listed}
+        for item in node:
+            if isinstance(item, (dict, list)) and id(item) not in listed_ids:
+                _walk_intervals(item, context, out)
+        return
+
+    if not isinstance(node, dict):
+        return
+
+    label = _node_label(node, context)
+    for start_key, stop_key in BOUND_KEYS:
+        start, stop = _as_mhz(node.get(start_key)), _as_mhz(node.get(stop_key))
+        if start is not None and stop is not None:
+            out.append((min(start, stop), max(start, stop), label))
+            break
+
+    for key, value in node.items():
+        if isinstance(value, (dict, list)):
+            child_context = label if isinstance(value, list) else (f"{context}/{key}" if context else str(key))
+            _walk_intervals(value, child_context, out, system=node)
+
+
+def _source_files(root):
+    return sorted(str(path) for path in root.rglob("*.json"))
+
+
+def _source_signature(files):
+    parts = [current_version]
+    for path in files:
+        stat = os.stat(path)
+        parts.append(f"{path}|{stat.st_mtime_ns}|{stat.st_size}")
+    return "\n".join(parts)
+
+
+class _IntervalTable:
+    """Intervals plus the slot -> covering-intervals CSR table built over their edges."""
+
+    def __init__(self, starts, stops, labels, sources, kinds):
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.stops = np.asarray(stops, dtype=np.float64)
+        self.labels = np.asarray(labels, dtype=str)
+        self.sources = np.asarray(sources, dtype=str)
+        self.kinds = np.asarray(kinds, dtype=str)
+        self._build_slots()
+
+    def _build_slots(self):
+        # Slot 2i is the edge point edges[i]; slot 2i+1 is the open gap after it.
+        self.edges = np.unique(np.concatenate([self.starts, self.stops]))
+        first = 2 * np.searchsorted(self.edges, self.starts)
+        last = 2 * np.searchsorted(self.edges, self.stops)
+        lengths = last - first + 1
+
+        ids = np.repeat(np.arange(len(self.starts)), lengths)
+        offsets_in_interval = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        slots = np.repeat(first, lengths) + offsets_in_interval
+
+        # Within a slot, narrowest interval first.
+        widths = (self.stops - self.starts)[ids]
+        order = np.lexsort((widths, slots))
+        self.slot_intervals = ids[order]
+        counts = np.bincount(slots, minlength=2 * len(self.edges))
+        self.slot_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def slots_for(self, freqs):
+        """Slot index for each frequency; -1 below the lowest edge. NaN lands in the empty slot past the top edge."""
+        freqs = np.asarray(freqs, dtype=np.float64)
+        i = np.searchsorted(self.edges, freqs, side="right") - 1
+        on_edge = (i >= 0) & (self.edges[np.clip(i, 0, None)] == freqs)
+        return np.where(on_edge, 2 * i, 2 * i + 1)
+
+
+class FrequencyMetaIndex:
+    """Process-wide interval index over datasets/meta."""
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, root=META_DATASETS_DIR, cache_path=META_INDEX_CACHE_PATH):
+        self.root = root
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._table = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # --- Loading ---
+
+    def load(self, force=False):
+        """Loads the index from the cache, or parses the meta files if any changed."""
+        with self._lock:
+            if self._table is not None and not force:
+                return self._table
+
+            files = _source_files(self.root)
+            signature = _source_signature(files)
+            table = None if force else self._load_cache(signature)
+            if table is None:
+                table = self._parse(files)
+                self._store_cache(table, signature)
+            self._table = table
+            return table
+
+    def _parse(self, files):
+        starts, stops, labels, sources, kinds = [], [], [], [], []
+        for path in files:
+            try:
+                with open(path, "rb") as f:
+                    data = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError) as e:
+                debug_logger(message=f"❌ Skipping meta file {path}: {e}", **_get_log_args())
+                continue
+
+            found = []
+            _walk_intervals(data, "", found)
+            relative = os.path.relpath(path, self.root)
+            kind = relative.split(os.sep)[0]
+            for start, stop, label in found:
+                starts.append(start)
+                stops.append(stop)
+                labels.append(label)
+                sources.append(relative)
+                kinds.append(kind)
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(message=f"📚 Parsed {len(starts)} frequency intervals from {len(files)} meta file(s).", **_get_log_args())
+        return _IntervalTable(starts, stops, labels, sources, kinds)
+
+    def _load_cache(self, signature):
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as cached:
+                if str(cached["signature"]) != signature:
+                    return None
+                table = _IntervalTable.__new__(_IntervalTable)
+                for name in ("starts", "stops", "labels", "sources", "kinds", "edges", "slot_intervals", "slot_offsets"):
+                    setattr(table, name, cached[name])
+                return table
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _store_cache(self, table, signature):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "wb") as f:
+                np.savez(f, signature=np.asarray(signature), starts=table.starts, stops=table.stops, labels=table.labels,
+                         sources=table.sources, kinds=table.kinds, edges=table.edges,
+                         slot_intervals=table.slot_intervals, slot_offsets=table.slot_offsets)
+        except OSError as e:
+            debug_logger(message=f"⚠️ Could not write the meta index cache {self.cache_path}: {e}", **_get_log_args())
+
+    # --- Queries ---
+
+    def __len__(self):
+        return len(self.load().starts)
+
+    def describe(self, interval_id):
+        """The interval as a dict: label, start_mhz, stop_mhz, source, kind."""
+        table = self.load()
+        return {
+            "label": str(table.labels[interval_id]),
+            "start_mhz": float(table.starts[interval_id]),
+            "stop_mhz": float(table.stops[interval_id]),
+            "source": str(table.sources[interval_id]),
+            "kind": str(table.kinds[interval_id]),
+        }
+
+    def covering(self, freq_mhz, kind=None):
+        """Intervals containing freq_mhz (bounds inclusive), narrowest first."""
+        table = self.load()
+        slot = int(table.slots_for([freq_mhz])[0])
+        if slot < 0:
+            return []
+        ids = table.slot_intervals[table.slot_offsets[slot]:table.slot_offsets[slot + 1]]
+        return [self.describe(i) for i in ids if kind is None or table.kinds[i] == kind]
+
+    def overlapping(self, start_mhz, stop_mhz, kind=None):
+        """Intervals sharing any frequency with [start_mhz, stop_mhz], by ascending start."""
+        table = self.load()
+        if stop_mhz < start_mhz:
+            return []
+        first_slot, last_slot = table.slots_for([start_mhz, stop_mhz])
+        if last_slot < 0:
+            return []
+        ids = np.unique(table.slot_intervals[table.slot_offsets[max(first_slot, 0)]:table.slot_offsets[last_slot + 1]])
+        ids = ids[np.argsort(table.starts[ids], kind="stable")]
+        return [self.describe(i) for i in ids if kind is None or table.kinds[i] == kind]
+
+    def annotate(self, freqs_mhz):
+        """
+        Vectorized covering query for an array of frequencies. Returns (offsets, ids):
+        the intervals covering freqs_mhz[n] are ids[offsets[n]:offsets[n + 1]],
+        narrowest first.
+        """
+        table = self.load()
+        slots = table.slots_for(freqs_mhz)
+        valid = slots >= 0
+        safe_slots = np.where(valid, slots, 0)
+        begins = np.where(valid, table.slot_offsets[safe_slots], 0)
+        counts = np.where(valid, table.slot_offsets[safe_slots + 1] - begins, 0)
+
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        within = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+        ids = table.slot_intervals[np.repeat(begins, counts) + within]
+        return offsets, ids
+
+    def narrowest_labels(self, freqs_mhz, kind=None):
+        """The label of the narrowest covering interval for each frequency ('' if none)."""
+        table = self.load()
+        offsets, ids = self.annotate(freqs_mhz)
+        owners = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        keep = np.ones(len(ids), dtype=bool) if kind is None else table.kinds[ids] == kind
+
+        # Each frequency's covering ids are narrowest first, so its first kept id wins.
+        labels = np.full(len(offsets) - 1, "", dtype=object)
+        kept_owners, first = np.unique(owners[keep], return_index=True)
+        labels[kept_owners] = table.labels[ids[keep][first]]
+        return labels
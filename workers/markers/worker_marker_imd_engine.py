@@ -0,0 +1,280 @@
+# workers/markers/worker_marker_imd_engine.py
+#
+# Intermodulation (IMD) and coordination checks for a marker set.
+#
+# For carriers f (MHz) the engine counts, per carrier, the products that land
+# within a guard band of it:
+#   - 2-transmitter 3rd order:  2*f_i - f_j
+#   - 2-transmitter 5th order:  3*f_i - 2*f_j
+#   - 3-transmitter 3rd order:  f_i + f_j - f_k
+# plus carrier-to-carrier spacing violations.
+#
+# 2-tx products are computed directly (n^2, in row chunks) and credited to every
+# carrier inside their guard band. 3-tx products are
+# never enumerated: f_i + f_j - f_k ~ f_v  <=>  f_i + f_j ~ f_k + f_v, so each
+# (k, v) pair is a range lookup in the sorted list of pair sums. That turns the
+# O(n^3) product set into O(n^2 log n) searchsorted calls, done in chunks so peak
+# memory stays at MAX_CHUNK_ELEMENTS values whatever the channel count.
+#
+# The same lookups score candidate frequencies across band / TV-channel ranges
+# for clean-channel picking.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.1700.1
+
+import os
+import orjson
+import numpy as np
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.setup.config_reader import Config # Import the Config class
+from workers.setup.worker_project_paths import GLOBAL_PROJECT_ROOT
+from workers.markers.meta_frequency_index import channel_bounds
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+# --- Global Scope Variables ---
+current_version = "20251230.1700.1"
+current_version_hash = (20251230 * 1700 * 1)
+current_file = f"{os.path.basename(__file__)}"
+
+# --- Constants ---
+# Upper bound on the number of float64 values materialized by any one chunk (~32 MB).
+MAX_CHUNK_ELEMENTS = 4_000_000
+
+DEFAULT_CARRIER_SPACING_MHZ = 0.35
+DEFAULT_IMD3_GUARD_MHZ = 0.1
+DEFAULT_IMD5_GUARD_MHZ = 0.05
+DEFAULT_IMD3_3TX_GUARD_MHZ = 0.05
+DEFAULT_CANDIDATE_STEP_MHZ = 0.025
+DEFAULT_TV_CHANNEL_WIDTH_MHZ = 8.0
+
+# How much each kind of hit counts against a candidate frequency.
+SCORE_WEIGHTS = {
+    "imd3_2tx": 1.0,
+    "imd5_2tx": 0.25,
+    "imd3_3tx": 0.5,
+    "own_imd3": 1.0,
+}
+
+BANDS_PATH = GLOBAL_PROJECT_ROOT / "datasets" / "meta" / "Bands" / "meta_Bands.json"
+TV_CHANNELS_DIR = GLOBAL_PROJECT_ROOT / "datasets" / "meta" / "Television"
+
+
+def _range_counts(sorted_values, centers, half_width):
+    """For each center, how many sorted_values lie within [center - half_width, center + half_width]."""
+    return (np.searchsorted(sorted_values, centers + half_width, side="right")
+            - np.searchsorted(sorted_values, centers - half_width, side="left"))
+
+
+def _rows_per_chunk(row_length):
+    return max(1, MAX_CHUNK_ELEMENTS // max(1, row_length))
+
+
+def _pair_sums(freqs):
+    """Sorted f_i + f_j over all unordered pairs i < j."""
+    i, j = np.triu_indices(len(freqs), k=1)
+    return np.sort(freqs[i] + freqs[j])
+
+
+def _two_tx_products(freqs, a, b):
+    """Sorted a*f_i - b*f_j over all ordered pairs i != j, built row chunk by row chunk."""
+    n = len(freqs)
+    chunks = []
+    step = _rows_per_chunk(n)
+    for first in range(0, n, step):
+        rows = np.arange(first, min(first + step, n))
+        products = a * freqs[rows, None] - b * freqs[None, :]
+        keep = rows[:, None] != np.arange(n)[None, :]
+        chunks.append(products[keep])
+    return np.sort(np.concatenate(chunks)) if chunks else np.empty(0)
+
+
+def _two_tx_hits(freqs, a, b, guard_mhz):
+    """
+    Per carrier v, the number of ordered pairs (i, j), v not in {i, j}, whose
+    a*f_i - b*f_j product lands within guard_mhz of f_v.
+    """
+    n = len(freqs)
+    # Difference array: +1 at the first carrier a product reaches, -1 past the last.
+    edges = np.zeros(n + 1, dtype=np.int64)
+    own = np.zeros(n, dtype=np.int64)
+    step = _rows_per_chunk(n)
+    index = np.arange(n)
+    for first in range(0, n, step):
+        rows = np.arange(first, min(first + step, n))
+        products = a * freqs[rows, None] - b * freqs[None, :]
+        keep = rows[:, None] != index[None, :]
+        lo = np.searchsorted(freqs, products - guard_mhz, side="left")
+        hi = np.searchsorted(freqs, products + guard_mhz, side="right")
+        np.add.at(edges, lo[keep], 1)
+        np.add.at(edges, hi[keep], -1)
+
+        # A product landing on one of its own transmitters is not a hit.
+        participant_i = np.broadcast_to(rows[:, None], products.shape)
+        participant_j = np.broadcast_to(index[None, :], products.shape)
+        for participant in (participant_i, participant_j):
+            on_self = keep & (lo <= participant) & (participant < hi)
+            np.add.at(own, participant[on_self], 1)
+    return np.cumsum(edges[:n]) - own
+
+
+def _three_tx_hits(freqs, pair_sums, guard_mhz):
+    """
+    Per carrier v, the number of 3-transmitter products f_i + f_j - f_k (i < j,
+    k not in {i, j}, v not in {i, j, k}) within guard_mhz of f_v.
+    """
+    n = len(freqs)
+    hits = np.zeros(n, dtype=np.int64)
+    # Carriers within the guard of each carrier (itself included); used to remove
+    # the pair-sum matches that share a transmitter with (k, v).
+    near = _range_counts(freqs, freqs, guard_mhz)
+    step = _rows_per_chunk(n)
+    index = np.arange(n)
+    for first in range(0, n, step):
+        k = np.arange(first, min(first + step, n))
+        targets = freqs[k, None] + freqs[None, :] # f_k + f_v, shape (chunk, n)
+        matches = _range_counts(pair_sums, targets, guard_mhz)
+
+        # Pairs {k, j} with f_j ~ f_v and pairs {v, j} with f_j ~ f_k are not valid
+        # 3-tx products for this (k, v); the pair {k, v} itself is in both sets.
+        k_near_v = np.abs(freqs[k, None] - freqs[None, :]) <= guard_mhz
+        with_k = near[None, :] - k_near_v
+        with_v = near[k, None] - k_near_v
+        valid = matches - with_k - with_v + 1
+
+        valid[k[:, None] == index[None, :]] = 0
+        hits += np.clip(valid, 0, None).sum(axis=0)
+    return hits
+
+
+def analyze_coordination(freqs_mhz, carrier_spacing_mhz=DEFAULT_CARRIER_SPACING_MHZ, imd3_guard_mhz=DEFAULT_IMD3_GUARD_MHZ,
+                         imd5_guard_mhz=DEFAULT_IMD5_GUARD_MHZ, imd3_3tx_guard_mhz=DEFAULT_IMD3_3TX_GUARD_MHZ):
+    """
+    Checks one set of carriers. Returns a dict of per-carrier arrays, in the order
+    of 'freqs_mhz':
+        spacing_conflicts, imd3_2tx, imd5_2tx, imd3_3tx  (hit counts)
+        conflicted (bool: any of the above non-zero)
+    NaN frequencies are ignored and reported with zero hits.
+    """
+    freqs_in = np.asarray(freqs_mhz, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(freqs_in))
+    order = valid[np.argsort(freqs_in[valid], kind="stable")]
+    freqs = freqs_in[order]
+
+    report = {name: np.zeros(len(freqs_in), dtype=np.int64) for name in ("spacing_conflicts", "imd3_2tx", "imd5_2tx", "imd3_3tx")}
+    if len(freqs) >= 2:
+        report["spacing_conflicts"][order] = _range_counts(freqs, freqs, carrier_spacing_mhz) - 1
+        report["imd3_2tx"][order] = _two_tx_hits(freqs, 2, 1, imd3_guard_mhz)
+        report["imd5_2tx"][order] = _two_tx_hits(freqs, 3, 2, imd5_guard_mhz)
+    if len(freqs) >= 4:
+        report["imd3_3tx"][order] = _three_tx_hits(freqs, _pair_sums(freqs), imd3_3tx_guard_mhz)
+
+    report["conflicted"] = (report["spacing_conflicts"] + report["imd3_2tx"] + report["imd5_2tx"] + report["imd3_3tx"]) > 0
+    return report
+
+
+def analyze_marker_store(marker_store, by_zone=True, **guards):
+    """
+    Runs analyze_coordination over a MarkerStore, per ZONE by default (carriers in
+    different zones are assumed not to intermodulate). Returns {zone: (row_indices, report)}.
+    """
+    if not by_zone:
+        indices = np.arange(len(marker_store))
+        return {None: (indices, analyze_coordination(marker_store.freq_mhz[indices], **guards))}
+
+    results = {}
+    for zone in marker_store.zones():
+        indices = marker_store.select(zone=zone)
+        results[zone] = (indices, analyze_coordination(marker_store.freq_mhz[indices], **guards))
+        if app_constants.global_settings['debug_enabled']:
+            conflicted = int(results[zone][1]["conflicted"].sum())
+            debug_logger(message=f"📡 IMD check for zone '{zone}': {conflicted} of {len(indices)} carriers conflicted.", **_get_log_args())
+    return results
+
+
+def score_candidate_frequencies(freqs_mhz, ranges_mhz, step_mhz=DEFAULT_CANDIDATE_STEP_MHZ, carrier_spacing_mhz=DEFAULT_CARRIER_SPACING_MHZ,
+                                imd3_guard_mhz=DEFAULT_IMD3_GUARD_MHZ, imd5_guard_mhz=DEFAULT_IMD5_GUARD_MHZ,
+                                imd3_3tx_guard_mhz=DEFAULT_IMD3_3TX_GUARD_MHZ):
+    """
+    Scores a grid of candidate frequencies (every step_mhz across each (start, stop)
+    in ranges_mhz) against the existing carriers. Counts the existing products
+    landing on each candidate and the candidate's own 3rd-order products landing
+    on existing carriers (2*x - f_j ~ f_v). Returns a dict of arrays:
+        freq_mhz, spacing_ok, imd3_2tx, imd5_2tx, imd3_3tx, own_imd3, score, clean
+    Lower score is better; 'clean' means spacing_ok and a score of zero.
+    """
+    grid = [np.arange(start, stop + step_mhz / 2, step_mhz) for start, stop in ranges_mhz if stop >= start]
+    candidates = np.unique(np.round(np.concatenate(grid), 6)) if grid else np.empty(0)
+
+    freqs = np.sort(np.asarray(freqs_mhz, dtype=np.float64))
+    freqs = freqs[~np.isnan(freqs)]
+
+    result = {"freq_mhz": candidates}
+    result["spacing_ok"] = _range_counts(freqs, candidates, carrier_spacing_mhz) == 0
+    result["imd3_2tx"] = _range_counts(_two_tx_products(freqs, 2, 1), candidates, imd3_guard_mhz)
+    result["imd5_2tx"] = _range_counts(_two_tx_products(freqs, 3, 2), candidates, imd5_guard_mhz)
+
+    pair_sums = _pair_sums(freqs) if len(freqs) >= 2 else np.empty(0)
+    result["own_imd3"] = _range_counts(pair_sums, 2 * candidates, imd3_guard_mhz)
+
+    imd3_3tx = np.zeros(len(candidates), dtype=np.int64)
+    if len(freqs) >= 3:
+        step = _rows_per_chunk(len(freqs))
+        for first in range(0, len(candidates), step):
+            chunk = candidates[first:first + step]
+            # f_i + f_j - f_k ~ x  <=>  f_i + f_j ~ x + f_k
+            imd3_3tx[first:first + step] = _range_counts(pair_sums, chunk[:, None] + freqs[None, :], imd3_3tx_guard_mhz).sum(axis=1)
+    result["imd3_3tx"] = imd3_3tx
+
+    result["score"] = sum(SCORE_WEIGHTS[name] * result[name] for name in SCORE_WEIGHTS)
+    result["clean"] = result["spacing_ok"] & (result["score"] == 0)
+    return result
+
+
+def load_band_ranges(path=BANDS_PATH):
+    """[(name, start_mhz, stop_mhz)] from meta_Bands.json."""
+    with open(path, "rb") as f:
+        bands = orjson.loads(f.read())
+    ranges = []
+    for name, band in bands.items():
+        try:
+            ranges.append((name, float(band["Start_MHz"]), float(band["Stop_MHz"])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return ranges
+
+
+def load_tv_channel_ranges(path, default_width_mhz=DEFAULT_TV_CHANNEL_WIDTH_MHZ):
+    """
+    [(label, start_mhz, stop_mhz)] for every channel in a meta_tv_*.json file.
+    Channels listed with explicit start/stop edges are used as-is; channels listed by
+    a single frequency are read the same way the meta frequency index reads them
+    (lower edge or center depending on the system, see channel_bounds).
+    """
+    with open(path, "rb") as f:
+        systems = orjson.loads(f.read())
+
+    ranges = []
+    for system in systems if isinstance(systems, list) else [systems]:
+        system_id = system.get("id", "")
+        channels = system.get("channels", [])
+
+        for channel, start, stop in channel_bounds(channels, system, default_width_mhz):
+            ranges.append((f"{system_id}:{channel.get('channel')}", start, stop))
+
+        for channel in channels:
+            start, stop = channel.get("start_frequency_mhz"), channel.get("stop_frequency_mhz")
+            if isinstance(start, (int, float)) and isinstance(stop, (int, float)):
+                ranges.append((f"{system_id}:{channel.get('channel')}", float(start), float(stop)))
+    return ranges
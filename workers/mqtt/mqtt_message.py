@@ -0,0 +1,125 @@
+# workers/mqtt/mqtt_message.py
+#
+# Purpose: One parsed view of an incoming message, created once per message and
+# shared by every stage: the state cache traffic controller, the subscriber router
+# and the callbacks behind it.
+# Key Class: MqttMessage -> topic, raw payload bytes, receive timestamp, and the
+#            UTF-8 text and JSON decoded lazily, at most once each.
+# Key Decorator: receives_mqtt_message -> marks a router callback that wants the
+#            MqttMessage itself instead of the decoded text.
+#
+# An MqttMessage carries the same topic/payload/qos/retain attributes as paho's
+# MQTTMessage, so it can be handed to anything that takes an on_message 'msg'.
+# The decoded JSON is shared: callbacks must treat it as read-only (copy it to keep
+# a mutable version), since the state cache stores the very same object.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251231.1100.1
+
+import time
+import orjson
+
+current_version = "20251231.1100.1"
+current_version_hash = (20251231 * 1100 * 1)
+
+_UNSET = object()
+_JSON_OPENERS = (ord("{"), ord("["))
+_WHITESPACE = b" \t\r\n"
+
+
+class MqttMessage:
+    """An immutable incoming message with lazily decoded text and JSON."""
+    __slots__ = ("topic", "payload", "qos", "retain", "received", "_text", "_json", "_json_error")
+
+    def __init__(self, topic, payload, qos=0, retain=False, received=None):
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        elif payload is None:
+            payload = b""
+        set_slot = object.__setattr__
+        set_slot(self, "topic", topic)
+        set_slot(self, "payload", bytes(payload))
+        set_slot(self, "qos", qos)
+        set_slot(self, "retain", retain)
+        set_slot(self, "received", time.perf_counter() if received is None else received)
+        set_slot(self, "_text", _UNSET)
+        set_slot(self, "_json", _UNSET)
+        set_slot(self, "_json_error", None)
+
+    @classmethod
+    def from_paho(cls, msg):
+        """Wraps a paho MQTTMessage (or returns 'msg' unchanged if it already is an MqttMessage)."""
+        if isinstance(msg, cls):
+            return msg
+        return cls(msg.topic, msg.payload, getattr(msg, "qos", 0), getattr(msg, "retain", False))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MqttMessage is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("MqttMessage is immutable")
+
+    @property
+    def raw(self):
+        return self.payload
+
+    @property
+    def text(self):
+        """The payload decoded as UTF-8 (decoded on first use). Raises UnicodeDecodeError."""
+        if self._text is _UNSET:
+            object.__setattr__(self, "_text", self.payload.decode("utf-8"))
+        return self._text
+
+    @property
+    def looks_like_json(self):
+        """True when the payload starts (after whitespace) with '{' or '['."""
+        stripped = self.payload.lstrip(_WHITESPACE)
+        return bool(stripped) and stripped[0] in _JSON_OPENERS
+
+    @property
+    def json(self):
+        """The payload parsed as JSON (parsed on first use). Raises orjson.JSONDecodeError, every time, if it is not JSON."""
+        if self._json is _UNSET:
+            if self._json_error is not None:
+                raise self._json_error
+            try:
+                object.__setattr__(self, "_json", orjson.loads(self.payload))
+            except orjson.JSONDecodeError as e:
+                object.__setattr__(self, "_json_error", e)
+                raise
+        return self._json
+
+    def __len__(self):
+        # Truthiness follows the payload, as it did for the raw bytes/str ('' means deleted).
+        return len(self.payload)
+
+    def __str__(self):
+        try:
+            return self.text
+        except UnicodeDecodeError:
+            return repr(self.payload)
+
+    def __repr__(self):
+        return f"MqttMessage(topic={self.topic!r}, payload={self.payload[:64]!r}{'...' if len(self.payload) > 64 else ''})"
+
+
+def receives_mqtt_message(callback):
+    """Marks a router callback as taking (topic, MqttMessage) instead of (topic, text)."""
+    callback.receives_mqtt_message = True
+    return callback
+
+
+def parse_json(payload):
+    """orjson.loads for any payload form, reusing the decoded JSON of an MqttMessage."""
+    if isinstance(payload, MqttMessage):
+        return payload.json
+    return orjson.loads(payload)
@@ -2,28 +2,54 @@
 #
 # Purpose: The ear. Listens to topics and routes them to a callback.
 # Key Function: subscribe_to_topic(topic: str, callback_function)
-# Key Function: _on_message(client, userdata, msg) -> Decodes the byte payload and fires the callback.
+# Key Function: unsubscribe(topic: str, callback_function=None)
+# Key Function: _on_message(client, userdata, msg) -> Wraps the message and fires the matching callbacks.
+# Callbacks marked @receives_mqtt_message get the shared MqttMessage; the rest get its text,
+# decoded once, and only if one of them matched.
 
 import paho.mqtt.client as mqtt
 from workers.logger.logger import  debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_message import MqttMessage
 
 class MqttSubscriberRouter:
     def __init__(self):
         self._subscribers = {}
+        self._client = None # Set once connected; later filters are subscribed straight away
 
     def subscribe_to_topic(self, topic_filter: str, callback_func):
         """
-        Stores a callback function for a given topic filter for later subscription.
-        Actual subscription happens when the client connects/reconnects.
+        Stores a callback function for a given topic filter. The broker subscription is
+        made on connect/reconnect, or right away if the client is already connected.
         """
         self._subscribers[topic_filter] = callback_func
-        debug_logger(message=f"📝 Topic '{topic_filter}' added to pending subscriptions.", **_get_log_args())
+        client = self._client
+        if client is not None and client.is_connected():
+            client.subscribe(topic_filter)
+            debug_logger(message=f"📝 Subscribed to '{topic_filter}'.", **_get_log_args())
+        else:
+            debug_logger(message=f"📝 Topic '{topic_filter}' added to pending subscriptions.", **_get_log_args())
+
+    def unsubscribe(self, topic_filter: str, callback_func=None):
+        """
+        Forgets 'topic_filter' and unsubscribes from it at the broker. With 'callback_func',
+        only if that is still the filter's callback (another subscriber may have replaced it).
+        """
+        current = self._subscribers.get(topic_filter)
+        if current is None or (callback_func is not None and current != callback_func):
+            return False
+        del self._subscribers[topic_filter]
+        client = self._client
+        if client is not None and client.is_connected():
+            client.unsubscribe(topic_filter)
+        debug_logger(message=f"🗑️ Unsubscribed from '{topic_filter}'.", **_get_log_args())
+        return True
 
     def _on_message(self, client, userdata, msg):
         """
         Callback for when an MQTT message is received.
-        It decodes the message and dispatches it to the appropriate subscriber.
+        It dispatches it to the matching subscribers. The payload is only decoded to
+        text for plain callbacks; a non-UTF-8 payload still reaches MqttMessage receivers.
         """
         # TEMP: Raw print to definitively check if messages reach here
         
@@ -31,15 +57,19 @@ class MqttSubscriberRouter:
         # Log that a message was received at the router level
         debug_logger(message=f"📨 MQTT Message Received: Topic='{msg.topic}', Payload='{msg.payload}'", **_get_log_args())
 
-        topic = msg.topic
-        try:
-            payload = msg.payload.decode()
-        except UnicodeDecodeError:
-            debug_logger(message=f"❌ Could not decode payload for topic {topic}", **_get_log_args())
-            return
-            
+        message = MqttMessage.from_paho(msg)
+        topic = message.topic
+
         for topic_filter, callback_func in list(self._subscribers.items()): # Iterate over a copy
             if mqtt.topic_matches_sub(topic_filter, topic):
+                if getattr(callback_func, "receives_mqtt_message", False):
+                    payload = message
+                else:
+                    try:
+                        payload = message.text # Decoded on first use, then shared
+                    except UnicodeDecodeError:
+                        debug_logger(message=f"❌ Could not decode payload for topic {topic}", **_get_log_args())
+                        continue
                 try:
                     callback_func(topic, payload)
                 except Exception as e:
@@ -56,6 +86,7 @@ class MqttSubscriberRouter:
         Instructs the MQTT client to subscribe to all topics registered with this router.
         This is typically called after a successful connection/reconnection.
         """
+        self._client = client
         for topic_filter in list(self._subscribers.keys()): # Iterate over a copy
             client.subscribe(topic_filter)
             debug_logger(message=f"🔄 Resubscribed to {topic_filter}", **_get_log_args())
\ No newline at end of file
@@ -0,0 +1,200 @@
+# workers/mqtt/mqtt_traffic_recorder.py
+#
+# Records broker traffic to a compact binary file so field sessions can be replayed
+# (see mqtt_traffic_replay.py).
+#
+#   python -m workers.mqtt.mqtt_traffic_recorder [out.oamqtt] [--duration S] [--filter OPEN-AIR/#]
+#
+# File layout (little endian):
+#   header   b"OAMQTTR1" | f64 wall-clock start (epoch seconds)
+#   records  u8 kind, then
+#     kind 0 (topic):   u32 topic_id | u16 length | utf-8 topic
+#     kind 1 (message): f64 seconds since start | u32 topic_id | u8 flags (bit0 retain, bits1-2 qos) | u32 length | payload
+# Each topic string is written once; messages refer to it by id.
+#
+# The recorder uses its own paho client, so it can run beside the application or alone.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251231.0900.1
+
+import os
+import sys
+import time
+import struct
+import argparse
+import threading
+from datetime import datetime
+
+import paho.mqtt.client as mqtt
+from workers.setup.config_reader import Config # Import the Config class
+from workers.setup.worker_project_paths import MQTT_RECORDINGS_DIR
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+current_version = "20251231.0900.1"
+current_version_hash = (20251231 * 900 * 1)
+
+FILE_MAGIC = b"OAMQTTR1"
+FILE_EXTENSION = ".oamqtt"
+DEFAULT_TOPIC_FILTER = "OPEN-AIR/#"
+
+RECORD_TOPIC = 0
+RECORD_MESSAGE = 1
+
+_HEADER = struct.Struct("<8sd")
+_KIND = struct.Struct("<B")
+_TOPIC = struct.Struct("<IH")
+_MESSAGE = struct.Struct("<dIBI")
+
+
+class RecordingWriter:
+    """Appends messages to a recording file. Thread-safe."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._lock = threading.Lock()
+        self._topic_ids = {}
+        self._origin = time.perf_counter()
+        self.started = time.time()
+        self.messages = 0
+        self.bytes_written = _HEADER.size
+        self._file.write(_HEADER.pack(FILE_MAGIC, self.started))
+
+    def write(self, topic, payload, qos=0, retain=False, at=None):
+        """Records one message; 'at' is a time.perf_counter() value (default: now)."""
+        offset = (time.perf_counter() if at is None else at) - self._origin
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        flags = (1 if retain else 0) | ((qos & 0x3) << 1)
+        with self._lock:
+            topic_id = self._topic_ids.get(topic)
+            if topic_id is None:
+                topic_id = len(self._topic_ids)
+                self._topic_ids[topic] = topic_id
+                encoded = topic.encode("utf-8")
+                self._write(_KIND.pack(RECORD_TOPIC) + _TOPIC.pack(topic_id, len(encoded)) + encoded)
+            self._write(_KIND.pack(RECORD_MESSAGE) + _MESSAGE.pack(offset, topic_id, flags, len(payload)))
+            self._write(payload)
+            self.messages += 1
+
+    def _write(self, data):
+        self._file.write(data)
+        self.bytes_written += len(data)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_recording(path):
+    """
+    Yields (seconds_since_start, topic, payload_bytes, qos, retain) for every message
+    in a recording. The wall-clock start is available via read_recording_start().
+    """
+    with open(path, "rb") as f:
+        magic, _ = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != FILE_MAGIC:
+            raise ValueError(f"'{path}' is not an OPEN-AIR MQTT recording")
+        topics = {}
+        while True:
+            kind = f.read(_KIND.size)
+            if not kind:
+                return
+            if kind[0] == RECORD_TOPIC:
+                topic_id, length = _TOPIC.unpack(f.read(_TOPIC.size))
+                topics[topic_id] = f.read(length).decode("utf-8")
+            elif kind[0] == RECORD_MESSAGE:
+                header = f.read(_MESSAGE.size)
+                if len(header) < _MESSAGE.size:
+                    return # Truncated by a crash mid-write
+                offset, topic_id, flags, length = _MESSAGE.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                yield offset, topics[topic_id], payload, (flags >> 1) & 0x3, bool(flags & 1)
+            else:
+                raise ValueError(f"Corrupt record kind {kind[0]} in '{path}'")
+
+
+def read_recording_start(path):
+    with open(path, "rb") as f:
+        magic, started = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != FILE_MAGIC:
+        raise ValueError(f"'{path}' is not an OPEN-AIR MQTT recording")
+    return started
+
+
+def default_recording_path():
+    return MQTT_RECORDINGS_DIR / f"mqtt_{datetime.now().strftime('%Y%m%d_%H%M%S')}{FILE_EXTENSION}"
+
+
+class MqttTrafficRecorder:
+    """Subscribes to 'topic_filter' on its own client and writes everything it hears."""
+
+    def __init__(self, path=None, topic_filter=DEFAULT_TOPIC_FILTER, address=None, port=None):
+        self.path = path or default_recording_path()
+        self.topic_filter = topic_filter
+        self.address = address if address is not None else app_constants.MQTT_BROKER_ADDRESS
+        self.port = port if port is not None else app_constants.MQTT_BROKER_PORT
+        self.writer = None
+        self.client = None
+
+    def start(self):
+        self.writer = RecordingWriter(self.path)
+        self.client = mqtt.Client()
+        if app_constants.MQTT_USERNAME and app_constants.MQTT_PASSWORD:
+            self.client.username_pw_set(app_constants.MQTT_USERNAME, app_constants.MQTT_PASSWORD)
+        self.client.on_connect = lambda client, userdata, flags, rc: client.subscribe(self.topic_filter)
+        self.client.on_message = self._on_message
+        self.client.connect(host=self.address, port=self.port, keepalive=60)
+        self.client.loop_start()
+
+    def _on_message(self, client, userdata, msg):
+        self.writer.write(msg.topic, msg.payload, msg.qos, msg.retain)
+
+    def stop(self):
+        if self.client:
+            self.client.loop_stop()
+            self.client.disconnect()
+        if self.writer:
+            self.writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record OPEN-AIR MQTT traffic to a replayable file.")
+    parser.add_argument("path", nargs="?", help=f"output file (default: {MQTT_RECORDINGS_DIR}/mqtt_<timestamp>{FILE_EXTENSION})")
+    parser.add_argument("--duration", type=float, default=None, help="stop after this many seconds (default: Ctrl+C)")
+    parser.add_argument("--filter", default=DEFAULT_TOPIC_FILTER, help="topic filter to record")
+    parser.add_argument("--broker", default=None, help="broker address (default: config.ini)")
+    parser.add_argument("--port", type=int, default=None, help="broker port (default: config.ini)")
+    args = parser.parse_args(argv)
+
+    recorder = MqttTrafficRecorder(args.path, args.filter, args.broker, args.port)
+    recorder.start()
+    print(f"⏺️ Recording '{args.filter}' to {recorder.path}. Ctrl+C to stop.")
+    started = time.monotonic()
+    try:
+        while args.duration is None or time.monotonic() - started < args.duration:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recorder.stop()
+    print(f"⏹️ {recorder.writer.messages} messages, {recorder.writer.bytes_written / 1024:.1f} KiB in {time.monotonic() - started:.1f} s.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+# workers/mqtt/mqtt_traffic_replay.py
+#
+# Replays a recording made by mqtt_traffic_recorder.py, for deterministic load tests
+# of the state cache, mirror engine, trace pipeline and widgets.
+#
+#   python -m workers.mqtt.mqtt_traffic_replay rec.oamqtt [--speed 1|10|max] [--target broker|router] [--report out.json]
+#
+# Targets:
+#   broker  republishes to the broker (config.ini or --broker) and measures end-to-end
+#           latency with a second client subscribed to the same topics.
+#   router  feeds the messages straight into an on_message(client, userdata, msg)
+#           callback with no broker at all. From the command line that is a
+#           RouterHarness: a MqttSubscriberRouter with the state cache traffic
+#           controller (in memory; the snapshot on disk is not touched), the
+#           TraceMathPipeline and a StateMirrorEngine on a HeadlessLoop with a widget
+#           registered for every recorded OPEN-AIR topic, as in the mqtt-to-widget benchmark.
+#           From code, pass any callback, e.g. StateCacheManager.handle_incoming_mqtt.
+#
+# The report gives dispatch lateness against the recorded schedule, the time spent
+# in the handler (router) or broker round trip (broker), and the slowest topics.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251231.0900.2
+
+import sys
+import time
+import argparse
+import threading
+from collections import defaultdict, deque
+
+import orjson
+from workers.mqtt.mqtt_traffic_recorder import read_recording, DEFAULT_TOPIC_FILTER
+from workers.setup.config_reader import Config # Import the Config class
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+current_version = "20251231.0900.2"
+current_version_hash = (20251231 * 900 * 2)
+
+TARGET_BROKER = "broker"
+TARGET_ROUTER = "router"
+# How long to wait for in-flight messages after the last publish in broker mode.
+DRAIN_TIMEOUT_S = 2.0
+SLOWEST_TOPICS = 10
+HARNESS_BASE_TOPIC = "OPEN-AIR"
+
+
+class ReplayMessage:
+    """Stands in for paho's MQTTMessage when replaying without a broker."""
+    __slots__ = ("topic", "payload", "qos", "retain", "timestamp", "mid")
+
+    def __init__(self, topic, payload, qos=0, retain=False):
+        self.topic = topic
+        self.payload = payload
+        self.qos = qos
+        self.retain = retain
+        self.timestamp = time.monotonic()
+        self.mid = 0
+
+
+def latency_stats(samples_s):
+    """Summary of a list of durations in seconds, reported in milliseconds."""
+    if not samples_s:
+        return {"count": 0}
+    ordered = sorted(samples_s)
+    count = len(ordered)
+
+    def percentile(p):
+        return round(ordered[min(count - 1, int(p / 100.0 * count))] * 1000.0, 3)
+
+    return {
+        "count": count,
+        "mean": round(sum(ordered) / count * 1000.0, 3),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": round(ordered[-1] * 1000.0, 3),
+    }
+
+
+def parse_speed(text):
+    """'1', '10', '10x' -> float; 'max' -> None (no pacing)."""
+    text = str(text).strip().lower()
+    if text in ("max", "0", ""):
+        return None
+    speed = float(text[:-1] if text.endswith("x") else text)
+    if speed <= 0:
+        raise ValueError("speed must be positive or 'max'")
+    return speed
+
+
+def replay(path, speed=1.0, on_message=None, client=None, measure_topic_filter=DEFAULT_TOPIC_FILTER, address=None, port=None):
+    """
+    Replays 'path' into on_message(client, userdata, msg) or, if none is given, to a
+    broker through 'client' (a connected paho client; one is created when omitted).
+    'speed' is a multiple of real time, or None for as fast as possible.
+    Returns the latency report as a dict.
+    """
+    to_broker = on_message is None
+    own_client = None
+    probe = None
+    if to_broker:
+        if client is None:
+            own_client = client = _connect(address, port)
+        probe = _EndToEndProbe(measure_topic_filter, address, port)
+
+    lateness = []
+    handler = []
+    handler_by_topic = defaultdict(float)
+    messages = 0
+    recorded_duration = 0.0
+
+    wall_start = time.perf_counter()
+    for offset, topic, payload, qos, retain in read_recording(path):
+        recorded_duration = offset
+        if speed is not None:
+            due = wall_start + offset / speed
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            lateness.append(max(0.0, time.perf_counter() - due))
+
+        if to_broker:
+            probe.sent(topic)
+            client.publish(topic, payload, qos=qos, retain=retain)
+        else:
+            started = time.perf_counter()
+            on_message(None, None, ReplayMessage(topic, payload, qos, retain))
+            elapsed = time.perf_counter() - started
+            handler.append(elapsed)
+            handler_by_topic[topic] += elapsed
+        messages += 1
+    duration = time.perf_counter() - wall_start
+
+    report = {
+        "recording": str(path),
+        "target": TARGET_BROKER if to_broker else TARGET_ROUTER,
+        "speed": "max" if speed is None else speed,
+        "messages": messages,
+        "recorded_duration_s": round(recorded_duration, 3),
+        "duration_s": round(duration, 3),
+        "rate_msg_s": round(messages / duration, 1) if duration > 0 else None,
+        "lateness_ms": latency_stats(lateness),
+    }
+    if to_broker:
+        end_to_end, lost = probe.finish()
+        report["end_to_end_ms"] = latency_stats(end_to_end)
+        report["lost"] = lost
+        if own_client:
+            own_client.loop_stop()
+            own_client.disconnect()
+    else:
+        report["handler_ms"] = latency_stats(handler)
+        report["slowest_topics"] = [
+            {"topic": topic, "total_ms": round(total * 1000.0, 3)}
+            for topic, total in sorted(handler_by_topic.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_TOPICS]
+        ]
+    return report
+
+
+def _connect(address=None, port=None, on_message=None, topic_filter=None):
+    import paho.mqtt.client as mqtt
+    client = mqtt.Client()
+    if app_constants.MQTT_USERNAME and app_constants.MQTT_PASSWORD:
+        client.username_pw_set(app_constants.MQTT_USERNAME, app_constants.MQTT_PASSWORD)
+    subscribed = threading.Event()
+    if topic_filter:
+        client.on_connect = lambda c, userdata, flags, rc: c.subscribe(topic_filter)
+        client.on_subscribe = lambda c, userdata, mid, granted_qos: subscribed.set()
+    else:
+        subscribed.set()
+    if on_message:
+        client.on_message = on_message
+    client.connect(host=address if address is not None else app_constants.MQTT_BROKER_ADDRESS,
+                   port=port if port is not None else app_constants.MQTT_BROKER_PORT, keepalive=60)
+    client.loop_start()
+    subscribed.wait(5.0)
+    return client
+
+
+class _EndToEndProbe:
+    """A second client that times each replayed message from publish to delivery."""
+
+    def __init__(self, topic_filter, address, port):
+        self._lock = threading.Lock()
+        self._in_flight = defaultdict(deque) # topic -> send times, oldest first
+        self._pending = 0
+        self.samples = []
+        self.client = _connect(address, port, on_message=self._on_message, topic_filter=topic_filter)
+
+    def sent(self, topic):
+        with self._lock:
+            self._in_flight[topic].append(time.perf_counter())
+            self._pending += 1
+
+    def _on_message(self, client, userdata, msg):
+        if msg.retain:
+            return # Stored state delivered on subscribe, not one of ours
+        received = time.perf_counter()
+        with self._lock:
+            queue = self._in_flight.get(msg.topic)
+            if queue:
+                self.samples.append(received - queue.popleft())
+                self._pending -= 1
+
+    def finish(self):
+        deadline = time.monotonic() + DRAIN_TIMEOUT_S
+        while self._pending and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.client.loop_stop()
+        self.client.disconnect()
+        return self.samples, self._pending
+
+
+class RouterHarness:
+    """
+    The broker-less consumer stack used by '--target router', callable as its on_message.
+    A HeadlessLoop thread plays the Tk thread, so mirror updates really reach the widgets.
+    """
+
+    def __init__(self, widget_topics=()):
+        from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+        from workers.traces.trace_math_pipeline import TraceMathPipeline
+        from workers.logic.state_mirror_engine import StateMirrorEngine
+        from workers.logic.benchmark_mqtt_to_widget import VirtualVar
+        from workers.setup.headless_loop import HeadlessLoop
+
+        self.cache = {}
+        self.subscriber_router = MqttSubscriberRouter()
+        self.trace_pipeline = TraceMathPipeline(subscriber_router=self.subscriber_router)
+
+        self.loop = HeadlessLoop()
+        self.state_mirror_engine = StateMirrorEngine(base_topic=HARNESS_BASE_TOPIC, subscriber_router=self.subscriber_router, root=self.loop, state_cache_manager=None)
+        self.widgets = {} # topic -> VirtualVar
+        for topic in sorted(set(widget_topics)):
+            if not topic.startswith(f"{HARNESS_BASE_TOPIC}/") or topic.count("/") < 2:
+                continue
+            tab_name, widget_id = topic[len(HARNESS_BASE_TOPIC) + 1:].rsplit("/", 1)
+            var = VirtualVar()
+            self.state_mirror_engine.register_widget(widget_id, var, tab_name, {})
+            self.subscriber_router.subscribe_to_topic(topic, self.state_mirror_engine.sync_incoming_mqtt_to_gui)
+            self.widgets[topic] = var
+
+        self._loop_thread = threading.Thread(target=self.loop.mainloop, name="ReplayHeadlessLoop", daemon=True)
+        self._loop_thread.start()
+
+    def __call__(self, client, userdata, msg):
+        from workers.State_Cache import cache_traffic_controller
+        from workers.mqtt.mqtt_message import MqttMessage
+        # One MqttMessage for the cache and every router callback, as in StateCacheManager.
+        message = MqttMessage.from_paho(msg)
+        should_process, new_payload = cache_traffic_controller.process_traffic(message.topic, message, self.cache)
+        if should_process:
+            self.cache[message.topic] = new_payload
+        self.subscriber_router._on_message(client, userdata, message)
+
+    def close(self, timeout=DRAIN_TIMEOUT_S):
+        """Lets the loop apply the queued widget updates, then stops it."""
+        deadline = time.monotonic() + timeout
+        while not self.state_mirror_engine.update_queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.loop.quit()
+        self._loop_thread.join(timeout)
+
+
+def build_router_harness(widget_topics=()):
+    """The broker-less consumer stack used by '--target router'. Returns its on_message callback."""
+    return RouterHarness(widget_topics)
+
+
+def format_report(report):
+    lines = [
+        f"▶️ {report['messages']} messages from {report['recording']} -> {report['target']} at speed {report['speed']}",
+        f"   {report['duration_s']} s wall ({report['recorded_duration_s']} s recorded), {report['rate_msg_s']} msg/s",
+    ]
+    for key in ("lateness_ms", "handler_ms", "end_to_end_ms"):
+        stats = report.get(key)
+        if stats and stats.get("count"):
+            lines.append(f"   {key:<14} mean {stats['mean']:>9} p50 {stats['p50']:>9} p95 {stats['p95']:>9} p99 {stats['p99']:>9} max {stats['max']:>9}")
+    if "lost" in report:
+        lines.append(f"   lost           {report['lost']}")
+    for entry in report.get("slowest_topics", []):
+        lines.append(f"   {entry['total_ms']:>10.3f} ms  {entry['topic']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay an OPEN-AIR MQTT recording and report latency.")
+    parser.add_argument("path", help="recording made by workers.mqtt.mqtt_traffic_recorder")
+    parser.add_argument("--speed", default="1", help="multiple of real time (1, 10, 10x) or 'max'")
+    parser.add_argument("--target", choices=(TARGET_BROKER, TARGET_ROUTER), default=TARGET_BROKER)
+    parser.add_argument("--broker", default=None, help="broker address (default: config.ini)")
+    parser.add_argument("--port", type=int, default=None, help="broker port (default: config.ini)")
+    parser.add_argument("--report", default=None, help="also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    on_message = None
+    if args.target == TARGET_ROUTER:
+        on_message = build_router_harness({topic for _, topic, _, _, _ in read_recording(args.path)})
+    report = replay(args.path, speed=parse_speed(args.speed), on_message=on_message, address=args.broker, port=args.port)
+    if on_message is not None:
+        on_message.close()
+    print(format_report(report))
+    if args.report:
+        with open(args.report, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,9 @@ def create_default_config_ini(config_path: pathlib.Path, silent: bool = False):
     config['Mode'] = {
         'PERFORMANCE_MODE': 'False',
         'SKIP_DEP_CHECK': 'False',
-        'CLEAN_INSTALL_MODE': 'True'
+        'CLEAN_INSTALL_MODE': 'True',
+        'VISA_FLEET_PROCESS': 'False',
+        'TRACE_SHARED_MEMORY': 'False'
     }
 
     config['Debug'] = {
@@ -29,7 +31,9 @@ def create_default_config_ini(config_path: pathlib.Path, silent: bool = False):
 
     config['UI'] = {
         'LAYOUT_SPLIT_EQUAL': '50',
-        'LAYOUT_FULL_WEIGHT': '100'
+        'LAYOUT_FULL_WEIGHT': '100',
+        'RENDER_FPS': '30',
+        'PREWARM_TABS': 'True'
     }
 
     config['MQTT'] = {
@@ -15,6 +15,9 @@ class Config:
     PERFORMANCE_MODE = True
     SKIP_DEP_CHECK = True
     CLEAN_INSTALL_MODE = False
+    VISA_FLEET_PROCESS = False # Run the VISA fleet and YAK layer in a child process
+    TRACE_SHARED_MEMORY = False # Hand sweeps to same-host readers through a shared-memory ring
+    # (ring notifications are not retained: a reader that subscribes later waits for the next sweep)
     ENABLE_DEBUG_MODE = False
     ENABLE_DEBUG_FILE = False
     ENABLE_DEBUG_SCREEN = False
@@ -23,6 +26,8 @@ class Config:
     UI_LAYOUT_SPLIT_EQUAL = 50
     UI_LAYOUT_FULL_WEIGHT = 100
     SHOW_RELOAD_BUTTON = True
+    UI_RENDER_FPS = 30
+    UI_PREWARM_TABS = True
     MQTT_BROKER_ADDRESS = "localhost"
     MQTT_BROKER_PORT = 1883
     MQTT_USERNAME = None
@@ -92,6 +97,8 @@ class Config:
             self.PERFORMANCE_MODE = config['Mode'].getboolean('PERFORMANCE_MODE', self.PERFORMANCE_MODE)
             self.SKIP_DEP_CHECK = config['Mode'].getboolean('SKIP_DEP_CHECK', self.SKIP_DEP_CHECK)
             self.CLEAN_INSTALL_MODE = config['Mode'].getboolean('CLEAN_INSTALL_MODE', self.CLEAN_INSTALL_MODE)
+            self.VISA_FLEET_PROCESS = config['Mode'].getboolean('VISA_FLEET_PROCESS', self.VISA_FLEET_PROCESS)
+            self.TRACE_SHARED_MEMORY = config['Mode'].getboolean('TRACE_SHARED_MEMORY', self.TRACE_SHARED_MEMORY)
 
         if 'Debug' in config:
             self.ENABLE_DEBUG_MODE = config['Debug'].getboolean('ENABLE_DEBUG_MODE', self.ENABLE_DEBUG_MODE)
@@ -104,6 +111,8 @@ class Config:
             self.UI_LAYOUT_SPLIT_EQUAL = int(config['UI'].get('LAYOUT_SPLIT_EQUAL', self.UI_LAYOUT_SPLIT_EQUAL))
             self.UI_LAYOUT_FULL_WEIGHT = int(config['UI'].get('LAYOUT_FULL_WEIGHT', self.UI_LAYOUT_FULL_WEIGHT))
             self.SHOW_RELOAD_BUTTON = config['UI'].getboolean('SHOW_RELOAD_BUTTON', self.SHOW_RELOAD_BUTTON)
+            self.UI_RENDER_FPS = int(config['UI'].get('RENDER_FPS', self.UI_RENDER_FPS))
+            self.UI_PREWARM_TABS = config['UI'].getboolean('PREWARM_TABS', self.UI_PREWARM_TABS)
 
         if 'MQTT' in config:
             self.MQTT_BROKER_ADDRESS = config['MQTT'].get('BROKER_ADDRESS', self.MQTT_BROKER_ADDRESS)
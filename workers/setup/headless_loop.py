@@ -0,0 +1,102 @@
+# workers/setup/headless_loop.py
+#
+# A thread-based stand-in for the Tk root in headless mode. It provides the small
+# part of the Tk API the managers rely on (after, after_idle, after_cancel,
+# mainloop, quit) on top of a timer heap, so StateMirrorEngine and friends run
+# unchanged without a display. Callbacks run one at a time on the thread that
+# called mainloop(), exactly like Tk callbacks run on the Tk thread.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.2100.1
+
+import heapq
+import itertools
+import threading
+import time
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20251230.2100.1"
+current_version_hash = (20251230 * 2100 * 1)
+
+
+class HeadlessLoop:
+    """Timer-heap event loop with Tk's after()/mainloop() interface."""
+
+    def __init__(self):
+        self._timers = [] # (due, sequence, after_id, func, args)
+        self._cancelled = set()
+        self._sequence = itertools.count()
+        self._wakeup = threading.Condition()
+        self._running = False
+
+    def after(self, ms, func=None, *args):
+        """Schedules func(*args) after 'ms' milliseconds. Safe to call from any thread."""
+        if func is None:
+            time.sleep(ms / 1000.0)
+            return None
+        sequence = next(self._sequence)
+        after_id = f"after#{sequence}"
+        with self._wakeup:
+            heapq.heappush(self._timers, (time.monotonic() + ms / 1000.0, sequence, after_id, func, args))
+            self._wakeup.notify()
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        with self._wakeup:
+            self._cancelled.add(after_id)
+
+    def mainloop(self):
+        """Runs callbacks as they come due until quit() is called."""
+        self._running = True
+        while self._running:
+            with self._wakeup:
+                while self._running:
+                    if self._timers:
+                        wait = self._timers[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._wakeup.wait(wait)
+                    else:
+                        self._wakeup.wait()
+                if not self._running:
+                    break
+                _, _, after_id, func, args = heapq.heappop(self._timers)
+                if after_id in self._cancelled:
+                    self._cancelled.discard(after_id)
+                    continue
+
+            try:
+                func(*args)
+            except Exception as e:
+                debug_logger(message=f"❌ Error in headless callback {getattr(func, '__name__', func)}: {e}", **_get_log_args())
+
+    def quit(self):
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify()
+
+    # Tk compatibility no-ops for code that pokes at the root.
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_exists(self):
+        return self._running
+
+    def destroy(self):
+        self.quit()
@@ -0,0 +1,110 @@
+# workers/setup/headless_service.py
+#
+# Headless service mode ("python OpenAir.py --headless"). Runs the state cache,
+# MQTT bridge, VISA fleet, YAK translator / RX and trace pipeline with no Tk, no
+# splash and no GUI modules imported, on a HeadlessLoop standing in for the Tk
+# root. GUI clients elsewhere talk to it over MQTT. Stops on Ctrl+C / SIGTERM.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.2100.1
+
+import signal
+import pathlib
+import threading
+from workers.setup import startup_tracer
+from workers.setup.config_reader import Config # Import the Config class
+from workers.logger.logger import debug_logger, console_log
+from workers.logger.log_utils import _get_log_args
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+current_version = "20251230.2100.1"
+current_version_hash = (20251230 * 2100 * 1)
+
+HEADLESS_FLAG = "--headless"
+
+
+def headless_requested(argv):
+    return HEADLESS_FLAG in argv
+
+
+def run_headless():
+    """Starts the managers on a HeadlessLoop and blocks until stopped. Returns an exit code."""
+    from workers.setup.path_initializer import initialize_paths
+    from workers.logger.logger import set_log_directory
+    from workers.setup.console_encoder import configure_console_encoding
+    from workers.setup.application_initializer import initialize_app
+    from workers.setup.headless_loop import HeadlessLoop
+    from managers.dependancy import dependancy_checker
+    import workers.watchdog.watchdog as watchdog
+
+    with startup_tracer.span("paths & logging"):
+        _, data_dir = initialize_paths()
+        set_log_directory(pathlib.Path(data_dir) / "debug")
+        configure_console_encoding()
+    watchdog.start_heartbeat(debug_logger, app_constants)
+
+    with startup_tracer.span("initialize_app"):
+        if not initialize_app():
+            debug_logger(message="❌ Critical initialization failed. Headless service will now exit.", **_get_log_args())
+            return 1
+
+    def conditional_console_print(message):
+        if app_constants.global_settings["debug_enabled"]:
+            debug_logger(message=message, **_get_log_args())
+    with startup_tracer.span("dependancy pre-check"):
+        dependancy_checker.run_interactive_pre_check(conditional_console_print, debug_logger, app_constants)
+
+    loop = HeadlessLoop()
+
+    with startup_tracer.span("MQTT connection & state cache"):
+        from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
+        from workers.State_Cache.state_cache_manager import StateCacheManager
+        from managers.manager_launcher import launch_managers
+        mqtt_connection_manager = MqttConnectionManager()
+        state_cache_manager = StateCacheManager(mqtt_connection_manager)
+
+    with startup_tracer.span("launch_managers"):
+        managers = launch_managers(app=None, splash=None, root=loop, state_cache_manager=state_cache_manager, mqtt_connection_manager=mqtt_connection_manager)
+    if managers is None:
+        debug_logger(message="❌ Manager launch failed. Headless service will now exit.", **_get_log_args())
+        return 1
+
+    def request_stop(signum=None, frame=None):
+        loop.quit()
+
+    # Signal handlers can only be installed from the main thread.
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, request_stop)
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, request_stop)
+
+    startup_tracer.finish_startup()
+    console_log(f"🛰️ OPEN-AIR headless service running (started in {startup_tracer.startup_duration_ms():.0f} ms). Ctrl+C to stop.")
+
+    try:
+        loop.mainloop()
+    finally:
+        _shutdown(managers)
+    return 0
+
+
+def _shutdown(managers):
+    debug_logger(message="🛑 Headless service shutting down.", **_get_log_args())
+    try:
+        managers["visa_fleet_manager"].stop()
+    except Exception as e:
+        debug_logger(message=f"❌ Error stopping the VISA fleet: {e}", **_get_log_args())
+    try:
+        managers["mqtt_connection_manager"].disconnect()
+    except Exception as e:
+        debug_logger(message=f"❌ Error disconnecting from MQTT: {e}", **_get_log_args())
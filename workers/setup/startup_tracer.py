@@ -0,0 +1,232 @@
+# workers/setup/startup_tracer.py
+#
+# A lightweight span tracer for application startup (and any later GUI builds).
+#
+# Spans are recorded with perf_counter timestamps and thread ids; on exit they are
+# written to DATA/debug/startup_trace.json in Chrome trace format (open it in
+# chrome://tracing or https://ui.perfetto.dev) and summarized as a table on the
+# terminal. With --profile-startup, every startup thread also runs under cProfile
+# and the merged hot-function list is dumped once the main window is revealed.
+#
+# This module must stay import-light: it is imported before Config is read.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.2000.1
+
+import os
+import io
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+import orjson
+from workers.setup.worker_project_paths import DEBUG_DIR
+
+current_version = "20251230.2000.1"
+current_version_hash = (20251230 * 2000 * 1)
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+TRACE_FILE_NAME = "startup_trace.json"
+PROFILE_FILE_NAME = "startup_profile.prof"
+# Spans beyond this are dropped, so a long session cannot grow the trace forever.
+MAX_SPANS = 20000
+PROFILE_TOP_FUNCTIONS = 30
+
+_origin = time.perf_counter()
+_pid = os.getpid()
+_lock = threading.Lock()
+_spans = [] # (name, category, start_s, end_s, thread_id)
+_thread_names = {}
+_instants = [] # (name, time_s, thread_id)
+_startup_finished = None
+
+_profiling_enabled = False
+_profiles = [] # cProfile.Profile per profiled thread
+_main_profile = None
+
+
+def add_span(name, start, end, category="startup"):
+    """Records an already-measured span; start/end are time.perf_counter() values."""
+    thread = threading.current_thread()
+    with _lock:
+        if len(_spans) >= MAX_SPANS:
+            return
+        _spans.append((name, category, start, end, thread.ident))
+        _thread_names[thread.ident] = thread.name
+
+
+@contextmanager
+def span(name, category="startup"):
+    """Times the enclosed block as one span."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_span(name, start, time.perf_counter(), category)
+
+
+def mark(name):
+    """Records an instant event (a vertical line in the trace viewer)."""
+    thread = threading.current_thread()
+    with _lock:
+        _instants.append((name, time.perf_counter(), thread.ident))
+        _thread_names[thread.ident] = thread.name
+
+
+def finish_startup():
+    """Marks the end of startup and stops/dumps the startup profile if one is running."""
+    global _startup_finished
+    if _startup_finished is not None:
+        return
+    _startup_finished = time.perf_counter()
+    mark("startup complete")
+    _stop_profiling()
+
+
+def startup_duration_ms():
+    if _startup_finished is None:
+        return None
+    return (_startup_finished - _origin) * 1000.0
+
+
+# --- Profiling ---
+
+def profiling_requested(argv):
+    return PROFILE_STARTUP_FLAG in argv
+
+
+def start_profiling():
+    """Starts cProfile on the calling (main) thread; other threads opt in with profile_thread()."""
+    global _profiling_enabled, _main_profile
+    import cProfile
+    _profiling_enabled = True
+    _main_profile = cProfile.Profile()
+    _profiles.append(_main_profile)
+    _main_profile.enable()
+
+
+@contextmanager
+def profile_thread():
+    """Profiles the enclosed block on the current thread when --profile-startup is active."""
+    if not _profiling_enabled or _startup_finished is not None:
+        yield
+        return
+    import cProfile
+    profile = cProfile.Profile()
+    with _lock:
+        _profiles.append(profile)
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+
+
+def _stop_profiling():
+    global _profiling_enabled
+    if not _profiling_enabled:
+        return
+    _profiling_enabled = False
+    if _main_profile is not None:
+        _main_profile.disable()
+
+    import pstats
+    with _lock:
+        profiles = list(_profiles)
+    stats = None
+    for profile in profiles:
+        try:
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        except TypeError:
+            continue # A profile that never ran
+    if stats is None:
+        return
+
+    try:
+        os.makedirs(DEBUG_DIR, exist_ok=True)
+        stats.dump_stats(os.path.join(DEBUG_DIR, PROFILE_FILE_NAME))
+    except OSError as e:
+        print(f"❌ Could not write the startup profile: {e}")
+
+    for sort_key in ("cumulative", "tottime"):
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats(sort_key).print_stats(PROFILE_TOP_FUNCTIONS)
+        print(f"\n🔥 Startup profile, top {PROFILE_TOP_FUNCTIONS} by {sort_key}:\n{buffer.getvalue()}")
+
+
+# --- Export ---
+
+def export_chrome_trace(path=None):
+    """Writes every span recorded so far as Chrome trace JSON. Returns the path."""
+    path = path or os.path.join(DEBUG_DIR, TRACE_FILE_NAME)
+    with _lock:
+        spans, instants, thread_names = list(_spans), list(_instants), dict(_thread_names)
+
+    def us(t):
+        return round((t - _origin) * 1_000_000, 1)
+
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": name}}
+        for tid, name in thread_names.items()
+    ]
+    events += [
+        {"name": name, "cat": category, "ph": "X", "ts": us(start), "dur": round((end - start) * 1_000_000, 1), "pid": _pid, "tid": tid}
+        for name, category, start, end, tid in spans
+    ]
+    events += [
+        {"name": name, "ph": "i", "s": "p", "ts": us(t), "pid": _pid, "tid": tid}
+        for name, t, tid in instants
+    ]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(orjson.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+    return path
+
+
+def summary_table():
+    """Spans aggregated by name, in order of first start, as a printable table."""
+    with _lock:
+        spans = list(_spans)
+
+    rows = {}
+    for name, category, start, end, _ in spans:
+        row = rows.setdefault(name, {"category": category, "first_ms": (start - _origin) * 1000.0, "count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        elapsed_ms = (end - start) * 1000.0
+        row["count"] += 1
+        row["total_ms"] += elapsed_ms
+        row["max_ms"] = max(row["max_ms"], elapsed_ms)
+
+    width = max([len(name) for name in rows] + [4])
+    lines = [f"{'span':<{width}}  {'category':<10} {'at ms':>9} {'count':>6} {'total ms':>10} {'max ms':>9}"]
+    for name, row in sorted(rows.items(), key=lambda item: item[1]["first_ms"]):
+        lines.append(f"{name:<{width}}  {row['category']:<10} {row['first_ms']:>9.1f} {row['count']:>6} {row['total_ms']:>10.1f} {row['max_ms']:>9.1f}")
+    if _startup_finished is not None:
+        lines.append(f"Startup complete after {startup_duration_ms():.1f} ms.")
+    return "\n".join(lines)
+
+
+def _export_on_exit():
+    if not _spans:
+        return
+    try:
+        path = export_chrome_trace()
+        print(f"\n⏱️ Startup timeline ({path}):\n{summary_table()}")
+    except Exception as e:
+        print(f"❌ Could not export the startup trace: {e}")
+
+
+atexit.register(_export_on_exit)
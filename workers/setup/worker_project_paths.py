@@ -64,6 +64,13 @@ MARKERS_CSV_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "MARKERS.csv"
 DEVICE_STATE_SNAPSHOT_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "device_state_snapshot.json"
 YAKETY_YAK_REPO_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "YAKETYYAK.json"
 PRESET_REPO_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "PRESET.csv"
+LAYOUT_MANIFEST_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "layout_manifest.json"
+IMPORT_CACHE_DIR = GLOBAL_PROJECT_ROOT / "DATA" / "import_cache"
+META_INDEX_CACHE_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "meta_frequency_index.npz"
+DEBUG_DIR = GLOBAL_PROJECT_ROOT / "DATA" / "debug"
+DEPENDENCY_CHECK_CACHE_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "dependency_check.json"
+MQTT_RECORDINGS_DIR = GLOBAL_PROJECT_ROOT / "DATA" / "recordings"
+BENCHMARK_RESULTS_DIR = GLOBAL_PROJECT_ROOT / "DATA" / "benchmarks"
 
 def get_absolute_path(relative_path: str):
     """
@@ -0,0 +1,335 @@
+# workers/traces/trace_math_pipeline.py
+#
+# The Averager: a NumPy trace-processing stage that sits on the raw trace topics
+# coming back from the YAK layer and keeps running Average / Max-Hold / Min-Hold
+# buffers per trace, plus a Delta against a stored reference trace.
+# All buffers are allocated once per trace length and updated in place, so thousands
+# of sweeps cost no per-sweep allocations beyond parsing the incoming payload.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261018.120000.1
+
+import os
+import time
+import threading
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.setup.config_reader import Config # Import the Config class
+from workers.mqtt.mqtt_publisher_service import publish_payload
+from workers.traces.trace_shared_memory import decode_trace_payload
+from workers.mqtt.mqtt_message import MqttMessage, receives_mqtt_message
+
+app_constants = Config.get_instance() # Get the singleton instance
+
+# --- Graceful Dependency Importing ---
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# --- Global Scope Variables ---
+current_version = "20261018.120000.1"
+current_version_hash = (20261018 * 120000 * 1)
+current_file = f"{os.path.basename(__file__)}"
+
+# --- Constants ---
+TOPIC_DELIMITER = "/"
+# YakRxManager publishes to OPEN-AIR/yak/<4 path parts>/Outputs/<key>/value
+RAW_TRACE_TOPIC_FILTER = "OPEN-AIR/yak/+/+/+/+/Outputs/trace_data/value"
+DERIVED_TRACE_BASE_TOPIC = "OPEN-AIR/Traces"
+CONTROL_BASE_TOPIC = "OPEN-AIR/Spectrum/plotting/averaging/Trace_Math"
+
+AVERAGE_MODE_LINEAR = "linear"
+AVERAGE_MODE_EXPONENTIAL = "exponential"
+DEFAULT_AVERAGE_COUNT = 16
+
+DERIVED_AVERAGE = "Average"
+DERIVED_MAX_HOLD = "Max_Hold"
+DERIVED_MIN_HOLD = "Min_Hold"
+DERIVED_DELTA = "Delta"
+
+
+class TraceBuffers:
+    """
+    Holds the in-place math buffers for a single trace source.
+    Buffers are only (re)allocated when the trace length changes.
+    """
+    def __init__(self, average_mode=AVERAGE_MODE_LINEAR, average_count=DEFAULT_AVERAGE_COUNT):
+        self.average_mode = average_mode
+        self.average_count = average_count
+        self.length = 0
+        self.sweep_count = 0
+        self.latest = None
+        self.average = None
+        self.max_hold = None
+        self.min_hold = None
+        self.reference = None
+        self.delta = None
+        self._scratch = None
+
+    def _allocate(self, length):
+        self.length = length
+        self.latest = np.empty(length, dtype=np.float64)
+        self.average = np.empty(length, dtype=np.float64)
+        self.max_hold = np.empty(length, dtype=np.float64)
+        self.min_hold = np.empty(length, dtype=np.float64)
+        self.delta = np.empty(length, dtype=np.float64)
+        self._scratch = np.empty(length, dtype=np.float64)
+        # A stored reference of a different length is meaningless now.
+        self.reference = None
+        self.sweep_count = 0
+
+    def reset_all(self):
+        self.sweep_count = 0
+
+    def reset_max_hold(self):
+        if self.sweep_count and self.latest is not None:
+            np.copyto(self.max_hold, self.latest)
+
+    def reset_min_hold(self):
+        if self.sweep_count and self.latest is not None:
+            np.copyto(self.min_hold, self.latest)
+
+    def reset_average(self):
+        if self.sweep_count and self.latest is not None:
+            np.copyto(self.average, self.latest)
+            # Restart the linear ramp from the latest sweep.
+            self.sweep_count = 1
+
+    def store_reference(self):
+        """Captures the current average (or the latest sweep before any averaging) as the reference."""
+        if not self.sweep_count:
+            return False
+        if self.reference is None:
+            self.reference = np.empty(self.length, dtype=np.float64)
+        np.copyto(self.reference, self.average)
+        return True
+
+    def clear_reference(self):
+        self.reference = None
+
+    def accumulate(self, new_trace):
+        """
+        Folds one sweep into the buffers. 'new_trace' is a 1-D float array.
+        Returns True when a delta trace is available for this sweep.
+        """
+        if new_trace.shape[0] != self.length:
+            self._allocate(new_trace.shape[0])
+
+        np.copyto(self.latest, new_trace)
+
+        if self.sweep_count == 0:
+            np.copyto(self.average, new_trace)
+            np.copyto(self.max_hold, new_trace)
+            np.copyto(self.min_hold, new_trace)
+            self.sweep_count = 1
+        else:
+            self.sweep_count += 1
+            np.maximum(self.max_hold, new_trace, out=self.max_hold)
+            np.minimum(self.min_hold, new_trace, out=self.min_hold)
+
+            # Linear mode ramps as a true running mean until 'average_count' sweeps,
+            # then settles into an exponential of the same weight (analyzer behaviour).
+            # Exponential mode applies the 1/N weight from the second sweep onward.
+            count = max(1, int(self.average_count))
+            if self.average_mode == AVERAGE_MODE_EXPONENTIAL:
+                weight = 1.0 / count
+            else:
+                weight = 1.0 / min(self.sweep_count, count)
+
+            np.subtract(new_trace, self.average, out=self._scratch)
+            self._scratch *= weight
+            self.average += self._scratch
+
+        if self.reference is not None:
+            np.subtract(self.latest, self.reference, out=self.delta)
+            return True
+        return False
+
+
+class TraceMathPipeline:
+    """
+    Subscribes to the raw trace topics, maintains a TraceBuffers per source and
+    publishes the derived traces on their own topics under DERIVED_TRACE_BASE_TOPIC.
+    Reset / reference / mode controls arrive from the averaging tab under CONTROL_BASE_TOPIC.
+    """
+    def __init__(self, subscriber_router, raw_topic_filter=RAW_TRACE_TOPIC_FILTER,
+                 derived_base_topic=DERIVED_TRACE_BASE_TOPIC, control_base_topic=CONTROL_BASE_TOPIC):
+        self.subscriber_router = subscriber_router
+        self.raw_topic_filter = raw_topic_filter
+        self.derived_base_topic = derived_base_topic
+        self.control_base_topic = control_base_topic
+        self.average_mode = AVERAGE_MODE_LINEAR
+        self.average_count = DEFAULT_AVERAGE_COUNT
+        self.buffers = {} # source_key -> TraceBuffers
+        self._lock = threading.Lock()
+
+        if not NUMPY_AVAILABLE:
+            debug_logger(message="❌ Error: NumPy is required but not available. Trace math pipeline disabled.", **_get_log_args())
+            return
+
+        self.subscriber_router.subscribe_to_topic(self.raw_topic_filter, self._on_raw_trace)
+        self.subscriber_router.subscribe_to_topic(f"{self.control_base_topic}/+/trigger", self._on_control_trigger)
+        # The averaging tab's own widgets subscribe to the exact setting topics, and the router keeps
+        # one callback per filter, so the pipeline listens on a wildcard that cannot collide with them.
+        self.subscriber_router.subscribe_to_topic(f"{self.control_base_topic}/+", self._on_control_setting)
+
+        debug_logger(message=f"✅ TraceMathPipeline listening on '{self.raw_topic_filter}'. The Averager is warming up!", **_get_log_args())
+
+    # --- Parsing ---
+
+    @staticmethod
+    def _source_key_from_topic(topic):
+        """OPEN-AIR/yak/Trace/N9340B/Get_Trace_1/.../Outputs/trace_data/value -> 'Trace/N9340B/Get_Trace_1/...'"""
+        parts = topic.split(TOPIC_DELIMITER)
+        try:
+            outputs_index = parts.index("Outputs")
+        except ValueError:
+            outputs_index = len(parts)
+        return TOPIC_DELIMITER.join(parts[2:outputs_index])
+
+    @staticmethod
+    def _parse_trace_payload(payload):
+        """
+        Accepts a shared-memory ring notification, the raw SCPI response ('-80.1,-79.5,...'),
+        a JSON list, or a widget-style JSON object carrying the trace in 'val'.
+        Returns a 1-D float64 array, or None when the payload is not a trace.
+        """
+        return decode_trace_payload(payload)
+
+    @staticmethod
+    def _control_value(payload):
+        if isinstance(payload, MqttMessage):
+            payload = payload.json if payload.looks_like_json else payload.text
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        try:
+            data = orjson.loads(payload) if isinstance(payload, str) else payload
+        except orjson.JSONDecodeError:
+            return payload
+        return data.get("val") if isinstance(data, dict) else data
+
+    # --- Data Path ---
+
+    @receives_mqtt_message
+    def _on_raw_trace(self, topic, payload):
+        try:
+            new_trace = self._parse_trace_payload(payload)
+        except (ValueError, orjson.JSONDecodeError) as e:
+            debug_logger(message=f"❌ Could not parse trace payload on '{topic}': {e}", **_get_log_args())
+            return
+        if new_trace is None:
+            return
+
+        source_key = self._source_key_from_topic(topic)
+        with self._lock:
+            trace_buffers = self.buffers.get(source_key)
+            if trace_buffers is None:
+                trace_buffers = TraceBuffers(self.average_mode, self.average_count)
+                self.buffers[source_key] = trace_buffers
+            has_delta = trace_buffers.accumulate(new_trace)
+            self._publish_derived(source_key, trace_buffers, has_delta)
+
+        if app_constants.global_settings['debug_enabled']:
+            debug_logger(
+                message=f"📈 Folded sweep #{trace_buffers.sweep_count} ({trace_buffers.length} pts) into '{source_key}'.",
+                **_get_log_args()
+            )
+
+    def _publish_derived(self, source_key, trace_buffers, has_delta):
+        ts = time.time()
+        derived = [
+            (DERIVED_AVERAGE, trace_buffers.average),
+            (DERIVED_MAX_HOLD, trace_buffers.max_hold),
+            (DERIVED_MIN_HOLD, trace_buffers.min_hold),
+        ]
+        if has_delta:
+            derived.append((DERIVED_DELTA, trace_buffers.delta))
+
+        for name, values in derived:
+            topic = TOPIC_DELIMITER.join([self.derived_base_topic, source_key, name])
+            payload = {
+                "val": values,
+                "sweeps": trace_buffers.sweep_count,
+                "mode": trace_buffers.average_mode,
+                "ts": ts
+            }
+            publish_payload(topic, orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), retain=False)
+
+    # --- Control Path ---
+
+    @receives_mqtt_message
+    def _on_control_trigger(self, topic, payload):
+        """Actuators publish True on press and False on release; act on the press only."""
+        value = self._control_value(payload)
+        if value is not True and str(value).lower() not in ("true", "1"):
+            return
+
+        command = topic.split(TOPIC_DELIMITER)[-2]
+        with self._lock:
+            for source_key, trace_buffers in self.buffers.items():
+                if command == "Reset_All":
+                    trace_buffers.reset_all()
+                elif command == "Reset_Average":
+                    trace_buffers.reset_average()
+                elif command == "Reset_Max_Hold":
+                    trace_buffers.reset_max_hold()
+                elif command == "Reset_Min_Hold":
+                    trace_buffers.reset_min_hold()
+                elif command == "Store_Reference":
+                    trace_buffers.store_reference()
+                elif command == "Clear_Reference":
+                    trace_buffers.clear_reference()
+                else:
+                    debug_logger(message=f"❓ Unknown trace math command '{command}'. Ignoring.", **_get_log_args())
+                    return
+
+        debug_logger(message=f"🔁 Trace math command '{command}' applied to {len(self.buffers)} trace(s).", **_get_log_args())
+
+    @receives_mqtt_message
+    def _on_control_setting(self, topic, payload):
+        """Routes .../Trace_Math/<setting> to its handler by the last topic segment."""
+        setting = topic.rsplit(TOPIC_DELIMITER, 1)[-1]
+        if setting == "Average_Mode":
+            self._on_average_mode(topic, payload)
+        elif setting == "Average_Count":
+            self._on_average_count(topic, payload)
+
+    @receives_mqtt_message
+    def _on_average_mode(self, topic, payload):
+        value = str(self._control_value(payload)).lower()
+        if value not in (AVERAGE_MODE_LINEAR, AVERAGE_MODE_EXPONENTIAL):
+            debug_logger(message=f"❓ Unknown average mode '{value}'. Ignoring.", **_get_log_args())
+            return
+        with self._lock:
+            self.average_mode = value
+            for trace_buffers in self.buffers.values():
+                trace_buffers.average_mode = value
+        debug_logger(message=f"🔧 Trace average mode set to '{value}'.", **_get_log_args())
+
+    @receives_mqtt_message
+    def _on_average_count(self, topic, payload):
+        try:
+            value = int(float(self._control_value(payload)))
+        except (TypeError, ValueError):
+            return
+        if value < 1:
+            return
+        with self._lock:
+            self.average_count = value
+            for trace_buffers in self.buffers.values():
+                trace_buffers.average_count = value
+        debug_logger(message=f"🔧 Trace average count set to {value}.", **_get_log_args())
@@ -0,0 +1,316 @@
+# workers/traces/trace_shared_memory.py
+#
+# Zero-serialization trace transport for processes on the same host.
+#
+# The producer (YakRxManager, usually in the VISA fleet process) writes each sweep
+# into a multiprocessing.shared_memory ring of fixed-size float64 slots and only
+# publishes a small notification on the usual trace topic:
+#
+#     {"shm": {"ring": ..., "host": ..., "slot": 3, "seq": 118, "length": 461}, "ts": ...}
+#
+# Readers (TraceMathPipeline, FluxPlotter) map the ring once and take the sweep
+# straight out of the slot through numpy.ndarray(buffer=...). Each slot carries a
+# sequence number that is odd while the slot is being written (a seqlock), so a
+# reader that was lapped by the writer gets None instead of a torn trace.
+#
+# Across hosts the ring is not reachable. A reader that sees a notification from
+# another host announces itself on REMOTE_READER_TOPIC, and the producer publishes
+# plain MQTT payloads for as long as such announcements keep arriving.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20251230.2300.2
+
+import os
+import time
+import socket
+import atexit
+import threading
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_message import MqttMessage
+
+# --- Graceful Dependency Importing ---
+try:
+    import numpy as np
+    from multiprocessing import shared_memory, resource_tracker
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    np = None
+    SHARED_MEMORY_AVAILABLE = False
+
+current_version = "20251230.2300.2"
+current_version_hash = (20251230 * 2300 * 2)
+
+RING_NAME_PREFIX = "openair_traces"
+RING_MAGIC = 0x4F41545243 # "OATRC"
+DEFAULT_SLOT_COUNT = 16
+DEFAULT_SLOT_POINTS = 65536
+HEADER_FIELDS = 8 # magic, slot_count, slot_points, spare...
+SLOT_FIELDS = 2 # seq, length
+
+REMOTE_READER_TOPIC = "OPEN-AIR/System/Traces/Remote_Reader"
+# How long one remote-reader announcement keeps the producer on plain MQTT payloads.
+REMOTE_READER_HOLD_S = 30.0
+REMOTE_READER_ANNOUNCE_INTERVAL_S = 10.0
+
+HOST_NAME = socket.gethostname()
+
+_owned_rings = set() # Rings created by this process
+
+
+def _ring_layout(slot_count, slot_points):
+    header_bytes = HEADER_FIELDS * 8
+    table_bytes = slot_count * SLOT_FIELDS * 8
+    data_bytes = slot_count * slot_points * 8
+    return header_bytes, table_bytes, header_bytes + table_bytes + data_bytes
+
+
+def _map_ring(shm, slot_count, slot_points):
+    header_bytes, table_bytes, _ = _ring_layout(slot_count, slot_points)
+    header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+    table = np.ndarray((slot_count, SLOT_FIELDS), dtype=np.int64, buffer=shm.buf, offset=header_bytes)
+    data = np.ndarray((slot_count, slot_points), dtype=np.float64, buffer=shm.buf, offset=header_bytes + table_bytes)
+    return header, table, data
+
+
+class TraceRingWriter:
+    """Creates (and owns) a trace ring. Only one process writes to a ring."""
+
+    def __init__(self, name=None, slot_count=DEFAULT_SLOT_COUNT, slot_points=DEFAULT_SLOT_POINTS):
+        self.name = name or f"{RING_NAME_PREFIX}_{os.getpid()}"
+        self.slot_count = slot_count
+        self.slot_points = slot_points
+        _, _, size = _ring_layout(slot_count, slot_points)
+        self.shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        _owned_rings.add(self.name)
+        self.header, self.table, self.data = _map_ring(self.shm, slot_count, slot_points)
+        self.table[:] = 0
+        self.header[:] = 0
+        self.header[1] = slot_count
+        self.header[2] = slot_points
+        self.header[0] = RING_MAGIC # Last, so a reader never sees a half-initialized header
+        self._written = 0
+
+    def write(self, values):
+        """Copies one sweep into the next slot. Returns (slot, seq), or None if it does not fit."""
+        length = values.shape[0]
+        if length > self.slot_points:
+            return None
+        slot = self._written % self.slot_count
+        seq = 2 * (self._written + 1)
+        self.table[slot, 0] = seq - 1 # Odd: being written
+        self.data[slot, :length] = values
+        self.table[slot, 1] = length
+        self.table[slot, 0] = seq
+        self._written += 1
+        return slot, seq
+
+    def close(self):
+        self.header = self.table = self.data = None
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+        _owned_rings.discard(self.name)
+
+
+class TraceRingReader:
+    """Maps an existing trace ring read-only by convention."""
+
+    def __init__(self, name):
+        self.name = name
+        self.shm = shared_memory.SharedMemory(name=name)
+        # Attaching registers the segment with this process's resource tracker, which
+        # would unlink it at our exit; the writer owns its lifetime.
+        if name not in _owned_rings:
+            try:
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+            except Exception:
+                pass
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        if header[0] != RING_MAGIC:
+            self.shm.close()
+            raise ValueError(f"'{name}' is not a trace ring")
+        self.slot_count = int(header[1])
+        self.slot_points = int(header[2])
+        _, self.table, self.data = _map_ring(self.shm, self.slot_count, self.slot_points)
+
+    def view(self, slot, seq):
+        """The slot's sweep as a view into shared memory, or None if it no longer holds 'seq'.
+        Call is_current() after using the view to rule out a concurrent overwrite."""
+        if not 0 <= slot < self.slot_count or self.table[slot, 0] != seq:
+            return None
+        return self.data[slot, :int(self.table[slot, 1])]
+
+    def is_current(self, slot, seq):
+        return self.table[slot, 0] == seq
+
+    def read(self, slot, seq, out=None):
+        """Copies the slot's sweep out of the ring. Returns None if it was overwritten meanwhile."""
+        values = self.view(slot, seq)
+        if values is None:
+            return None
+        if out is None or out.shape != values.shape:
+            out = np.empty(values.shape, dtype=np.float64)
+        np.copyto(out, values)
+        return out if self.is_current(slot, seq) else None
+
+
+class SharedTracePublisher:
+    """Producer side: publishes sweeps through a TraceRingWriter, or inline when a remote reader is listening."""
+
+    def __init__(self, mqtt_connection_manager, subscriber_router):
+        self.mqtt_util = mqtt_connection_manager
+        self._writer = None
+        self._lock = threading.Lock()
+        self._remote_reader_until = 0.0
+        # Topics whose broker-retained value is known not to be a (stale) inline trace.
+        self._retained_cleared = set()
+        subscriber_router.subscribe_to_topic(REMOTE_READER_TOPIC, self._on_remote_reader)
+
+    def publish(self, topic, raw_value, retain=True):
+        """Publishes one raw SCPI trace response ('-80.1,-79.5,...') on 'topic'."""
+        values = None
+        if time.monotonic() >= self._remote_reader_until:
+            try:
+                values = np.fromstring(raw_value, dtype=np.float64, sep=",")
+            except ValueError:
+                values = None # Not a plain CSV sweep; published inline below
+
+        written = None
+        if values is not None and values.size:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = TraceRingWriter()
+                    atexit.register(self.close)
+                    debug_logger(message=f"🧠 Trace ring '{self._writer.name}' created ({self._writer.slot_count} x {self._writer.slot_points} pts).", **_get_log_args())
+                written = self._writer.write(values)
+
+        client = self.mqtt_util.get_client_instance()
+        if written is None:
+            client.publish(topic=topic, payload=raw_value, qos=0, retain=retain)
+            if retain:
+                self._retained_cleared.discard(topic)
+            return
+
+        if topic not in self._retained_cleared:
+            # The last inline trace would otherwise stay retained and greet every new
+            # subscriber long after the ring took over; an empty retained publish clears it.
+            client.publish(topic=topic, payload=b"", qos=0, retain=True)
+            self._retained_cleared.add(topic)
+
+        slot, seq = written
+        notification = {
+            "shm": {"ring": self._writer.name, "host": HOST_NAME, "slot": slot, "seq": seq, "length": int(values.size)},
+            "ts": time.time(),
+        }
+        # Not retained: a stored notification would outlive the slot it points at.
+        client.publish(topic=topic, payload=orjson.dumps(notification), qos=0, retain=False)
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def _on_remote_reader(self, topic, payload):
+        self._remote_reader_until = time.monotonic() + REMOTE_READER_HOLD_S
+        debug_logger(message=f"🌐 Remote trace reader announced ({payload}). Publishing inline traces.", **_get_log_args())
+
+
+# --- Reader side ---
+
+_readers = {} # ring name -> TraceRingReader
+_readers_lock = threading.Lock()
+_remote_producer_seen = False
+_last_announcement = 0.0
+
+
+def read_notification(notification, out=None):
+    """Resolves a {"ring", "host", "slot", "seq", ...} notification to a float64 array, or None."""
+    if not SHARED_MEMORY_AVAILABLE:
+        return None
+    if notification.get("host") != HOST_NAME:
+        _note_remote_producer()
+        return None
+
+    name = notification.get("ring")
+    with _readers_lock:
+        reader = _readers.get(name)
+        if reader is None:
+            try:
+                reader = TraceRingReader(name)
+            except (FileNotFoundError, ValueError) as e:
+                debug_logger(message=f"❌ Could not attach to trace ring '{name}': {e}", **_get_log_args())
+                return None
+            _readers[name] = reader
+    return reader.read(int(notification.get("slot", -1)), int(notification.get("seq", -1)), out=out)
+
+
+def decode_trace_payload(payload):
+    """
+    Accepts an MqttMessage or its text: a ring notification, the raw SCPI response ('-80.1,-79.5,...'), a JSON
+    list, or a widget-style JSON object carrying the trace in 'val'.
+    Returns a 1-D float64 array, or None when the payload is not a (readable) trace.
+    """
+    if isinstance(payload, MqttMessage):
+        payload = payload.json if payload.looks_like_json else payload.text
+
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+
+    if isinstance(payload, str):
+        stripped = payload.strip()
+        if not stripped:
+            return None
+        if stripped[0] in "{[":
+            try:
+                payload = orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                return None
+        else:
+            if _remote_producer_seen:
+                _note_remote_producer()
+            try:
+                values = np.fromstring(stripped, dtype=np.float64, sep=",")
+            except ValueError:
+                return None
+            return values if values.size else None
+
+    if isinstance(payload, dict):
+        if "shm" in payload:
+            return read_notification(payload["shm"])
+        return decode_trace_payload(payload.get("val"))
+
+    if isinstance(payload, (list, tuple)):
+        values = np.asarray(payload, dtype=np.float64)
+        return values if values.ndim == 1 and values.size else None
+
+    return None
+
+
+def _note_remote_producer():
+    """Keeps a producer on another host publishing inline traces while we are listening."""
+    global _remote_producer_seen, _last_announcement
+    _remote_producer_seen = True
+    now = time.monotonic()
+    if now - _last_announcement < REMOTE_READER_ANNOUNCE_INTERVAL_S:
+        return
+    _last_announcement = now
+    try:
+        from workers.mqtt import mqtt_publisher_service
+        mqtt_publisher_service.publish_payload(REMOTE_READER_TOPIC, orjson.dumps({"host": HOST_NAME, "pid": os.getpid()}), retain=False)
+    except Exception as e:
+        debug_logger(message=f"❌ Could not announce this remote trace reader: {e}", **_get_log_args())
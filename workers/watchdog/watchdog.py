@@ -2,27 +2,96 @@
 #
 # A temporal monitor to detect if the Main Thread has frozen.
 #
+# A Tk 'after' probe re-arms itself every PROBE_INTERVAL_MS on the main thread and
+# records how late each firing was into a lag histogram. A background thread
+# watches the probe: when it has not fired for STALL_THRESHOLD_MS past its due
+# time, the main thread is blocked, and the background thread samples the main
+# thread's stack (sys._current_frames) until the probe fires again. The finished
+# stall report (duration, de-duplicated stack samples, lag histogram) is written to
+# DATA/debug and published to MQTT, so the blocking widget or callback can be found.
+#
+# The background thread never calls into Tk.
+#
 # Author: Anthony Peter Kuzub
-# Version: 20250821.200641.1
+# Version: 20251230.1900.1
 
+import os
+import sys
 import threading
 import time
-import sys
+import traceback
+from collections import Counter
+from datetime import datetime
+import orjson
 from workers.logger.log_utils import _get_log_args
+from workers.setup.worker_project_paths import DEBUG_DIR
+
+current_version = "20251230.1900.1"
+current_version_hash = (20251230 * 1900 * 1)
 
 # Global flag to kill the watchdog when app closes
 WATCHDOG_RUNNING = True
 
+PROBE_INTERVAL_MS = 100
+# Probe lateness that counts as a stall.
+STALL_THRESHOLD_MS = 250
+# How often the background thread checks the probe, and samples the stack during a stall.
+SAMPLE_INTERVAL_S = 0.05
+MAX_STACK_SAMPLES = 200
+MAX_STACK_DEPTH = 40
+# Upper bucket edges (ms) of the lag histogram; the last bucket is open-ended.
+LAG_BUCKET_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 2000, 5000)
+LAG_PUBLISH_INTERVAL_S = 10.0
+
+STALL_TOPIC = "OPEN-AIR/System/Watchdog/Stall"
+LAG_TOPIC = "OPEN-AIR/System/Watchdog/Lag"
+
+
+class _ProbeState:
+    """State shared between the Tk probe (main thread) and the watchdog thread."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.attached = False
+        self.last_fire = None # perf_counter of the last probe firing
+        self.bucket_counts = [0] * (len(LAG_BUCKET_EDGES_MS) + 1)
+        self.max_lag_ms = 0.0
+        self.total_lag_ms = 0.0
+        self.samples = 0
+        self.stall_count = 0
+
+    def record(self, lag_ms):
+        bucket = next((i for i, edge in enumerate(LAG_BUCKET_EDGES_MS) if lag_ms <= edge), len(LAG_BUCKET_EDGES_MS))
+        with self.lock:
+            self.bucket_counts[bucket] += 1
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            self.total_lag_ms += lag_ms
+            self.samples += 1
+
+    def snapshot(self):
+        with self.lock:
+            labels = [f"<={edge}ms" for edge in LAG_BUCKET_EDGES_MS] + [f">{LAG_BUCKET_EDGES_MS[-1]}ms"]
+            return {
+                "histogram": dict(zip(labels, self.bucket_counts)),
+                "samples": self.samples,
+                "mean_lag_ms": round(self.total_lag_ms / self.samples, 3) if self.samples else 0.0,
+                "max_lag_ms": round(self.max_lag_ms, 3),
+                "stalls": self.stall_count,
+            }
+
+
+_probe = _ProbeState()
+
+
 def start_heartbeat(debug_logger_func=None, app_constants_instance=None):
     """
-    Starts a background thread that prints a heartbeat.
-    If the GUI freezes, this thread SHOULD keep printing to the system console (terminal),
-    proving that the Python process is alive, but the GUI is stuck.
+    Starts the background watchdog thread. Stalls are only detected once
+    attach_tk_probe() has been called with the Tk root.
     """
     global WATCHDOG_RUNNING
     WATCHDOG_RUNNING = True
-    
-    thread = threading.Thread(target=_heartbeat_loop, args=(debug_logger_func, app_constants_instance), daemon=True)
+
+    thread = threading.Thread(target=_heartbeat_loop, args=(debug_logger_func, app_constants_instance), name="Watchdog", daemon=True)
     thread.start()
     if app_constants_instance and app_constants_instance.global_settings['debug_to_terminal']:
         print("🐕 Watchdog: Heartbeat thread started.")
@@ -31,24 +100,110 @@ def stop_heartbeat():
     global WATCHDOG_RUNNING
     WATCHDOG_RUNNING = False
 
+def attach_tk_probe(root):
+    """Starts the event-loop latency probe on 'root'. Call from the main (Tk) thread."""
+    def probe(due):
+        now = time.perf_counter()
+        _probe.record(max(0.0, (now - due) * 1000.0))
+        with _probe.lock:
+            _probe.last_fire = now
+        if WATCHDOG_RUNNING:
+            try:
+                root.after(PROBE_INTERVAL_MS, probe, time.perf_counter() + PROBE_INTERVAL_MS / 1000.0)
+            except Exception:
+                pass # The root was destroyed
+
+    with _probe.lock:
+        _probe.attached = True
+        _probe.last_fire = time.perf_counter()
+    root.after(PROBE_INTERVAL_MS, probe, time.perf_counter() + PROBE_INTERVAL_MS / 1000.0)
+
+def get_lag_stats():
+    """The main-thread lag histogram and counters collected so far."""
+    return _probe.snapshot()
+
+def _sample_main_stack(main_thread_id):
+    frame = sys._current_frames().get(main_thread_id)
+    if frame is None:
+        return None
+    stack = traceback.extract_stack(frame)[-MAX_STACK_DEPTH:]
+    return tuple(f"{os.path.basename(entry.filename)}:{entry.lineno} {entry.name} | {entry.line or ''}".rstrip(" |") for entry in stack)
+
 def _heartbeat_loop(logger_func, app_constants_instance):
     """
     The actual loop running in the background dimension.
     """
-    counter = 0
+    main_thread_id = threading.main_thread().ident
+    stall_started = None # (wall clock, last probe firing seen before the stall)
+    stall_samples = Counter()
+    last_lag_publish = time.perf_counter()
+
     while WATCHDOG_RUNNING:
-        time.sleep(2.0) # Check every 2 seconds
-        counter += 1
-        
-        # Message to the System Console (Terminal) - unlikely to freeze
-        if app_constants_instance and app_constants_instance.global_settings['debug_to_terminal']:
-            sys.stdout.write(f"\r🐕 [Watchdog] Tick {counter}: System Alive.")
-            sys.stdout.flush()
-        
-        # Message to the GUI/Logger - WILL freeze if GUI is blocked
-        if logger_func:
-            try:
-                # We use a try block because if the GUI is truly dead, this might fail
-                logger_func(f"💓 System Heartbeat: {counter}")
-            except:
-                sys.stdout.write(f"\n❌ [Watchdog] GUI Interaction Failed! Main Thread is BLOCKED!\n")
\ No newline at end of file
+        time.sleep(SAMPLE_INTERVAL_S)
+        now = time.perf_counter()
+        with _probe.lock:
+            attached, last_fire = _probe.attached, _probe.last_fire
+        if not attached:
+            continue
+
+        overdue_ms = (now - last_fire) * 1000.0 - PROBE_INTERVAL_MS
+        if stall_started is None and overdue_ms > STALL_THRESHOLD_MS:
+            stall_started = (datetime.now(), last_fire)
+            stall_samples.clear()
+            _terminal(app_constants_instance, f"\n⚠️ [Watchdog] Main thread blocked for {overdue_ms:.0f} ms, sampling its stack...\n")
+
+        if stall_started is not None:
+            if last_fire != stall_started[1]:
+                _finish_stall(stall_started, stall_samples, last_fire, app_constants_instance)
+                stall_started = None
+            elif sum(stall_samples.values()) < MAX_STACK_SAMPLES:
+                stack = _sample_main_stack(main_thread_id)
+                if stack:
+                    stall_samples[stack] += 1
+
+        if now - last_lag_publish >= LAG_PUBLISH_INTERVAL_S:
+            last_lag_publish = now
+            _publish(LAG_TOPIC, get_lag_stats())
+
+def _finish_stall(stall_started, stall_samples, resumed_at, app_constants_instance):
+    started_wall, last_fire_before = stall_started
+    duration_ms = (resumed_at - last_fire_before) * 1000.0 - PROBE_INTERVAL_MS
+    with _probe.lock:
+        _probe.stall_count += 1
+
+    stacks = [{"count": count, "stack": list(stack)} for stack, count in stall_samples.most_common()]
+    report = {
+        "started": started_wall.isoformat(timespec="milliseconds"),
+        "duration_ms": round(duration_ms, 1),
+        "threshold_ms": STALL_THRESHOLD_MS,
+        "samples": sum(stall_samples.values()),
+        # The innermost frame seen most often is usually the blocking callback.
+        "top_frame": stacks[0]["stack"][-1] if stacks else None,
+        "stacks": stacks,
+        "lag": get_lag_stats(),
+    }
+
+    try:
+        os.makedirs(DEBUG_DIR, exist_ok=True)
+        path = os.path.join(DEBUG_DIR, f"stall_{started_wall.strftime('%Y%m%d_%H%M%S_%f')}.json")
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    except OSError as e:
+        path = None
+        _terminal(app_constants_instance, f"\n❌ [Watchdog] Could not write stall report: {e}\n")
+
+    _publish(STALL_TOPIC, report)
+    _terminal(app_constants_instance, f"\n🐕 [Watchdog] Main thread stalled {duration_ms:.0f} ms at {report['top_frame']} (report: {path})\n")
+
+def _publish(topic, payload):
+    try:
+        from workers.mqtt import mqtt_publisher_service
+        if mqtt_publisher_service.is_connected():
+            mqtt_publisher_service.publish_payload(topic, orjson.dumps(payload), retain=False)
+    except Exception as e:
+        sys.stdout.write(f"\n❌ [Watchdog] Could not publish to {topic}: {e}\n")
+
+def _terminal(app_constants_instance, message):
+    if app_constants_instance and app_constants_instance.global_settings['debug_to_terminal']:
+        sys.stdout.write(message)
+        sys.stdout.flush()